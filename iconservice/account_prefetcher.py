@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import Future
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Dict
+
+from iconcommons.logger import Logger
+
+from .base.address import Address
+from .deploy.storage import Storage as DeployStorage
+from .icx.coin_part import CoinPart
+from .icx.delegation_part import DelegationPart
+from .icx.stake_part import StakePart
+
+if TYPE_CHECKING:
+    from .database.db import KeyValueDatabase, KeyValueDatabaseSnapshot
+
+_TAG = "PREFETCH"
+
+
+class AccountPrefetcher(object):
+    """Reads the states of the accounts in a block on a helper thread before its transactions are invoked
+
+    The values are read from a snapshot of state_db into its read cache,
+    so the transactions find them in the cache instead of reading LevelDB one by one.
+    The read cache drops them if state_db is written before they are read, so they are never stale.
+    """
+
+    def __init__(self, db: 'KeyValueDatabase'):
+        self._db = db
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix=_TAG)
+
+    def start(self, tx_requests: list) -> Optional[Future]:
+        """Starts to read the states of the addresses in given transactions
+
+        It MUST be called on the thread which writes data to state_db
+
+        :param tx_requests: transactions in a block
+        :return: future which is done when the states have been read. None if there is nothing to read
+        """
+        keys: List[bytes] = self.make_keys(tx_requests)
+        if not keys:
+            return None
+
+        snapshot: 'KeyValueDatabaseSnapshot' = self._db.get_snapshot()
+        try:
+            return self._executor.submit(self._prefetch, snapshot, keys)
+        except BaseException:
+            snapshot.close()
+            raise
+
+    @staticmethod
+    def _prefetch(snapshot: 'KeyValueDatabaseSnapshot', keys: List[bytes]):
+        """Reads the values into the read cache and closes the snapshot
+
+        The snapshot is closed here, not when the worker thread drops it,
+        so that it is never released after state_db is closed.
+        """
+        try:
+            snapshot.multi_get(keys)
+        finally:
+            snapshot.close()
+
+    @staticmethod
+    def wait(future: Optional[Future]):
+        """Waits until the states have been read
+
+        :param future: returned by start()
+        """
+        if future is None:
+            return
+
+        try:
+            future.result()
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to prefetch accounts: {e}")
+
+    @staticmethod
+    def make_keys(tx_requests: list) -> List[bytes]:
+        """Returns the keys of the account parts and deploy infos of the addresses in given transactions
+
+        :param tx_requests: transactions in a block
+        :return: keys in the order of the addresses first appear
+        """
+        addresses: Dict['Address', None] = {}
+        for tx_request in tx_requests:
+            params: dict = tx_request.get("params", {})
+            for name in ("from", "to"):
+                address = params.get(name)
+                if isinstance(address, Address):
+                    addresses[address] = None
+
+        keys: List[bytes] = []
+        for address in addresses:
+            keys.append(CoinPart.make_key(address))
+            keys.append(StakePart.make_key(address))
+            keys.append(DelegationPart.make_key(address))
+            if address.is_contract:
+                keys.append(DeployStorage.make_deploy_info_key(address))
+
+        return keys
+
+    def close(self):
+        """Waits for the running prefetch, which closes its snapshot, and stops the helper thread
+
+        It MUST be called before state_db is closed
+        """
+        self._executor.shutdown(wait=True)
@@ -188,3 +188,12 @@ class IconScoreException(IconServiceBaseException):
         elif code > ExceptionCode.END:
             code = ExceptionCode.END
         super().__init__(message, code)
+
+
+class InactiveScoreError(AttributeError):
+    """Raised on calling a method of an inactive SCORE
+
+    It is not an IconServiceBaseException and derives from AttributeError on purpose:
+    the failure is recorded in transaction results as SYSTEM_ERROR with str(e),
+    just as the AttributeError raised when the method was looked up on None.
+    """
@@ -16,7 +16,7 @@
 
 import inspect
 from copy import deepcopy
-from typing import Union, Any, get_type_hints
+from typing import Union, Any, Callable, Dict, Optional, get_type_hints
 
 from .address import Address, MalformedAddress, is_icon_address_valid
 from .exception import InvalidParamsException
@@ -28,139 +28,234 @@ from ..utils import get_main_type_from_annotations_type
 score_base_support_type = (int, str, bytes, bool, Address)
 
 
+# Converts params with a template compiled by TypeConverter
+Converter = Callable[[Any], Any]
+
+
+def _copy_unconverted(value: Any) -> Any:
+    """Returns a copy of the value left unconverted if it is a container
+
+    SCORE parameters (ValueType.LATER) are filled with their default values while being invoked,
+    so they must not be shared with the raw request.
+    """
+    if isinstance(value, (dict, list)):
+        return deepcopy(value)
+    return value
+
+
 class TypeConverter:
+    # ParamType: converter compiled from type_convert_templates[ParamType]
+    _converters: Dict[ParamType, Converter] = {}
+
     @staticmethod
     def convert(params: Union[list, dict], param_type: ParamType) -> Any:
+        """Converts params with the template of param_type
+
+        Each template is compiled to a converter on its first use.
+        The input is never changed and shares no container with the output
+        as the values left unconverted (e.g. ValueType.LATER) are copied.
+        params is returned as it is if param_type is None.
+        """
         if param_type is None:
             return params
 
-        copied_params = deepcopy(params)  # to avoid corrupting original data
-        converted_params = TypeConverter._convert(copied_params, type_convert_templates[param_type])
-        return converted_params
+        converter: Optional[Converter] = TypeConverter._converters.get(param_type)
+        if converter is None:
+            converter = TypeConverter._compile(type_convert_templates[param_type])
+            TypeConverter._converters[param_type] = converter
+
+        return converter(params)
 
     @staticmethod
-    def _convert(params: Union[str, list, dict, None], template: Union[list, dict, ValueType]) -> Any:
-        if TypeConverter._skip_params(params, template):
-            return params
+    def _compile(template: Union[list, dict, ValueType, None]) -> Converter:
+        """Returns a converter which is equivalent to walking params with a given template
+        None value is not allowed anywhere in the converted params
 
-        if isinstance(template, dict) and KEY_CONVERTER in template:
-            params = TypeConverter._convert_key(params, template[KEY_CONVERTER])
+        :param template: type convert template
+        :return: converter
+        """
+        none_value_message = f'TypeConvert Exception None value, template: {str(template)}'
+
+        def convert_nothing(params):
+            if params is None:
+                raise InvalidParamsException(none_value_message)
+            return _copy_unconverted(params)
+
+        if not template:
+            return convert_nothing
+        if isinstance(template, dict):
+            return TypeConverter._compile_dict(template, none_value_message)
+        if isinstance(template, list):
+            return TypeConverter._compile_list(template, none_value_message)
+        if isinstance(template, ValueType):
+            convert_value: Converter = TypeConverter._compile_value(template)
+
+            def convert(params):
+                if params is None:
+                    raise InvalidParamsException(none_value_message)
+                if not params and not isinstance(params, str):
+                    return _copy_unconverted(params)
+                return convert_value(params)
+
+            return convert
+
+        return convert_nothing
+
+    @staticmethod
+    def _compile_dict(template: dict, none_value_message: str) -> Converter:
+        key_converter: Optional[dict] = template.get(KEY_CONVERTER)
+        converters: Dict[str, Converter] = {}
+        # key: converter which refers to the values converted before the key
+        switch_converters: Dict[str, Callable[[Any, dict], Any]] = {}
+
+        for key, value_template in template.items():
+            if isinstance(value_template, dict) and CONVERT_USING_SWITCH_KEY in value_template:
+                switch_converters[key] = TypeConverter._compile_switch(value_template[CONVERT_USING_SWITCH_KEY])
+            else:
+                converters[key] = TypeConverter._compile(value_template)
+
+        convert_unknown: Converter = TypeConverter._compile(None)
+
+        def convert(params):
+            if params is None:
+                raise InvalidParamsException(none_value_message)
+            if not params and not isinstance(params, str):
+                return _copy_unconverted(params)
+
+            if key_converter is not None:
+                params = TypeConverter._convert_key(params, key_converter)
+            if not isinstance(params, dict):
+                return _copy_unconverted(params)
 
-        if isinstance(params, dict) and isinstance(template, dict):
             new_params = {}
             for key, value in params.items():
-                if TypeConverter._check_convert_using_method(key, template):
-                    ref_key_table = deepcopy(new_params)
-                    target_template = TypeConverter._get_convert_using_method_template(key, template)
-                    new_value = TypeConverter._convert_using_switch(value, ref_key_table, target_template)
+                convert_using_switch = switch_converters.get(key)
+                if convert_using_switch is None:
+                    new_params[key] = converters.get(key, convert_unknown)(value)
                 else:
-                    new_value = TypeConverter._convert(value, template.get(key))
-                new_params[key] = new_value
-        elif isinstance(params, list) and isinstance(template, list):
+                    new_params[key] = convert_using_switch(value, new_params)
+
+            return new_params
+
+        return convert
+
+    @staticmethod
+    def _compile_list(template: list, none_value_message: str) -> Converter:
+        item_template = template[0]
+        convert_item: Converter = TypeConverter._compile(item_template)
+        try:
+            element_converters = [TypeConverter._compile(element_template) for element_template in item_template]
+        except TypeError:
+            # zip() raises TypeError on a nested list item as the template is not iterable
+            element_converters = item_template
+
+        def convert(params):
+            if params is None:
+                raise InvalidParamsException(none_value_message)
+            if not isinstance(params, list):
+                return _copy_unconverted(params)
+
             new_params = []
             for item in params:
                 if isinstance(item, list):
-                    new_item = []
-                    for element, templete_type in zip(item, template[0]):
-                        new_element = TypeConverter._convert(element, templete_type)
-                        new_item.append(new_element)
-                    new_params.append(new_item)
+                    new_params.append(
+                        [convert_element(element) for element, convert_element in zip(item, element_converters)])
                 else:
-                    new_item = TypeConverter._convert(item, template[0])
-                    new_params.append(new_item)
-        elif isinstance(template, ValueType):
-            new_params = TypeConverter._convert_value(params, template)
-        else:
-            new_params = params
+                    new_params.append(convert_item(item))
 
-        return new_params
+            return new_params
+
+        return convert
 
     @staticmethod
-    def _convert_key(params, key_convert_dict):
-        new_params = {}
-        for key in params:
-            if key in key_convert_dict:
-                old_key = key
-                new_key = key_convert_dict[old_key]
-                new_params[new_key] = params[old_key]
-            else:
-                new_params[key] = params[key]
+    def _compile_switch(template: dict) -> Callable[[Any, dict], Any]:
+        """Compiles a template whose target template is selected by the value converted before
 
-        return new_params
+        :param template: the template which has SWITCH_KEY and target templates
+        :return: converter which takes the params to convert and the params converted before
+        """
+        none_value_message = f'TypeConvert Exception None value, template: {str(template)}'
 
-    @staticmethod
-    def _check_convert_using_method(param: str, template: dict) -> bool:
-        params = template.get(param)
-        if isinstance(params, dict):
-            return CONVERT_USING_SWITCH_KEY in params
-        return False
+        if not template:
+            convert_nothing: Converter = TypeConverter._compile(None)
+            return lambda params, converted_params: convert_nothing(params)
 
-    @staticmethod
-    def _get_convert_using_method_template(key: str, template: dict) -> dict:
-        tmp_params = template.get(key)
-        return tmp_params.get(CONVERT_USING_SWITCH_KEY)
+        switch_key: Optional[str] = template.get(SWITCH_KEY)
+        target_converters: Dict[Any, Converter] = {
+            key: TypeConverter._compile_switch_target(target_template) for key, target_template in template.items()
+        }
+
+        def convert(params, converted_params: dict):
+            if params is None:
+                raise InvalidParamsException(none_value_message)
+            if not params and not isinstance(params, str):
+                return _copy_unconverted(params)
+
+            convert_target = target_converters.get(converted_params.get(switch_key))
+            if convert_target is None:
+                return _copy_unconverted(params)
+            return convert_target(params)
+
+        return convert
 
     @staticmethod
-    def _skip_params(params: Union[str, dict, None], template: Union[list, dict, ValueType]) -> bool:
-        if params is None:
-            raise InvalidParamsException(f'TypeConvert Exception None value, template: {str(template)}')
-        if isinstance(params, str):
-            if params != "" and not template:
-                return True
-        elif not params or not template:
-            return True
-        return False
-    
-    @staticmethod
-    def _convert_using_switch(params: Union[str, dict, None],
-                              tmp_params: dict,
-                              template: Union[list, dict, ValueType]) -> Any:
-        if TypeConverter._skip_params(params, template):
-            return params
+    def _compile_switch_target(template: Union[list, dict, ValueType, str]) -> Converter:
+        if isinstance(template, dict):
+            converters: Dict[str, Converter] = {key: TypeConverter._compile(value) for key, value in template.items()}
+            convert_unknown: Converter = TypeConverter._compile(None)
 
-        switch_key = template.get(SWITCH_KEY)
-        template_key = tmp_params.get(switch_key)
-        target_template = template.get(template_key)
+            def convert_dict(params):
+                if not isinstance(params, dict):
+                    return _copy_unconverted(params)
+                return {key: converters.get(key, convert_unknown)(value) for key, value in params.items()}
 
-        if isinstance(params, dict) and isinstance(target_template, dict):
-            new_params = {}
-            for key, value in params.items():
-                new_value = TypeConverter._convert(value, target_template.get(key))
-                new_params[key] = new_value
-        elif isinstance(params, list) and isinstance(target_template, list):
-            new_params = []
-            for item in params:
-                new_item = TypeConverter._convert(item, target_template[0])
-                new_params.append(new_item)
-        elif isinstance(target_template, ValueType):
-            new_params = TypeConverter._convert_value(params, target_template)
-        else:
-            new_params = params
+            return convert_dict
 
-        return new_params
+        if isinstance(template, list):
+            convert_item: Converter = TypeConverter._compile(template[0])
+
+            def convert_list(params):
+                if not isinstance(params, list):
+                    return _copy_unconverted(params)
+                return [convert_item(item) for item in params]
+
+            return convert_list
+
+        if isinstance(template, ValueType):
+            return TypeConverter._compile_value(template)
+
+        return _copy_unconverted
 
     @staticmethod
-    def _convert_value(value: Any, value_type: ValueType) -> Any:
+    def _compile_value(value_type: ValueType) -> Converter:
         if value_type == ValueType.INT:
-            converted_value = TypeConverter._convert_value_int(value)
-        elif value_type == ValueType.HEXADECIMAL:
-            converted_value = TypeConverter._convert_value_hexadecimal(value)
-        elif value_type == ValueType.STRING:
-            converted_value = TypeConverter._convert_value_string(value)
-        elif value_type == ValueType.BOOL:
-            converted_value = TypeConverter._convert_value_bool(value)
-        elif value_type == ValueType.ADDRESS:
-            if len(value) == 0:
-                converted_value = None
+            return TypeConverter._convert_value_int
+        if value_type == ValueType.HEXADECIMAL:
+            return TypeConverter._convert_value_hexadecimal
+        if value_type == ValueType.STRING:
+            return TypeConverter._convert_value_string
+        if value_type == ValueType.BOOL:
+            return TypeConverter._convert_value_bool
+        if value_type == ValueType.ADDRESS:
+            return TypeConverter._convert_value_optional_address
+        if value_type == ValueType.ADDRESS_OR_MALFORMED_ADDRESS:
+            return TypeConverter._convert_value_address_or_malformed_address
+        if value_type == ValueType.BYTES:  # hash...(block_hash, tx_hash)
+            return TypeConverter._convert_value_bytes
+        return _copy_unconverted
+
+    @staticmethod
+    def _convert_key(params, key_convert_dict):
+        new_params = {}
+        for key in params:
+            if key in key_convert_dict:
+                old_key = key
+                new_key = key_convert_dict[old_key]
+                new_params[new_key] = params[old_key]
             else:
-                converted_value = TypeConverter._convert_value_address(value)
-        elif value_type == ValueType.ADDRESS_OR_MALFORMED_ADDRESS:
-            converted_value = TypeConverter._convert_value_address_or_malformed_address(value)
-        elif value_type == ValueType.BYTES:  # hash...(block_hash, tx_hash)
-            converted_value = TypeConverter._convert_value_bytes(value)
-        else:
-            converted_value = value
-        return converted_value
+                new_params[key] = params[key]
+
+        return new_params
 
     @staticmethod
     def _convert_value_int(value: str) -> int:
@@ -199,6 +294,12 @@ class TypeConverter:
         else:
             raise InvalidParamsException(f'TypeConvert Exception bool value :{value}, type: {type(value)}')
 
+    @staticmethod
+    def _convert_value_optional_address(value: str) -> Optional['Address']:
+        if len(value) == 0:
+            return None
+        return TypeConverter._convert_value_address(value)
+
     @staticmethod
     def _convert_value_address(value: str) -> 'Address':
         if isinstance(value, str):
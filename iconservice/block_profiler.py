@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Optional, List, Dict
+
+from iconcommons.logger import Logger
+
+from .base.address import Address
+from .utils import bytes_to_hex
+
+if TYPE_CHECKING:
+    from .base.block import Block
+    from .iconscore.icon_score_result import TransactionResult
+
+_TAG = "PROFILER"
+
+
+def _to_us(seconds: float) -> int:
+    return int(seconds * 1_000_000)
+
+
+class PhaseTimer(object):
+    """Measures the time between consecutive laps
+    """
+
+    __slots__ = ("phases", "_last")
+
+    def __init__(self):
+        # phase name: elapsed time in seconds
+        self.phases: Dict[str, float] = {}
+        self._last: float = time.perf_counter()
+
+    def lap(self, name: str):
+        now: float = time.perf_counter()
+        self.phases[name] = now - self._last
+        self._last = now
+
+
+class TxProfile(object):
+    """Statistics of a transaction invoked on the block context
+    """
+
+    __slots__ = ("index", "tx_hash", "to", "method", "elapsed",
+                 "db_gets", "db_get_bytes", "db_puts", "db_put_bytes",
+                 "event_logs", "step_used", "status")
+
+    def __init__(self, index: int, tx_request: dict):
+        params: dict = tx_request["params"]
+        data_type: Optional[str] = params.get("dataType")
+        data = params.get("data")
+
+        self.index: int = index
+        self.tx_hash: Optional[bytes] = params.get("txHash")
+        self.to: Optional['Address'] = params.get("to")
+        if data_type == "call" and isinstance(data, dict):
+            self.method: str = data.get("method", "")
+        else:
+            self.method: str = data_type if data_type else "transfer"
+
+        # in seconds
+        self.elapsed: float = 0.0
+        self.db_gets: int = 0
+        self.db_get_bytes: int = 0
+        self.db_puts: int = 0
+        self.db_put_bytes: int = 0
+        self.event_logs: int = 0
+        self.step_used: int = 0
+        self.status: int = 0
+
+    def on_get(self, value: Optional[bytes]):
+        self.db_gets += 1
+        if value:
+            self.db_get_bytes += len(value)
+
+    def on_put(self, value: Optional[bytes]):
+        self.db_puts += 1
+        if value:
+            self.db_put_bytes += len(value)
+
+    def merge(self, other: 'TxProfile'):
+        """Adds the db accesses of the same transaction executed on a forked context
+
+        :param other: profile of a speculative execution
+        """
+        self.db_gets += other.db_gets
+        self.db_get_bytes += other.db_get_bytes
+        self.db_puts += other.db_puts
+        self.db_put_bytes += other.db_put_bytes
+
+    def set_result(self, tx_result: 'TransactionResult', elapsed: float):
+        self.elapsed = elapsed
+        self.step_used = tx_result.step_used
+        self.status = tx_result.status
+        if tx_result.event_logs:
+            self.event_logs = len(tx_result.event_logs)
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "txHash": self.tx_hash,
+            "to": self.to,
+            "method": self.method,
+            "elapsedUs": _to_us(self.elapsed),
+            "dbGets": self.db_gets,
+            "dbGetBytes": self.db_get_bytes,
+            "dbPuts": self.db_puts,
+            "dbPutBytes": self.db_put_bytes,
+            "eventLogs": self.event_logs,
+            "stepUsed": self.step_used,
+            "status": self.status
+        }
+
+
+class BlockProfile(object):
+    """Statistics of a block collected on invoke and commit
+    """
+
+    def __init__(self, block: 'Block'):
+        self.height: int = block.height
+        self.hash: bytes = block.hash
+        self.txs: List['TxProfile'] = []
+
+        # in seconds
+        self.invoke_elapsed: float = 0.0
+        self.before_tx_process_elapsed: float = 0.0
+        self.after_tx_process_elapsed: float = 0.0
+        self.commit_elapsed: Optional[float] = None
+        self.commit_phases: Dict[str, float] = {}
+
+    def get_score_stats(self) -> Dict[str, Dict[str, dict]]:
+        """Returns the statistics of transactions grouped by the recipient and the method
+
+        :return: {to: {method: {"count": int, "elapsedUs": int, "stepUsed": int}}}
+        """
+        stats = {}
+        for tx in self.txs:
+            methods: dict = stats.setdefault(str(tx.to), {})
+            stat: dict = methods.setdefault(tx.method, {"count": 0, "elapsedUs": 0, "stepUsed": 0})
+            stat["count"] += 1
+            stat["elapsedUs"] += _to_us(tx.elapsed)
+            stat["stepUsed"] += tx.step_used
+
+        return stats
+
+    def to_dict(self) -> dict:
+        txs: List['TxProfile'] = self.txs
+        return {
+            "blockHeight": self.height,
+            "blockHash": self.hash,
+            "txCount": len(txs),
+            "invokeElapsedUs": _to_us(self.invoke_elapsed),
+            "beforeTxProcessElapsedUs": _to_us(self.before_tx_process_elapsed),
+            "afterTxProcessElapsedUs": _to_us(self.after_tx_process_elapsed),
+            "commitElapsedUs": None if self.commit_elapsed is None else _to_us(self.commit_elapsed),
+            "commitPhasesUs": {name: _to_us(elapsed) for name, elapsed in self.commit_phases.items()},
+            "dbGets": sum(tx.db_gets for tx in txs),
+            "dbGetBytes": sum(tx.db_get_bytes for tx in txs),
+            "dbPuts": sum(tx.db_puts for tx in txs),
+            "dbPutBytes": sum(tx.db_put_bytes for tx in txs),
+            "eventLogs": sum(tx.event_logs for tx in txs),
+            "scores": self.get_score_stats(),
+            "txs": [tx.to_dict() for tx in txs]
+        }
+
+
+class BlockProfiler(object):
+    """Keeps the profiles of the last blocks invoked
+
+    The profiles are read by query threads while a block is invoked,
+    so they are shared only after being completed.
+    """
+
+    FILE_NAME = "block_profile.jsonl"
+
+    def __init__(self, max_count: int, dump_dir_path: Optional[str] = None):
+        """Constructor
+
+        :param max_count: the number of block profiles to keep
+        :param dump_dir_path: the directory to write a profile per committed block as a json line
+        """
+        self._max_count: int = max_count
+        # block hash: profile
+        self._profiles: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+        self._dump_path: Optional[str] = None
+        if dump_dir_path is not None:
+            os.makedirs(dump_dir_path, exist_ok=True)
+            self._dump_path = os.path.join(dump_dir_path, self.FILE_NAME)
+
+    def add(self, profile: 'BlockProfile'):
+        """Adds the profile of an invoked block
+
+        :param profile:
+        :return:
+        """
+        with self._lock:
+            profiles: OrderedDict = self._profiles
+            profiles.pop(profile.hash, None)
+            profiles[profile.hash] = profile
+            while len(profiles) > self._max_count:
+                profiles.popitem(last=False)
+
+    def commit(self, instant_block_hash: bytes, block_hash: bytes, elapsed: float, phases: Dict[str, float]):
+        """Records the time to commit a block and dumps its profile
+
+        :param instant_block_hash: the block hash on invoke
+        :param block_hash: the block hash on commit
+        :param elapsed: the time to commit a block in seconds
+        :param phases: the time spent on each phase of commit in seconds
+        :return:
+        """
+        with self._lock:
+            profile: Optional['BlockProfile'] = self._profiles.get(instant_block_hash)
+            if profile is None:
+                return
+
+            profile.commit_elapsed = elapsed
+            profile.commit_phases = phases
+            if instant_block_hash != block_hash:
+                profile.hash = block_hash
+                del self._profiles[instant_block_hash]
+                self._profiles[block_hash] = profile
+
+        if self._dump_path is not None:
+            self._dump(profile)
+
+    def get_profiles(self, count: Optional[int] = None) -> List[dict]:
+        """Returns the profiles of the last blocks, the latest one first
+
+        :param count: the maximum number of profiles to return
+        :return:
+        """
+        with self._lock:
+            profiles: List['BlockProfile'] = list(self._profiles.values())
+
+        profiles.reverse()
+        if count is not None:
+            profiles = profiles[:max(count, 0)]
+
+        return [profile.to_dict() for profile in profiles]
+
+    def _dump(self, profile: 'BlockProfile'):
+        try:
+            with open(self._dump_path, "a") as f:
+                f.write(json.dumps(profile.to_dict(), default=self._json_default))
+                f.write("\n")
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to dump the block profile: {e}")
+
+    @classmethod
+    def _json_default(cls, obj):
+        if isinstance(obj, bytes):
+            return bytes_to_hex(obj)
+        elif isinstance(obj, Address):
+            return str(obj)
+        return obj
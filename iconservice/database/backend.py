@@ -0,0 +1,557 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Storage backends of KeyValueDatabase
+
+A backend has the subset of the plyvel.DB interface used by KeyValueDatabase,
+so plyvel.DB is used as it is for LevelDB.
+"""
+
+import os
+from abc import ABCMeta, abstractmethod
+from bisect import bisect_left, bisect_right
+from threading import Lock
+from typing import Optional, Dict, List, Tuple, Iterator, Iterable
+
+import plyvel
+
+from ..base.exception import DatabaseException
+from ..icon_constant import DBBackend
+
+
+class KeyValueBackend(metaclass=ABCMeta):
+    """Key-value store which KeyValueDatabase reads from and writes to
+
+    Keys are sorted in lexicographical order of bytes.
+    iterator() takes the same keyword arguments as plyvel.DB.iterator()
+    and returns an iterator which can be used as a context manager.
+    """
+
+    @abstractmethod
+    def get(self, key: bytes, default: Optional[bytes] = None) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def put(self, key: bytes, value: bytes):
+        pass
+
+    @abstractmethod
+    def delete(self, key: bytes):
+        pass
+
+    @abstractmethod
+    def write_batch(self, transaction: bool = False) -> 'WriteBatch':
+        pass
+
+    @abstractmethod
+    def iterator(self, **kwargs):
+        pass
+
+    @abstractmethod
+    def snapshot(self):
+        """Returns a read-only view of the current data which has get() and iterator()
+        """
+        pass
+
+    def prefixed_db(self, prefix: bytes) -> 'KeyValueBackend':
+        return PrefixedBackend(self, prefix)
+
+    @abstractmethod
+    def close(self):
+        pass
+
+    @abstractmethod
+    def _apply(self, ops: List[Tuple[bytes, Optional[bytes]]]):
+        """Writes the changes of a batch at once
+
+        :param ops: (key, value) pairs. A key is deleted when its value is None
+        """
+        pass
+
+
+KeyValueBackend.register(plyvel.DB)
+
+
+class WriteBatch(object):
+    """Collects changes and writes them to a backend at once on write() or at the end of a with statement
+    """
+
+    def __init__(self, backend: 'KeyValueBackend', transaction: bool = False):
+        self._backend = backend
+        self._transaction: bool = transaction
+        self._ops: List[Tuple[bytes, Optional[bytes]]] = []
+
+    def put(self, key: bytes, value: bytes):
+        self._ops.append((key, value))
+
+    def delete(self, key: bytes):
+        self._ops.append((key, None))
+
+    def clear(self):
+        self._ops = []
+
+    def write(self):
+        ops = self._ops
+        self._ops = []
+        self._backend._apply(ops)
+
+    def __enter__(self) -> 'WriteBatch':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._transaction and exc_type is not None:
+            # Discards the changes like plyvel does in transaction mode
+            self.clear()
+        else:
+            self.write()
+
+
+class _Iterator(object):
+    """Iterator which can be used as a context manager like plyvel.Iterator
+    """
+
+    def __init__(self, it: Iterator, on_close: Optional[callable] = None):
+        self._it = it
+        self._on_close = on_close
+
+    def __iter__(self) -> '_Iterator':
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            self.close()
+            raise
+
+    def close(self):
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+    def __enter__(self) -> '_Iterator':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _get_prefix_end(prefix: bytes) -> Optional[bytes]:
+    """Returns the smallest key greater than all keys starting with a given prefix
+
+    :return: None if there is no such key
+    """
+    prefix = prefix.rstrip(b"\xff")
+    if not prefix:
+        return None
+
+    return prefix[:-1] + bytes((prefix[-1] + 1,))
+
+
+def _get_range(start: Optional[bytes],
+               stop: Optional[bytes],
+               include_start: bool,
+               include_stop: bool,
+               prefix: Optional[bytes]) -> Tuple[Optional[bytes], bool, Optional[bytes], bool]:
+    """Converts the range arguments of plyvel.DB.iterator() to bounds
+
+    :return: (lower bound, whether it is inclusive, upper bound, whether it is inclusive)
+    """
+    if prefix is not None:
+        if start is not None or stop is not None:
+            raise TypeError("'prefix' cannot be used together with 'start' or 'stop'")
+        return prefix, True, _get_prefix_end(prefix), False
+
+    return start, include_start, stop, include_stop
+
+
+def _make_item(key: bytes, value: bytes, include_key: bool, include_value: bool):
+    if include_key and include_value:
+        return key, value
+    return key if include_key else value
+
+
+class _MemoryReader(object):
+    def __init__(self, data: Dict[bytes, bytes]):
+        self._data: Dict[bytes, bytes] = data
+        self._sorted_keys: Optional[List[bytes]] = None
+
+    def get(self, key: bytes, default: Optional[bytes] = None) -> Optional[bytes]:
+        return self._data.get(key, default)
+
+    def _get_sorted_keys(self) -> List[bytes]:
+        keys: Optional[List[bytes]] = self._sorted_keys
+        if keys is None:
+            keys = sorted(self._data)
+            self._sorted_keys = keys
+        return keys
+
+    def iterator(self,
+                 reverse: bool = False,
+                 start: Optional[bytes] = None,
+                 stop: Optional[bytes] = None,
+                 include_start: bool = True,
+                 include_stop: bool = False,
+                 prefix: Optional[bytes] = None,
+                 include_key: bool = True,
+                 include_value: bool = True) -> '_Iterator':
+        lower, include_lower, upper, include_upper = \
+            _get_range(start, stop, include_start, include_stop, prefix)
+        keys: List[bytes] = self._get_sorted_keys()
+
+        lo: int = 0
+        if lower is not None:
+            lo = bisect_left(keys, lower) if include_lower else bisect_right(keys, lower)
+        hi: int = len(keys)
+        if upper is not None:
+            hi = bisect_right(keys, upper) if include_upper else bisect_left(keys, upper)
+
+        return _Iterator(self._iterate(keys, lo, hi, reverse, include_key, include_value))
+
+    def _iterate(self,
+                 keys: List[bytes],
+                 lo: int,
+                 hi: int,
+                 reverse: bool,
+                 include_key: bool,
+                 include_value: bool) -> Iterator:
+        keys = reversed(keys[lo:hi]) if reverse else keys[lo:hi]
+        for key in keys:
+            # self._data of a backend is replaced when it is changed after a snapshot was taken
+            value: Optional[bytes] = self._data.get(key)
+            # Skips the keys deleted after this iterator was created
+            if value is not None:
+                yield _make_item(key, value, include_key, include_value)
+
+    def close(self):
+        pass
+
+    def release(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class MemoryBackend(_MemoryReader, KeyValueBackend):
+    """Backend which keeps all data in a dict
+
+    Keys are sorted lazily when an iterator is created after some keys were added or removed.
+    The data is lost when it is closed.
+    A snapshot shares the dict, which is copied only once on the first change after snapshots were taken.
+    """
+
+    def __init__(self):
+        super().__init__({})
+        # Guards the changes of the key set and sharing data
+        self._lock = Lock()
+        # Whether snapshots refer to self._data, so it must not be changed in place
+        self._shared = False
+
+    def put(self, key: bytes, value: bytes):
+        with self._lock:
+            self._put(key, value)
+
+    def delete(self, key: bytes):
+        with self._lock:
+            self._delete(key)
+
+    def _put(self, key: bytes, value: bytes):
+        self._unshare()
+        if key not in self._data:
+            self._sorted_keys = None
+        self._data[key] = value
+
+    def _delete(self, key: bytes):
+        if key in self._data:
+            self._unshare()
+            del self._data[key]
+            self._sorted_keys = None
+
+    def _unshare(self):
+        if self._shared:
+            self._data = dict(self._data)
+            self._shared = False
+
+    def _get_sorted_keys(self) -> List[bytes]:
+        with self._lock:
+            return super()._get_sorted_keys()
+
+    def write_batch(self, transaction: bool = False) -> 'WriteBatch':
+        return WriteBatch(self, transaction)
+
+    def _apply(self, ops: List[Tuple[bytes, Optional[bytes]]]):
+        with self._lock:
+            for key, value in ops:
+                if value is None:
+                    self._delete(key)
+                else:
+                    self._put(key, value)
+
+    def snapshot(self) -> '_MemoryReader':
+        with self._lock:
+            snapshot = _MemoryReader(self._data)
+            snapshot._sorted_keys = self._sorted_keys
+            self._shared = True
+        return snapshot
+
+    def close(self):
+        with self._lock:
+            self._data = {}
+            self._sorted_keys = None
+            self._shared = False
+
+
+class LMDBBackend(KeyValueBackend):
+    """Backend on LMDB, a memory-mapped B+tree store
+
+    Every put(), delete() and write batch is committed as a write transaction.
+    A snapshot is a read transaction, which sees the data at the moment when it began.
+    """
+
+    # The maximum size of a database, which is reserved as virtual memory, not allocated
+    MAP_SIZE = 1 << 40
+
+    def __init__(self, path: str, create_if_missing: bool = True, map_size: int = MAP_SIZE):
+        try:
+            import lmdb
+        except ImportError:
+            raise DatabaseException("lmdb is not installed")
+
+        if not create_if_missing and not os.path.exists(path):
+            raise DatabaseException(f"Database not found: {path}")
+
+        self._env = lmdb.open(path, map_size=map_size, create=create_if_missing)
+
+    def get(self, key: bytes, default: Optional[bytes] = None) -> Optional[bytes]:
+        with self._env.begin() as txn:
+            return txn.get(key, default)
+
+    def put(self, key: bytes, value: bytes):
+        with self._env.begin(write=True) as txn:
+            txn.put(key, value)
+
+    def delete(self, key: bytes):
+        with self._env.begin(write=True) as txn:
+            txn.delete(key)
+
+    def write_batch(self, transaction: bool = False) -> 'WriteBatch':
+        return WriteBatch(self, transaction)
+
+    def _apply(self, ops: List[Tuple[bytes, Optional[bytes]]]):
+        with self._env.begin(write=True) as txn:
+            for key, value in ops:
+                if value is None:
+                    txn.delete(key)
+                else:
+                    txn.put(key, value)
+
+    def iterator(self, **kwargs) -> '_Iterator':
+        txn = self._env.begin()
+        return _LMDBSnapshot.iterate(txn, txn.abort, **kwargs)
+
+    def snapshot(self) -> '_LMDBSnapshot':
+        return _LMDBSnapshot(self._env.begin())
+
+    def close(self):
+        self._env.close()
+
+
+class _LMDBSnapshot(object):
+    def __init__(self, txn):
+        self._txn = txn
+
+    def get(self, key: bytes, default: Optional[bytes] = None) -> Optional[bytes]:
+        return self._txn.get(key, default)
+
+    def iterator(self, **kwargs) -> '_Iterator':
+        return self.iterate(self._txn, None, **kwargs)
+
+    @staticmethod
+    def iterate(txn,
+                on_close: Optional[callable],
+                reverse: bool = False,
+                start: Optional[bytes] = None,
+                stop: Optional[bytes] = None,
+                include_start: bool = True,
+                include_stop: bool = False,
+                prefix: Optional[bytes] = None,
+                include_key: bool = True,
+                include_value: bool = True) -> '_Iterator':
+        bounds = _get_range(start, stop, include_start, include_stop, prefix)
+        items: Iterable[Tuple[bytes, bytes]] = _LMDBSnapshot._iterate_cursor(txn.cursor(), reverse, *bounds)
+        return _Iterator((_make_item(key, value, include_key, include_value) for key, value in items), on_close)
+
+    @staticmethod
+    def _iterate_cursor(cursor,
+                        reverse: bool,
+                        lower: Optional[bytes],
+                        include_lower: bool,
+                        upper: Optional[bytes],
+                        include_upper: bool) -> Iterator[Tuple[bytes, bytes]]:
+        if reverse:
+            if upper is None:
+                positioned: bool = cursor.last()
+            elif cursor.set_range(upper):
+                key: bytes = cursor.key()
+                positioned: bool = cursor.prev() if key > upper or not include_upper else True
+            else:
+                positioned: bool = cursor.last()
+
+            while positioned:
+                key, value = cursor.item()
+                if lower is not None and (key < lower or (key == lower and not include_lower)):
+                    break
+                yield key, value
+                positioned = cursor.prev()
+        else:
+            if lower is None:
+                positioned: bool = cursor.first()
+            else:
+                positioned: bool = cursor.set_range(lower)
+                if positioned and not include_lower and cursor.key() == lower:
+                    positioned = cursor.next()
+
+            while positioned:
+                key, value = cursor.item()
+                if upper is not None and (key > upper or (key == upper and not include_upper)):
+                    break
+                yield key, value
+                positioned = cursor.next()
+
+    def close(self):
+        self._txn.abort()
+
+    def release(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class PrefixedBackend(KeyValueBackend):
+    """View of the keys starting with a prefix in another backend, like plyvel.PrefixedDB
+    """
+
+    def __init__(self, db: 'KeyValueBackend', prefix: bytes):
+        self._db = db
+        self._prefix: bytes = prefix
+
+    @property
+    def db(self) -> 'KeyValueBackend':
+        return self._db
+
+    @property
+    def prefix(self) -> bytes:
+        return self._prefix
+
+    def get(self, key: bytes, default: Optional[bytes] = None) -> Optional[bytes]:
+        return self._db.get(self._prefix + key, default)
+
+    def put(self, key: bytes, value: bytes):
+        self._db.put(self._prefix + key, value)
+
+    def delete(self, key: bytes):
+        self._db.delete(self._prefix + key)
+
+    def write_batch(self, transaction: bool = False) -> 'WriteBatch':
+        return WriteBatch(self, transaction)
+
+    def _apply(self, ops: List[Tuple[bytes, Optional[bytes]]]):
+        prefix: bytes = self._prefix
+        self._db._apply([(prefix + key, value) for key, value in ops])
+
+    def iterator(self, **kwargs) -> '_Iterator':
+        return _iterate_prefixed(self._db, self._prefix, **kwargs)
+
+    def snapshot(self) -> '_PrefixedSnapshot':
+        return _PrefixedSnapshot(self._db.snapshot(), self._prefix)
+
+    def prefixed_db(self, prefix: bytes) -> 'PrefixedBackend':
+        return PrefixedBackend(self._db, self._prefix + prefix)
+
+    def close(self):
+        pass
+
+
+class _PrefixedSnapshot(object):
+    def __init__(self, snapshot, prefix: bytes):
+        self._snapshot = snapshot
+        self._prefix: bytes = prefix
+
+    def get(self, key: bytes, default: Optional[bytes] = None) -> Optional[bytes]:
+        return self._snapshot.get(self._prefix + key, default)
+
+    def iterator(self, **kwargs) -> '_Iterator':
+        return _iterate_prefixed(self._snapshot, self._prefix, **kwargs)
+
+    def close(self):
+        self._snapshot.close()
+
+    def release(self):
+        self.close()
+
+
+def _iterate_prefixed(db,
+                      base_prefix: bytes,
+                      reverse: bool = False,
+                      start: Optional[bytes] = None,
+                      stop: Optional[bytes] = None,
+                      include_start: bool = True,
+                      include_stop: bool = False,
+                      prefix: Optional[bytes] = None,
+                      include_key: bool = True,
+                      include_value: bool = True) -> '_Iterator':
+    if prefix is not None:
+        if start is not None or stop is not None:
+            raise TypeError("'prefix' cannot be used together with 'start' or 'stop'")
+        it = db.iterator(reverse=reverse, prefix=base_prefix + prefix)
+    else:
+        lower: bytes = base_prefix if start is None else base_prefix + start
+        upper: Optional[bytes] = _get_prefix_end(base_prefix) if stop is None else base_prefix + stop
+        it = db.iterator(reverse=reverse,
+                         start=lower,
+                         stop=upper,
+                         include_start=include_start or start is None,
+                         include_stop=include_stop and stop is not None)
+
+    size: int = len(base_prefix)
+    items = ((key[size:], value) for key, value in it)
+    return _Iterator((_make_item(key, value, include_key, include_value) for key, value in items), it.close)
+
+
+def open_backend(backend: str, path: str, create_if_missing: bool = True) -> 'KeyValueBackend':
+    """Opens a backend of a given type
+
+    :param backend: one of DBBackend
+    :param path: the path of a database. It is not used by DBBackend.MEMORY
+    :param create_if_missing:
+    :return:
+    """
+    if backend == DBBackend.LEVELDB:
+        return plyvel.DB(path, create_if_missing=create_if_missing)
+    elif backend == DBBackend.MEMORY:
+        return MemoryBackend()
+    elif backend == DBBackend.LMDB:
+        return LMDBBackend(path, create_if_missing)
+
+    raise DatabaseException(f"Unknown database backend: {backend}")
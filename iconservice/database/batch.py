@@ -15,18 +15,26 @@
 # limitations under the License.
 
 
+import hashlib
 from collections import OrderedDict
 from collections.abc import MutableMapping
-from copy import copy
-from typing import Optional, List
+from array import array
+from itertools import count
+from typing import Optional, List, Union
 
 from ..base.block import Block
 from ..base.exception import DatabaseException, AccessDeniedException
 from ..icx import IcxStorage
-from ..utils import sha3_256, to_camel_case
+from ..utils import to_camel_case
+
+
+# Generations of all TransactionBatches. No two batches have the same generation
+_generations = count()
 
 
 class BatchValue:
+    __slots__ = ('_value', '_include_state_root_hash')
+
     def __init__(self, value: Optional[bytes], include_state_root_hash: bool):
         self._value: bytes = value
         self._include_state_root_hash: bool = include_state_root_hash
@@ -41,15 +49,18 @@ class BatchValue:
 
     def to_dict(self, casing: Optional[callable] = None) -> dict:
         new_dict = {}
-        for key, value in self.__dict__.items():
-            if key.startswith("_"):
-                key = key[1:]
-            new_dict[casing(key) if casing else key] = value
+        for cls in reversed(type(self).__mro__):
+            for key in getattr(cls, '__slots__', ()):
+                if key.startswith("_"):
+                    key = key[1:]
+                new_dict[casing(key) if casing else key] = getattr(self, key)
 
         return new_dict
 
 
 class TransactionBatchValue(BatchValue):
+    __slots__ = ('_tx_index',)
+
     def __init__(self, value: Optional[bytes], include_state_root_hash: bool, tx_index: int = -1):
         super().__init__(value, include_state_root_hash)
         self._tx_index: int = tx_index
@@ -74,13 +85,26 @@ class TransactionBatchValue(BatchValue):
 
 
 class BlockBatchValue(BatchValue):
+    """State changed by a block
+
+    Most states are changed by only one transaction in a block,
+    so a single tx index is kept as an int and more than one as an array('i').
+    """
+
+    __slots__ = ('_tx_indexes',)
+
     def __init__(self, value: Optional[bytes], include_state_root_hash: bool, tx_indexes: List[int]):
         super().__init__(value, include_state_root_hash)
-        self._tx_indexes: List[int] = tx_indexes
+        self._tx_indexes: Union[int, array] = \
+            tx_indexes[0] if len(tx_indexes) == 1 else array('i', tx_indexes)
 
     @property
     def tx_indexes(self) -> List[int]:
-        return copy(self._tx_indexes)
+        tx_indexes = self._tx_indexes
+        if isinstance(tx_indexes, int):
+            return [tx_indexes]
+
+        return tx_indexes.tolist()
 
     def __repr__(self):
         return f'BlockBatchValue({self.value.hex()}, {self.include_state_root_hash}, {self.tx_indexes})'
@@ -91,20 +115,42 @@ class BlockBatchValue(BatchValue):
                self.tx_indexes == other.tx_indexes
 
 
-def digest(ordered_dict: OrderedDict):
+# The size of the buffer which is fed to the hash object at a time
+_DIGEST_CHUNK_SIZE = 64 * 1024
+
+
+def digest(ordered_dict: OrderedDict) -> bytes:
+    """Returns sha3_256(b'key0|value0|key1|value1|...') without building the whole joined bytes
+
+    Items are hashed in a single pass through a bounded buffer,
+    so the memory used does not grow with the number of states in a batch.
+    """
     # items in data MUST be byte-like objects
-    data = []
+    hash_obj = hashlib.sha3_256()
+    buf = bytearray()
+    is_first = True
 
-    for key, tx_batch_value in ordered_dict.items():
-        if tx_batch_value.include_state_root_hash is True:
-            value: bytes = tx_batch_value.value
-        else:
+    for key, batch_value in ordered_dict.items():
+        if batch_value.include_state_root_hash is not True:
             continue
-        data.append(key)
+
+        if is_first:
+            is_first = False
+        else:
+            buf += b'|'
+        buf += key
+
+        value: Optional[bytes] = batch_value.value
         if value is not None:
-            data.append(value)
-    value: bytes = b'|'.join(data)
-    return sha3_256(value)
+            buf += b'|'
+            buf += value
+
+        if len(buf) >= _DIGEST_CHUNK_SIZE:
+            hash_obj.update(buf)
+            buf.clear()
+
+    hash_obj.update(buf)
+    return hash_obj.digest()
 
 
 class Batch(OrderedDict):
@@ -134,8 +180,17 @@ class TransactionBatch(MutableMapping):
 
     key: Score Address
     value: IconScoreBatch
+
+    All the states visible on the current call are kept in one ordered dict.
+    Each inter-SCORE call records the previous values of the keys it overwrites in a journal,
+    so entering or leaving a call costs O(1) and reverting a call costs O(the number of its changes).
+    The key order equals the one made by merging call frames into their parents,
+    which keeps digest() identical.
     """
 
+    # Marks a key which did not exist before it was written
+    _MISSING = object()
+
     def __init__(self, tx_hash: Optional[bytes] = None) -> None:
         """Constructor
 
@@ -143,70 +198,88 @@ class TransactionBatch(MutableMapping):
         """
         super().__init__()
         self.hash = tx_hash
-        self._call_batches = [OrderedDict()]
+        self._data = OrderedDict()
+        # (key, previous value) pairs written on inter-SCORE calls
+        self._journal: List[tuple] = []
+        # The position of the journal where each inter-SCORE call starts
+        self._call_marks: List[int] = []
+        # Renewed whenever some values are reverted or cleared
+        self._generation: int = next(_generations)
 
     def __getitem__(self, item):
-        for call_batch in reversed(self._call_batches):
-            if item in call_batch:
-                return call_batch[item]
-
-        return None
+        return self._data.get(item)
 
     def __setitem__(self, key, value):
         assert isinstance(value, TransactionBatchValue)
 
-        call_batch: OrderedDict = self._call_batches[-1]
-        call_batch[key] = value
+        data: OrderedDict = self._data
+        if self._call_marks:
+            self._journal.append((key, data.get(key, self._MISSING)))
+        data[key] = value
 
     def __delitem__(self, key):
         raise DatabaseException('delete item is not allowed')
 
     def __contains__(self, item):
-        for call_batch in self._call_batches:
-            if item in call_batch:
-                return True
-
-        return False
+        return item in self._data
 
     def __iter__(self):
-        for call_batch in self._call_batches:
-            for key in call_batch:
-                yield key
+        return iter(self._data)
 
     def __len__(self):
-        length = 0
-
-        for call_batch in self._call_batches:
-            length += len(call_batch)
-
-        return length
+        return len(self._data)
 
     def enter_call(self):
-        self._call_batches.append(OrderedDict())
+        self._call_marks.append(len(self._journal))
 
     def revert_call(self):
-        call_batch: OrderedDict = self._call_batches[-1]
-        call_batch.clear()
+        self._generation = next(_generations)
+        data: OrderedDict = self._data
+
+        if not self._call_marks:
+            data.clear()
+            return
+
+        journal: List[tuple] = self._journal
+        mark: int = self._call_marks[-1]
+
+        # Undo the changes in reverse order, then the oldest previous value of each key remains
+        for i in range(len(journal) - 1, mark - 1, -1):
+            key, prev_value = journal[i]
+            if prev_value is self._MISSING:
+                del data[key]
+            else:
+                data[key] = prev_value
+
+        del journal[mark:]
 
     def leave_call(self):
-        call_batch: OrderedDict = self._call_batches.pop()
+        # The journal of the leaving call is taken over by its parent
+        self._call_marks.pop()
 
-        if call_batch:
-            self._call_batches[-1].update(call_batch)
+        if not self._call_marks:
+            self._journal.clear()
 
     def digest(self) -> bytes:
-        if len(self._call_batches) != 1:
-            raise DatabaseException(f'Wrong call_batch count: {len(self._call_batches)}')
+        if self._call_marks:
+            raise DatabaseException(f'Wrong call_batch count: {self.call_count}')
 
-        return digest(self._call_batches[0])
+        return digest(self._data)
 
     @property
     def call_count(self) -> int:
-        return len(self._call_batches)
+        return len(self._call_marks) + 1
+
+    @property
+    def generation(self) -> int:
+        return self._generation
 
     def clear(self):
+        self._generation = next(_generations)
         self.hash = None
-        self._call_batches = [OrderedDict()]
+        self._data.clear()
+        self._journal.clear()
+        self._call_marks.clear()
 
 
 class BlockBatch(Batch):
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import os
+import struct
+from hashlib import blake2b
+from typing import Optional, Iterable
+
+from iconcommons.logger import Logger
+
+from ..icon_constant import ICON_DB_LOG_TAG
+
+class BloomIndex(object):
+    """Bloom filter of the keys in a database to skip reading the keys which do not exist
+
+    Keys are only added, so deleted keys just raise the false positive rate until it is rebuilt.
+    A saved index is loaded only with the marker which was saved to its database together with it.
+    The lookup counters are updated without a lock, so they are approximate under concurrent reads.
+    """
+
+    MAGIC = b"ICXBLOOM"
+    VERSION = 1
+    MARKER_SIZE = 16
+    # magic, version, false positive rate, capacity, count, hash count, marker
+    _HEADER = struct.Struct(f">8sBdQQB{MARKER_SIZE}s")
+
+    MIN_CAPACITY = 1 << 16
+    # Bit positions are 32-bit words of a blake2b digest which is up to 64 bytes
+    MAX_HASH_COUNT = 16
+    MAX_BIT_SIZE = 1 << 32
+
+    def __init__(self, capacity: int, fp_rate: float):
+        """Constructor
+
+        :param capacity: the number of keys which keeps the false positive rate
+        :param fp_rate: false positive rate
+        """
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError(f"Invalid false positive rate: {fp_rate}")
+
+        capacity = max(capacity, self.MIN_CAPACITY)
+        size: int = math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2) / 8)
+        if size * 8 > self.MAX_BIT_SIZE:
+            raise ValueError(f"Too large bloom index: capacity={capacity} fp_rate={fp_rate}")
+
+        self._fp_rate: float = fp_rate
+        self._capacity: int = capacity
+        # The number of distinct keys added.
+        # A key is not counted if all of its bits were already set, so rewriting a key does not fill the index
+        self._count: int = 0
+        self._hash_count: int = min(self.MAX_HASH_COUNT, max(1, round(size * 8 / capacity * math.log(2))))
+        self._positions = struct.Struct(f"<{self._hash_count}I")
+        self._bits = bytearray(size)
+        self._bit_size: int = size * 8
+
+        self._lookups: int = 0
+        self._negatives: int = 0
+
+    @property
+    def fp_rate(self) -> float:
+        return self._fp_rate
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def is_full(self) -> bool:
+        return self._count > self._capacity
+
+    def _get_positions(self, key: bytes) -> tuple:
+        return self._positions.unpack(blake2b(key, digest_size=self._positions.size).digest())
+
+    def add(self, key: bytes):
+        bits = self._bits
+        bit_size: int = self._bit_size
+        added: bool = False
+
+        for pos in self._get_positions(key):
+            pos %= bit_size
+            mask: int = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                added = True
+
+        if added:
+            self._count += 1
+
+    def might_contain(self, key: bytes) -> bool:
+        """Returns False if a given key has never been added
+
+        :param key:
+        :return:
+        """
+        self._lookups += 1
+
+        bits = self._bits
+        bit_size: int = self._bit_size
+
+        for pos in self._get_positions(key):
+            pos %= bit_size
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                self._negatives += 1
+                return False
+
+        return True
+
+    def get_status(self) -> dict:
+        return {
+            "falsePositiveRate": self._fp_rate,
+            "capacity": self._capacity,
+            "count": self._count,
+            "size": len(self._bits),
+            "lookups": self._lookups,
+            "avoided": self._negatives
+        }
+
+    @classmethod
+    def build(cls, keys: Iterable[bytes], capacity: int, fp_rate: float) -> 'BloomIndex':
+        """Creates an index of given keys
+
+        :param keys: all keys in a database
+        :param capacity: the number of keys which keeps the false positive rate
+        :param fp_rate: false positive rate
+        :return:
+        """
+        bloom = cls(capacity, fp_rate)
+        for key in keys:
+            bloom.add(key)
+
+        return bloom
+
+    def save(self, path: str, marker: bytes):
+        """Saves this index with the marker which is also saved to its database
+
+        :param path:
+        :param marker: random bytes of MARKER_SIZE
+        """
+        tmp_path: str = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._HEADER.pack(
+                self.MAGIC, self.VERSION, self._fp_rate, self._capacity, self._count, self._hash_count, marker))
+            f.write(self._bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, fp_rate: float, marker: Optional[bytes]) -> Optional['BloomIndex']:
+        """Loads an index saved by save() and removes its file
+
+        The file is removed so that the index is never loaded again
+        if keys are added after this without saving it, e.g. on a crash.
+        The marker of the database rejects the index of another database,
+        e.g. after the database is restored from a backup or replaced by a snapshot.
+
+        :param path:
+        :param fp_rate: false positive rate. If it differs from the saved one, the index is not loaded
+        :param marker: marker read from the database. None: there is no valid index
+        :return: None if there is no valid index
+        """
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                magic, version, saved_fp_rate, capacity, count, hash_count, saved_marker = cls._HEADER.unpack(
+                    f.read(cls._HEADER.size))
+                bits = bytearray(f.read())
+        except (OSError, struct.error) as e:
+            Logger.warning(tag=ICON_DB_LOG_TAG, msg=f"Failed to load a bloom index: {path} {e}")
+            return None
+        finally:
+            os.remove(path)
+
+        if magic != cls.MAGIC or version != cls.VERSION or saved_fp_rate != fp_rate:
+            return None
+        if marker is None or saved_marker != marker:
+            Logger.warning(tag=ICON_DB_LOG_TAG, msg=f"Bloom index does not match the database: {path}")
+            return None
+
+        bloom = cls(capacity, fp_rate)
+        if len(bits) != len(bloom._bits) or hash_count != bloom._hash_count:
+            return None
+
+        bloom._bits = bits
+        bloom._count = count
+        return bloom
@@ -13,19 +13,30 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TYPE_CHECKING, Optional, Tuple, Iterable
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Optional, Tuple, Iterable, Iterator, List, Dict
 
-import plyvel
 from iconcommons.logger import Logger
 
-from .batch import TransactionBatchValue
+from .backend import open_backend
+from .batch import BatchValue, TransactionBatchValue
+from .bloom_index import BloomIndex
 from ..base.exception import DatabaseException, InvalidParamsException, AccessDeniedException
-from ..icon_constant import ICON_DB_LOG_TAG, IconScoreContextType
+from ..icon_constant import (
+    ICON_DB_LOG_TAG, IconScoreContextType, DBBackend, BLOOM_INDEX_FILE_SUFFIX, BLOOM_INDEX_MARKER_KEY
+)
 from ..iconscore.context.context import ContextGetter
 
 if TYPE_CHECKING:
+    from .backend import KeyValueBackend
+    from .batch import TransactionBatch
     from ..base.address import Address
     from ..iconscore.icon_score_context import IconScoreContext
+    from ..block_profiler import TxProfile
+    from ..optimistic_executor import Speculation
 
 
 def _is_db_writable_on_context(context: 'IconScoreContext'):
@@ -40,25 +51,355 @@ def _is_db_writable_on_context(context: 'IconScoreContext'):
         return not context.readonly
 
 
+def _is_same_version(version: tuple, other: Optional[tuple]) -> bool:
+    """Check if two versions returned by IconScoreDatabase._get_version() are the same
+
+    The values in tx_batch are compared by identity as every write puts a new one.
+    """
+    return other is not None and version[0] == other[0] and version[1] is other[1]
+
+
+class LRUCache(object):
+    """Size-aware LRU cache for the values committed to a KeyValueDatabase
+
+    Both present and absent keys are cached. An absent key is cached as None.
+    The size of an entry is len(key) + len(value) + ENTRY_OVERHEAD.
+    It is shared by the invoke thread and query threads, so every operation is guarded by a lock.
+    """
+
+    # Approximate memory overhead of one entry except for key and value
+    ENTRY_OVERHEAD = 64
+
+    def __init__(self, max_size: int):
+        """Constructor
+
+        :param max_size: the maximum total size of cached entries in bytes
+        """
+        self._max_size: int = max_size
+        self._size: int = 0
+        self._items: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        # Incremented whenever some keys are invalidated
+        self._generation: int = 0
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: bytes, generation: Optional[int] = None) -> Tuple[bool, Optional[bytes]]:
+        """Returns whether a given key is cached and its value
+
+        :param key:
+        :param generation: if not None, a cached value is used only when no invalidation has happened since then
+        :return: (hit, value)
+        """
+        with self._lock:
+            if key in self._items and (generation is None or generation == self._generation):
+                self._items.move_to_end(key)
+                self._hits += 1
+                return True, self._items[key]
+
+            self._misses += 1
+            return False, None
+
+    def put(self, key: bytes, value: Optional[bytes], generation: int) -> None:
+        """Cache a value read from the database
+
+        If any invalidation happened after the value was read, it can be stale and is not cached.
+
+        :param key:
+        :param value: value read from the database
+        :param generation: the generation of this cache before the value was read
+        """
+        size: int = self._get_entry_size(key, value)
+        if size > self._max_size:
+            return
+
+        with self._lock:
+            if generation != self._generation or key in self._items:
+                return
+
+            self._items[key] = value
+            self._size += size
+
+            while self._size > self._max_size:
+                old_key, old_value = self._items.popitem(last=False)
+                self._size -= self._get_entry_size(old_key, old_value)
+                self._evictions += 1
+
+    def invalidate(self, keys: Iterable[bytes]) -> None:
+        """Remove the entries of given keys after they are written to the database
+
+        :param keys: keys which have been changed
+        """
+        with self._lock:
+            for key in keys:
+                if key in self._items:
+                    value: Optional[bytes] = self._items.pop(key)
+                    self._size -= self._get_entry_size(key, value)
+
+            self._generation += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+            self._generation += 1
+
+    def get_status(self) -> dict:
+        with self._lock:
+            return {
+                "maxSize": self._max_size,
+                "size": self._size,
+                "count": len(self._items),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions
+            }
+
+    @classmethod
+    def _get_entry_size(cls, key: bytes, value: Optional[bytes]) -> int:
+        size: int = len(key) + cls.ENTRY_OVERHEAD
+        if value is not None:
+            size += len(value)
+
+        return size
+
+
+class KeyValueDatabaseSnapshot(object):
+    """Read-only view of a KeyValueDatabase at a specific moment
+
+    The read cache of its source database is used only while no data has been written to the source database
+    since this snapshot was taken.
+    """
+
+    def __init__(self,
+                 source: 'KeyValueDatabase',
+                 snapshot,
+                 cache: Optional['LRUCache'],
+                 bloom: Optional['BloomIndex'] = None):
+        """Constructor
+
+        :param source: KeyValueDatabase which this snapshot is taken from
+        :param snapshot: snapshot of a backend
+        :param cache: read cache of the source database
+        :param bloom: bloom index of the source database.
+            It has all keys in the snapshot even if the source database rebuilds its index later
+        """
+        self._source = source
+        self._snapshot = snapshot
+        self._cache: Optional['LRUCache'] = cache
+        self._generation: int = -1 if cache is None else cache.generation
+        self._bloom: Optional['BloomIndex'] = bloom
+
+    @property
+    def source(self) -> 'KeyValueDatabase':
+        return self._source
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Get the value for the specified key at the moment when this snapshot was taken
+
+        :param key: (bytes): key to retrieve
+        :return: value for the specified key, or None if not found
+        """
+        cache: Optional['LRUCache'] = self._cache
+        if cache is None:
+            return self._get(key)
+
+        hit, value = cache.get(key, self._generation)
+        if hit:
+            return value
+
+        value: Optional[bytes] = self._get(key)
+        cache.put(key, value, self._generation)
+
+        return value
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        bloom: Optional['BloomIndex'] = self._bloom
+        if bloom is not None and not bloom.might_contain(key):
+            return None
+
+        return self._snapshot.get(key)
+
+    def multi_get(self, keys: Iterable[bytes]) -> List[Optional[bytes]]:
+        """Get the values for the specified keys at the moment when this snapshot was taken
+
+        :param keys: keys to retrieve
+        :return: values in the order of keys. None for the keys not found
+        """
+        return _multi_get(self._snapshot, self._cache, self._generation, self._bloom, keys)
+
+    def iterator(self, **kwargs) -> iter:
+        return self._snapshot.iterator(**kwargs)
+
+    def close(self):
+        """Releases the snapshot of the backend. It MUST be called before the source database is closed
+        """
+        self._snapshot.close()
+
+    def scan(self,
+             prefix: Optional[bytes] = None,
+             start: Optional[bytes] = None,
+             stop: Optional[bytes] = None,
+             reverse: bool = False,
+             limit: int = 0) -> Iterator[Tuple[bytes, bytes]]:
+        """Iterates over the items in a range at the moment when this snapshot was taken
+
+        See KeyValueDatabase.scan()
+        """
+        return _scan(self._snapshot, prefix, start, stop, reverse, limit)
+
+
+def _multi_get(db,
+               cache: Optional['LRUCache'],
+               generation: int,
+               bloom: Optional['BloomIndex'],
+               keys: Iterable[bytes]) -> List[Optional[bytes]]:
+    """Reads the values of keys from the read cache first and the others from a backend
+
+    :param db: backend or its snapshot
+    :param cache: read cache
+    :param generation: the generation of cache before db was taken
+    :param bloom: bloom index which has all keys in db
+    :param keys:
+    :return: values in the order of keys
+    """
+    get = db.get
+    if bloom is not None:
+        db_get = get
+
+        def get(key: bytes) -> Optional[bytes]:
+            return db_get(key) if bloom.might_contain(key) else None
+
+    if cache is None:
+        return [get(key) for key in keys]
+
+    values: List[Optional[bytes]] = []
+    for key in keys:
+        hit, value = cache.get(key, generation)
+        if not hit:
+            value = get(key)
+            cache.put(key, value, generation)
+        values.append(value)
+
+    return values
+
+
+def _scan(db,
+          prefix: Optional[bytes],
+          start: Optional[bytes],
+          stop: Optional[bytes],
+          reverse: bool,
+          limit: int) -> Iterator[Tuple[bytes, bytes]]:
+    if prefix is not None:
+        if start is not None or stop is not None:
+            raise InvalidParamsException("prefix cannot be used with start or stop")
+        kwargs = {"prefix": prefix}
+    else:
+        kwargs = {"start": start, "stop": stop}
+
+    with db.iterator(reverse=reverse, **kwargs) as it:
+        for count, item in enumerate(it, 1):
+            yield item
+            if count == limit:
+                break
+
+
 class KeyValueDatabase(object):
     @staticmethod
     def from_path(path: str,
-                  create_if_missing: bool = True) -> 'KeyValueDatabase':
+                  create_if_missing: bool = True,
+                  cache_size: int = 0,
+                  backend: str = DBBackend.LEVELDB,
+                  bloom_fp_rate: float = 0.0) -> 'KeyValueDatabase':
         """
 
         :param path: db path
         :param create_if_missing:
+        :param cache_size: the maximum size of read cache in bytes (0: no cache)
+        :param backend: storage backend defined in DBBackend
+        :param bloom_fp_rate: false positive rate of the bloom index of keys (0: no index)
         :return: KeyValueDatabase instance
         """
-        db = plyvel.DB(path, create_if_missing=create_if_missing)
-        return KeyValueDatabase(db)
+        db = open_backend(backend, path, create_if_missing)
+        cache: Optional['LRUCache'] = LRUCache(cache_size) if cache_size > 0 else None
+        kv_db = KeyValueDatabase(db, cache)
 
-    def __init__(self, db: plyvel.DB) -> None:
+        if bloom_fp_rate > 0.0:
+            # The index of the memory backend is not saved as its data is lost on close
+            bloom_path: Optional[str] = None if backend == DBBackend.MEMORY else f"{path}{BLOOM_INDEX_FILE_SUFFIX}"
+            kv_db.open_bloom_index(bloom_fp_rate, bloom_path)
+        elif backend != DBBackend.MEMORY:
+            # The saved index misses the keys which are written without it
+            kv_db._pop_bloom_index_marker()
+
+        return kv_db
+
+    def __init__(self, db: 'KeyValueBackend', cache: Optional['LRUCache'] = None) -> None:
         """Constructor
 
-        :param db: plyvel db instance
+        :param db: plyvel db instance or another KeyValueBackend
+        :param cache: read cache for committed states
         """
         self._db = db
+        self._cache: Optional['LRUCache'] = cache
+        self._bloom: Optional['BloomIndex'] = None
+        self._bloom_path: Optional[str] = None
+
+    def open_bloom_index(self, fp_rate: float, path: Optional[str] = None) -> None:
+        """Loads the bloom index of keys from a file or builds it from all keys in this database
+
+        :param fp_rate: false positive rate
+        :param path: the path where the index is saved on close. None: not saved
+        """
+        bloom: Optional['BloomIndex'] = None
+        if path is not None:
+            bloom = BloomIndex.load(path, fp_rate, self._pop_bloom_index_marker())
+        if bloom is None:
+            bloom = self._build_bloom_index(fp_rate)
+
+        self._bloom = bloom
+        self._bloom_path = path
+
+    def _pop_bloom_index_marker(self) -> Optional[bytes]:
+        """Removes the marker from this database so that the saved index is not loaded
+        after this database is changed without saving the index again, e.g. on a crash or a backup made now
+
+        :return: the marker saved together with the index on close
+        """
+        marker: Optional[bytes] = self._db.get(BLOOM_INDEX_MARKER_KEY)
+        if marker is not None:
+            self._db.delete(BLOOM_INDEX_MARKER_KEY)
+        return marker
+
+    def _build_bloom_index(self, fp_rate: float) -> 'BloomIndex':
+        start: float = time.monotonic()
+
+        with self._db.iterator(include_value=False) as it:
+            count: int = sum(1 for _ in it)
+        with self._db.iterator(include_value=False) as it:
+            # Leaves room for new keys so that it is not rebuilt soon
+            bloom = BloomIndex.build(it, count * 2, fp_rate)
+
+        Logger.info(tag=ICON_DB_LOG_TAG,
+                    msg=f"Bloom index built: keys={count} elapsed={time.monotonic() - start:.3f}s")
+        return bloom
+
+    @property
+    def bloom_index(self) -> Optional['BloomIndex']:
+        return self._bloom
+
+    @property
+    def cache(self) -> Optional['LRUCache']:
+        return self._cache
 
     def get(self, key: bytes) -> bytes:
         """Get the value for the specified key.
@@ -66,6 +407,25 @@ class KeyValueDatabase(object):
         :param key: (bytes): key to retrieve
         :return: value for the specified key, or None if not found
         """
+        cache: Optional['LRUCache'] = self._cache
+        if cache is None:
+            return self._get(key)
+
+        hit, value = cache.get(key)
+        if hit:
+            return value
+
+        generation: int = cache.generation
+        value: Optional[bytes] = self._get(key)
+        cache.put(key, value, generation)
+
+        return value
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        bloom: Optional['BloomIndex'] = self._bloom
+        if bloom is not None and not bloom.might_contain(key):
+            return None
+
         return self._db.get(key)
 
     def put(self, key: bytes, value: bytes) -> None:
@@ -74,8 +434,14 @@ class KeyValueDatabase(object):
         :param key: (bytes): key to set
         :param value: (bytes): data to be stored
         """
+        # The index is updated first so that no reader misses the key
+        if self._bloom is not None:
+            self._bloom.add(key)
         self._db.put(key, value)
 
+        if self._cache is not None:
+            self._cache.invalidate((key,))
+
     def delete(self, key: bytes) -> None:
         """Delete the key/value pair for the specified key.
 
@@ -83,15 +449,30 @@ class KeyValueDatabase(object):
         """
         self._db.delete(key)
 
+        if self._cache is not None:
+            self._cache.invalidate((key,))
+
     def close(self) -> None:
         """Close the database.
         """
+        if self._bloom is not None:
+            if self._db and self._bloom_path is not None:
+                # The marker is written after the index, so a crash between them leaves an index never loaded
+                marker: bytes = os.urandom(BloomIndex.MARKER_SIZE)
+                self._bloom.save(self._bloom_path, marker)
+                self._db.put(BLOOM_INDEX_MARKER_KEY, marker)
+            self._bloom = None
+
         if self._db:
             self._db.close()
             self._db = None
 
+        if self._cache is not None:
+            self._cache.clear()
+
     def get_sub_db(self, prefix: bytes) -> 'KeyValueDatabase':
         """Return a new prefixed database.
+        The read cache is not shared with the prefixed database, so do not write any data through it.
 
         :param prefix: (bytes): prefix to use
         """
@@ -100,6 +481,44 @@ class KeyValueDatabase(object):
     def iterator(self) -> iter:
         return self._db.iterator()
 
+    def scan(self,
+             prefix: Optional[bytes] = None,
+             start: Optional[bytes] = None,
+             stop: Optional[bytes] = None,
+             reverse: bool = False,
+             limit: int = 0) -> Iterator[Tuple[bytes, bytes]]:
+        """Iterates over the items with a given prefix or in [start, stop) in key order
+
+        The read cache is not used.
+
+        :param prefix: prefix of keys. It cannot be used with start or stop
+        :param start: the first key (inclusive). None: from the first key
+        :param stop: the last key (exclusive). None: to the last key
+        :param reverse: iterate in descending order of keys
+        :param limit: the maximum number of items (0: no limit)
+        :return: (key, value) pairs
+        """
+        return _scan(self._db, prefix, start, stop, reverse, limit)
+
+    def multi_get(self, keys: Iterable[bytes]) -> List[Optional[bytes]]:
+        """Get the values for the specified keys from the same snapshot
+
+        Values are read from the read cache first, so it is cheaper than getting them one by one
+        and they are consistent with each other even while data is written on another thread.
+
+        :param keys: keys to retrieve
+        :return: values in the order of keys. None for the keys not found
+        """
+        cache: Optional['LRUCache'] = self._cache
+        generation: int = -1 if cache is None else cache.generation
+        bloom: Optional['BloomIndex'] = self._bloom
+
+        snapshot = self._db.snapshot()
+        try:
+            return _multi_get(snapshot, cache, generation, bloom, keys)
+        finally:
+            snapshot.close()
+
     def write_batch(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
         """Write a batch to the database for the specified states dict.
 
@@ -113,17 +532,59 @@ class KeyValueDatabase(object):
         if it is None:
             return size
 
+        # Keys written to the database are invalidated on the read cache after write_batch is done
+        keys: Optional[list] = None if self._cache is None else []
+        bloom: Optional['BloomIndex'] = self._bloom
+
         with self._db.write_batch() as wb:
             for key, value in it:
                 if value:
+                    if bloom is not None:
+                        bloom.add(key)
                     wb.put(key, value)
                 else:
                     wb.delete(key)
 
+                if keys is not None:
+                    keys.append(key)
                 size += 1
 
+        if keys is not None:
+            self._cache.invalidate(keys)
+
+        if bloom is not None and bloom.is_full():
+            self._bloom = self._build_bloom_index(bloom.fp_rate)
+
         return size
 
+    def get_snapshot(self) -> 'KeyValueDatabaseSnapshot':
+        """Returns a consistent read-only view of the current database
+
+        It MUST be called on the thread which writes data to this database
+        so that no write_batch is in progress
+        """
+        return KeyValueDatabaseSnapshot(self, self._db.snapshot(), self._cache, self._bloom)
+
+    def get_cache_status(self) -> Optional[dict]:
+        """Returns the statistics of the read cache
+
+        :return: None if the read cache is disabled
+        """
+        if self._cache is None:
+            return None
+
+        return self._cache.get_status()
+
+    def get_bloom_status(self) -> Optional[dict]:
+        """Returns the statistics of the bloom index
+
+        :return: None if the bloom index is disabled
+        """
+        if self._bloom is None:
+            return None
+
+        return self._bloom.get_status()
+
 
 class DatabaseObserver(object):
     """ An abstract class of database observer.
@@ -204,10 +665,81 @@ class ContextDatabase(object):
         """
         context_type = context.type
 
-        if context_type in (IconScoreContextType.DIRECT, IconScoreContextType.QUERY):
+        if context_type == IconScoreContextType.DIRECT:
             return self.key_value_db.get(key)
+        elif context_type == IconScoreContextType.QUERY:
+            return self._get_from_state_db(context, key)
         else:
-            return self.get_from_batch(context, key)
+            value: Optional[bytes] = self.get_from_batch(context, key)
+
+            tx_profile: Optional['TxProfile'] = context.tx_profile
+            if tx_profile is not None:
+                tx_profile.on_get(value)
+
+            return value
+
+    def multi_get(self, context: Optional['IconScoreContext'], keys: List[bytes]) -> List[Optional[bytes]]:
+        """Returns the values indicated by keys from batch or StateDB
+
+        The values which are not in batch are read from StateDB in one call
+
+        :param context:
+        :param keys:
+        :return: values in the order of keys
+        """
+        context_type = context.type
+
+        if context_type == IconScoreContextType.DIRECT:
+            return self.key_value_db.multi_get(keys)
+        elif context_type == IconScoreContextType.QUERY:
+            return self._multi_get_from_state_db(context, keys)
+
+        speculation: Optional['Speculation'] = context.speculation
+        if speculation is not None:
+            speculation.read_keys.update(keys)
+
+        values: List[Optional[bytes]] = []
+        # Indexes of the values to read from StateDB
+        indexes: List[int] = []
+        for i, key in enumerate(keys):
+            batch_value: Optional['BatchValue'] = context.get_batch_value(key)
+            if isinstance(batch_value, BatchValue):
+                values.append(batch_value.value)
+            else:
+                indexes.append(i)
+                values.append(None)
+
+        if indexes:
+            state_values: List[Optional[bytes]] = self._multi_get_from_state_db(context, [keys[i] for i in indexes])
+            for i, value in zip(indexes, state_values):
+                values[i] = value
+
+        tx_profile: Optional['TxProfile'] = context.tx_profile
+        if tx_profile is not None:
+            for value in values:
+                tx_profile.on_get(value)
+
+        return values
+
+    def _multi_get_from_state_db(self, context: 'IconScoreContext', keys: List[bytes]) -> List[Optional[bytes]]:
+        snapshot: Optional['KeyValueDatabaseSnapshot'] = context.state_db_snapshot
+        if snapshot is not None and snapshot.source is self.key_value_db:
+            return snapshot.multi_get(keys)
+
+        return self.key_value_db.multi_get(keys)
+
+    def _get_from_state_db(self, context: 'IconScoreContext', key: bytes) -> Optional[bytes]:
+        """Returns a value from the snapshot which the context is pinned to, if it exists
+
+        :param context:
+        :param key:
+        :return:
+        """
+        snapshot: Optional['KeyValueDatabaseSnapshot'] = context.state_db_snapshot
+        if snapshot is not None and snapshot.source is self.key_value_db:
+            return snapshot.get(key)
+
+        return self.key_value_db.get(key)
 
     def get_from_batch(self,
                        context: 'IconScoreContext',
@@ -225,13 +757,19 @@ class ContextDatabase(object):
 
         :return: a value for a given key
         """
+        # Record the read set of a transaction to detect conflicts with the preceding ones
+        speculation: Optional['Speculation'] = context.speculation
+        if speculation is not None:
+            speculation.read_keys.add(key)
+
         # Find the value from tx_batch, block_batch and prev_block_batches with a given key
-        for batch in context.get_batches():
-            if key in batch:
-                return batch[key].value
+        # Anything but a BatchValue, e.g. None, means that no batch has the key
+        batch_value: Optional['BatchValue'] = context.get_batch_value(key)
+        if isinstance(batch_value, BatchValue):
+            return batch_value.value
 
         # get value from state_db
-        return self.key_value_db.get(key)
+        return self._get_from_state_db(context, key)
 
     @staticmethod
     def _check_tx_batch_value(context: Optional['IconScoreContext'],
@@ -276,6 +814,10 @@ class ContextDatabase(object):
             tx_index: int = context.tx.index if context.tx is not None else -1
             context.tx_batch[key] = TransactionBatchValue(value, include_state_root_hash, tx_index)
 
+            tx_profile: Optional['TxProfile'] = context.tx_profile
+            if tx_profile is not None:
+                tx_profile.on_put(value)
+
     def delete(self,
                context: Optional['IconScoreContext'],
                key: bytes):
@@ -302,6 +844,10 @@ class ContextDatabase(object):
             tx_index: int = context.tx.index if context.tx is not None else -1
             context.tx_batch[key] = TransactionBatchValue(None, include_state_root_hash, tx_index)
 
+            tx_profile: Optional['TxProfile'] = context.tx_profile
+            if tx_profile is not None:
+                tx_profile.on_put(None)
+
     def close(self, context: 'IconScoreContext') -> None:
         """close db
 
@@ -325,8 +871,9 @@ class ContextDatabase(object):
 
     @staticmethod
     def from_path(path: str,
-                  create_if_missing: bool = True) -> 'ContextDatabase':
-        db = KeyValueDatabase.from_path(path, create_if_missing)
+                  create_if_missing: bool = True,
+                  backend: str = DBBackend.LEVELDB) -> 'ContextDatabase':
+        db = KeyValueDatabase.from_path(path, create_if_missing, backend=backend)
         return ContextDatabase(db)
 
 
@@ -355,8 +902,9 @@ class MetaContextDatabase(ContextDatabase):
 
     @staticmethod
     def from_path(path: str,
-                  create_if_missing: bool = True) -> 'MetaContextDatabase':
-        db = KeyValueDatabase.from_path(path, create_if_missing)
+                  create_if_missing: bool = True,
+                  backend: str = DBBackend.LEVELDB) -> 'MetaContextDatabase':
+        db = KeyValueDatabase.from_path(path, create_if_missing, backend=backend)
         return MetaContextDatabase(db)
 
 
@@ -366,6 +914,9 @@ class IconScoreDatabase(ContextGetter):
     IconScore can access its states only through IconScoreDatabase
     """
 
+    # The maximum number of sub dbs which are kept to be reused
+    MAX_SUB_DBS = 1024
+
     def __init__(self,
                  address: 'Address',
                  context_db: 'ContextDatabase',
@@ -380,6 +931,10 @@ class IconScoreDatabase(ContextGetter):
         self._prefix = prefix
         self._context_db = context_db
         self._observer: Optional[DatabaseObserver] = None
+        # (context, accesses) while the accesses in a context are tracked
+        self._tracker: Optional[Tuple['IconScoreContext', List[Tuple[str, bytes]]]] = None
+        # Sub dbs by their prefixes. They have no state but the prefixes, so they are shared by all contexts
+        self._sub_dbs: Dict[bytes, 'IconScoreSubDatabase'] = {}
 
         self._prefix_hash_key: bytes = self._make_prefix_hash_key()
 
@@ -400,6 +955,8 @@ class IconScoreDatabase(ContextGetter):
         value = self._context_db.get(self._context, hashed_key)
         if self._observer:
             self._observer.on_get(self._context, key, value)
+        if self._tracker is not None:
+            self._track("get", key)
         return value
 
     def put(self, key: bytes, value: bytes):
@@ -410,6 +967,8 @@ class IconScoreDatabase(ContextGetter):
         :param value: value to set
         """
         self._validate_ownership()
+        if self._tracker is not None:
+            self._track("put", key)
         hashed_key = self._hash_key(key)
         if self._observer:
             old_value = self._context_db.get(self._context, hashed_key)
@@ -435,7 +994,26 @@ class IconScoreDatabase(ContextGetter):
         if self._prefix is not None:
             prefix = b'|'.join((self._prefix, prefix))
 
-        return IconScoreSubDatabase(self.address, self, prefix)
+        return self._get_sub_db(prefix)
+
+    def _get_sub_db(self, prefix: bytes) -> 'IconScoreSubDatabase':
+        """Returns the sub db with a given full prefix, reusing the one made before
+
+        Nested DictDBs can make sub dbs without limit,
+        so all of them are dropped when the number of them reaches MAX_SUB_DBS.
+
+        :param prefix: the prefix from this db, not from its parent sub db
+        :return: sub db
+        """
+        sub_dbs: Dict[bytes, 'IconScoreSubDatabase'] = self._sub_dbs
+        sub_db: Optional['IconScoreSubDatabase'] = sub_dbs.get(prefix)
+        if sub_db is None:
+            sub_db = IconScoreSubDatabase(self.address, self, prefix)
+            if len(sub_dbs) >= self.MAX_SUB_DBS:
+                sub_dbs.clear()
+            sub_dbs[prefix] = sub_db
+
+        return sub_db
 
     def delete(self, key: bytes):
         """
@@ -444,6 +1022,8 @@ class IconScoreDatabase(ContextGetter):
         :param key: key to delete
         """
         self._validate_ownership()
+        if self._tracker is not None:
+            self._track("delete", key)
         hashed_key = self._hash_key(key)
         if self._observer:
             old_value = self._context_db.get(self._context, hashed_key)
@@ -452,12 +1032,104 @@ class IconScoreDatabase(ContextGetter):
                 self._observer.on_delete(self._context, key, old_value)
         self._context_db.delete(self._context, hashed_key)
 
+    def _read_ahead(self, keys: List[bytes]) -> List[tuple]:
+        """Reads the values for the specified keys in one call to pass them to _get_read_ahead() later
+
+        No observer is notified here, so a value is charged only when it is used.
+
+        :param keys: keys to retrieve
+        :return: (context, version, value) of each key in the order of keys
+        """
+        context: 'IconScoreContext' = self._context
+        hashed_keys: List[bytes] = [self._hash_key(key) for key in keys]
+        values: List[Optional[bytes]] = self._context_db.multi_get(context, hashed_keys)
+        return [
+            (context, self._get_version_by_hashed_key(hashed_key), value)
+            for hashed_key, value in zip(hashed_keys, values)
+        ]
+
+    def _get_read_ahead(self, key: bytes, entry: tuple) -> Optional[bytes]:
+        """Does the same as get() with a value read by _read_ahead()
+
+        The value is read again if it was read in another context or its version has changed since then,
+        e.g. it was written through any db or reverted.
+
+        :param key: key passed to _read_ahead()
+        :param entry: entry of the key returned by _read_ahead()
+        :return: value for the specified key, or None if not found
+        """
+        context, version, value = entry
+        if context is not self._context:
+            return self.get(key)
+
+        if version is None:
+            # Without tx_batch, values are written to the db directly unless the context is readonly
+            is_valid: bool = context.readonly and self._get_version(key) is None
+        else:
+            is_valid: bool = _is_same_version(version, self._get_version(key))
+        if not is_valid:
+            return self.get(key)
+
+        self._on_cached_get(key, value)
+        return value
+
+    def _get_version(self, key: bytes) -> Optional[tuple]:
+        """Returns the version of the value for the specified key in the current transaction
+
+        The version changes whenever the value is written or reverted, or the transaction is over.
+
+        :param key: key to retrieve
+        :return: (generation of tx_batch, value in tx_batch), or None if there is no tx_batch
+        """
+        return self._get_version_by_hashed_key(self._hash_key(key))
+
+    def _get_version_by_hashed_key(self, hashed_key: bytes) -> Optional[tuple]:
+        tx_batch: Optional['TransactionBatch'] = self._context.tx_batch
+        if tx_batch is None:
+            return None
+
+        return tx_batch.generation, tx_batch[hashed_key]
+
+    def _on_cached_get(self, key: bytes, value: Optional[bytes]):
+        """Does what get() does except for reading, with a value which get() returned before
+
+        :param key: key to retrieve
+        :param value: value returned by get()
+        """
+        if self._observer:
+            self._observer.on_get(self._context, key, value)
+        if self._tracker is not None:
+            self._track("get", key)
+
     def close(self):
         self._context_db.close(self._context)
 
     def set_observer(self, observer: 'DatabaseObserver'):
         self._observer = observer
 
+    def start_tracking(self, context: 'IconScoreContext'):
+        """Starts to record the keys which are accessed in a given context
+
+        Accesses in the other contexts, e.g. on the other threads, are not recorded
+
+        :param context:
+        """
+        self._tracker = (context, [])
+
+    def stop_tracking(self) -> List[Tuple[str, bytes]]:
+        """Stops recording the accesses
+
+        :return: ("get" | "put" | "delete", key) in the order of accesses
+        """
+        _, accesses = self._tracker
+        self._tracker = None
+        return accesses
+
+    def _track(self, op: str, key: bytes):
+        tracker = self._tracker
+        if tracker is not None and tracker[0] is self._context:
+            tracker[1].append((op, key))
+
     def _hash_key(self, key: bytes) -> bytes:
         """All key is hashed and stored
         to StateDB to avoid key conflicts among SCOREs
@@ -532,7 +1204,7 @@ class IconScoreSubDatabase(object):
         if self._prefix is not None:
             prefix = b'|'.join((self._prefix, prefix))
 
-        return IconScoreSubDatabase(self.address, self._score_db, prefix)
+        return self._score_db._get_sub_db(prefix)
 
     def delete(self, key: bytes):
         """
@@ -543,6 +1215,26 @@ class IconScoreSubDatabase(object):
         hashed_key = self._hash_key(key)
         self._score_db.delete(hashed_key)
 
+    def _read_ahead(self, keys: List[bytes]) -> List[tuple]:
+        """See IconScoreDatabase._read_ahead()
+        """
+        return self._score_db._read_ahead([self._hash_key(key) for key in keys])
+
+    def _get_read_ahead(self, key: bytes, entry: tuple) -> Optional[bytes]:
+        """See IconScoreDatabase._get_read_ahead()
+        """
+        return self._score_db._get_read_ahead(self._hash_key(key), entry)
+
+    def _get_version(self, key: bytes) -> Optional[tuple]:
+        """See IconScoreDatabase._get_version()
+        """
+        return self._score_db._get_version(self._hash_key(key))
+
+    def _on_cached_get(self, key: bytes, value: Optional[bytes]):
+        """See IconScoreDatabase._on_cached_get()
+        """
+        self._score_db._on_cached_get(self._hash_key(key), value)
+
     def close(self):
         self._score_db.close()
 
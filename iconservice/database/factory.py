@@ -20,7 +20,7 @@ from enum import IntEnum
 
 from .db import KeyValueDatabase, ContextDatabase
 from ..base.address import Address
-from ..icon_constant import ICON_DEX_DB_NAME
+from ..icon_constant import ICON_DEX_DB_NAME, DBBackend
 
 
 class ContextDatabaseFactory(object):
@@ -32,19 +32,41 @@ class ContextDatabaseFactory(object):
     _state_db_root_path: str = None
     _mode: 'Mode' = Mode.SINGLE_DB
     _shared_context_db: 'ContextDatabase' = None
+    _cache_size: int = 0
+    _backend: str = DBBackend.LEVELDB
+    _bloom_fp_rate: float = 0.0
 
     @classmethod
-    def open(cls, state_db_root_path: str, mode: 'Mode'):
+    def open(cls,
+             state_db_root_path: str,
+             mode: 'Mode',
+             cache_size: int = 0,
+             backend: str = DBBackend.LEVELDB,
+             bloom_fp_rate: float = 0.0):
+        """
+
+        :param state_db_root_path:
+        :param mode:
+        :param cache_size: the maximum size of read cache for the shared db in bytes (0: no cache)
+        :param backend: storage backend of state dbs defined in DBBackend
+        :param bloom_fp_rate: false positive rate of the bloom index of the shared db (0: no index)
+        """
         cls.close()
 
         cls._state_db_root_path = state_db_root_path
         cls._mode = mode
+        cls._cache_size = cache_size
+        cls._backend = backend
+        cls._bloom_fp_rate = bloom_fp_rate
 
     @classmethod
     def get_shared_db(cls) -> ContextDatabase:
         if cls._shared_context_db is None:
             path = os.path.join(cls._state_db_root_path, ICON_DEX_DB_NAME)
-            key_value_db = KeyValueDatabase.from_path(path)
+            key_value_db = KeyValueDatabase.from_path(path,
+                                                      cache_size=cls._cache_size,
+                                                      backend=cls._backend,
+                                                      bloom_fp_rate=cls._bloom_fp_rate)
             cls._shared_context_db = ContextDatabase(
                 key_value_db, is_shared=True)
 
@@ -63,7 +85,7 @@ class ContextDatabaseFactory(object):
             return cls.get_shared_db()
         else:
             path = os.path.join(cls._state_db_root_path, name)
-            return ContextDatabase.from_path(path)
+            return ContextDatabase.from_path(path, backend=cls._backend)
 
     @classmethod
     def close(cls):
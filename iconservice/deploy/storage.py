@@ -322,6 +322,10 @@ class Storage(StorageBase):
     def _create_db_key(prefix: bytes, src_key: bytes) -> bytes:
         return prefix + src_key
 
+    @classmethod
+    def make_deploy_info_key(cls, score_address: 'Address') -> bytes:
+        return cls._create_db_key(cls._DEPLOY_STORAGE_DEPLOY_INFO_PREFIX, score_address.to_bytes())
+
     def get_tx_hashes_by_score_address(self,
                                        context: 'IconScoreContext',
                                        score_address: 'Address') -> Tuple[Optional[bytes], Optional[bytes]]:
@@ -22,7 +22,8 @@ from .icon_constant import (
     ConfigKey, TERM_PERIOD, IISS_DAY_BLOCK, PREP_MAIN_PREPS,
     PREP_MAIN_AND_SUB_PREPS, PENALTY_GRACE_PERIOD, LOW_PRODUCTIVITY_PENALTY_THRESHOLD,
     BLOCK_VALIDATION_PENALTY_THRESHOLD, BACKUP_FILES, BLOCK_INVOKE_TIMEOUT_S,
-    IISS_INITIAL_IREP, PREP_REGISTRATION_FEE, UNSTAKE_SLOT_MAX)
+    IISS_INITIAL_IREP, PREP_REGISTRATION_FEE, UNSTAKE_SLOT_MAX, STATE_DB_CACHE_SIZE,
+    QUERY_THREAD_COUNT, PARALLEL_TX_WORKERS, BLOCK_PROFILE_COUNT, DBBackend, PRE_VALIDATION_CACHE_SIZE)
 
 _TAG = "CFG"
 ConfigValue = Union[bool, dict, float, int, str]
@@ -77,6 +78,17 @@ default_icon_config = {
     ConfigKey.BLOCK_INVOKE_TIMEOUT: BLOCK_INVOKE_TIMEOUT_S,
     ConfigKey.TBEARS_MODE: False,
     ConfigKey.UNSTAKE_SLOT_MAX: UNSTAKE_SLOT_MAX,
+    ConfigKey.STATE_DB_CACHE_SIZE: STATE_DB_CACHE_SIZE,
+    ConfigKey.STATE_DB_BACKEND: DBBackend.LEVELDB,
+    ConfigKey.STATE_DB_BLOOM_FP_RATE: 0.0,
+    ConfigKey.ACCOUNT_PREFETCH_FLAG: True,
+    ConfigKey.PRE_VALIDATION_CACHE_SIZE: PRE_VALIDATION_CACHE_SIZE,
+    ConfigKey.SCORE_TEMPLATE_FLAG: True,
+    ConfigKey.QUERY_THREAD_COUNT: QUERY_THREAD_COUNT,
+    ConfigKey.PARALLEL_TX_WORKERS: PARALLEL_TX_WORKERS,
+    ConfigKey.BLOCK_PROFILE_COUNT: BLOCK_PROFILE_COUNT,
+    ConfigKey.BLOCK_PROFILE_DUMP_FLAG: False,
+    ConfigKey.INVOKE_RECORD_PATH: "",
 }
 
 
@@ -186,6 +198,9 @@ class ConfigSanityChecker(object):
                 ConfigKey.LOG_ROTATE_MAX_BYTES: int,
                 ConfigKey.LOG_ROTATE_BACKUP_COUNT: int,
             },
+            ConfigKey.LOG_ASYNC: bool,
+            ConfigKey.LOG_PAYLOAD_MAX_SIZE: int,
+            ConfigKey.LOG_PAYLOAD_SAMPLE_INTERVAL: int,
         }
 
     @property
@@ -187,6 +187,12 @@ class ConfigKey:
     LOG_ROTATE_AT_TIME = "atTime"
     LOG_ROTATE_MAX_BYTES = "maxBytes"
     LOG_ROTATE_BACKUP_COUNT = "backupCount"
+    # Write log records on a helper thread which takes them from a queue
+    LOG_ASYNC = "async"
+    # The maximum length of a big payload like an invoke request in a log (0: unlimited)
+    LOG_PAYLOAD_MAX_SIZE = "payloadMaxSize"
+    # Log only one out of every N big payloads like invoke requests
+    LOG_PAYLOAD_SAMPLE_INTERVAL = "payloadSampleInterval"
     STEP_TRACE_FLAG = 'stepTraceFlag'
     PRECOMMIT_DATA_LOG_FLAG = 'precommitDataLogFlag'
 
@@ -219,6 +225,38 @@ class ConfigKey:
 
     UNSTAKE_SLOT_MAX = "unstakeSlotMax"
 
+    # The maximum size of read cache for state_db in bytes (0: disabled)
+    STATE_DB_CACHE_SIZE = "stateDbCacheSize"
+
+    # Storage backend of state_db: "leveldb", "memory" or "lmdb"
+    STATE_DB_BACKEND = "stateDbBackend"
+
+    # False positive rate of the bloom index which skips reading absent keys from state_db (0: disabled)
+    STATE_DB_BLOOM_FP_RATE = "stateDbBloomFpRate"
+
+    # Read the accounts in a block into the read cache of state_db on a helper thread before invoking it
+    ACCOUNT_PREFETCH_FLAG = "accountPrefetchFlag"
+
+    # The number of transactions whose input data sizes and stateless check results are kept by tx hash (0: disabled)
+    PRE_VALIDATION_CACHE_SIZE = "preValidationCacheSize"
+
+    # Create SCORE instances from a verified copy of their attributes instead of running __init__() every time
+    SCORE_TEMPLATE_FLAG = "scoreTemplateFlag"
+
+    # The number of threads which handle read-only queries
+    QUERY_THREAD_COUNT = "queryThreadCount"
+
+    # The number of threads which execute transactions speculatively on invoke (0: disabled)
+    PARALLEL_TX_WORKERS = "parallelTxWorkers"
+
+    # The number of the last blocks whose invoke profiles are kept (0: disabled)
+    BLOCK_PROFILE_COUNT = "blockProfileCount"
+    # Write the profile of each committed block to a json lines file in the log directory
+    BLOCK_PROFILE_DUMP_FLAG = "blockProfileDumpFlag"
+
+    # The json lines file to record invoke, write_precommit_state and rollback requests to ("": disabled)
+    INVOKE_RECORD_PATH = "invokeRecordPath"
+
 
 class EnableThreadFlag(IntFlag):
     INVOKE = 1
@@ -348,6 +386,29 @@ BACKUP_FILES = 10
 
 BLOCK_INVOKE_TIMEOUT_S = 15
 
+# 64MB read cache for committed states in state_db
+STATE_DB_CACHE_SIZE = 64 * 1024 * 1024
+
+# The bloom index of a db is saved to "<db path>.bloom" on close
+BLOOM_INDEX_FILE_SUFFIX = ".bloom"
+# Key of the random marker which a db shares with its saved bloom index until the db is opened again
+BLOOM_INDEX_MARKER_KEY = b"bloom_index_marker"
+
+QUERY_THREAD_COUNT = 1
+
+PRE_VALIDATION_CACHE_SIZE = 10_000
+
+PARALLEL_TX_WORKERS = 0
+
+BLOCK_PROFILE_COUNT = 16
+
+
+class DBBackend:
+    LEVELDB = "leveldb"
+    # Keeps all data in memory and loses it on close
+    MEMORY = "memory"
+    LMDB = "lmdb"
+
 
 class RCStatus(IntEnum):
     NOT_READY = 0
@@ -463,3 +524,4 @@ class RPCMethod:
     ICX_CALL = 'icx_call'
     ICX_SEND_TRANSACTION = 'icx_sendTransaction'
     DEBUG_ESTIMATE_STEP = "debug_estimateStep"
+    DEBUG_GET_BLOCK_PROFILES = "debug_getBlockProfiles"
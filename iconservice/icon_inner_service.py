@@ -14,8 +14,9 @@
 
 import asyncio
 import json
+from copy import deepcopy
 from concurrent.futures.thread import ThreadPoolExecutor
-from typing import Any, TYPE_CHECKING
+from typing import Any, TYPE_CHECKING, Optional
 
 from earlgrey import message_queue_task, MessageQueueStub, MessageQueueService
 
@@ -26,9 +27,11 @@ from iconservice.base.exception import ExceptionCode, IconServiceBaseException,
     FatalException, ServiceNotReadyException
 from iconservice.base.type_converter import TypeConverter, ParamType
 from iconservice.base.type_converter_templates import ConstantKeys
-from iconservice.icon_constant import EnableThreadFlag, ENABLE_THREAD_FLAG, RPCMethod
+from iconservice.icon_constant import EnableThreadFlag, ENABLE_THREAD_FLAG, RPCMethod, ConfigKey, QUERY_THREAD_COUNT
 from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.invoke_recorder import InvokeRecorder
 from iconservice.utils import check_error_response, to_camel_case, BytesToHexJSONEncoder, bytes_to_hex
+from iconservice.utils.log import PayloadLogger
 
 if TYPE_CHECKING:
     from earlgrey import RobustConnection
@@ -44,6 +47,7 @@ QUERY_THREAD_MAPPER = {
     RPCMethod.ICX_GET_TOTAL_SUPPLY: THREAD_STATUS,
     RPCMethod.ICX_GET_SCORE_API: THREAD_STATUS,
     RPCMethod.ISE_GET_STATUS: THREAD_STATUS,
+    RPCMethod.DEBUG_GET_BLOCK_PROFILES: THREAD_STATUS,
     RPCMethod.ICX_CALL: THREAD_QUERY,
     RPCMethod.DEBUG_ESTIMATE_STEP: THREAD_ESTIMATE
 }
@@ -51,6 +55,10 @@ QUERY_THREAD_MAPPER = {
 _TAG = "MQ"
 
 
+def _dump_response(response: dict) -> str:
+    return json.dumps(response, cls=BytesToHexJSONEncoder)
+
+
 class IconScoreInnerTask(object):
     def __init__(self, conf: dict):
         self._conf = conf
@@ -59,14 +67,67 @@ class IconScoreInnerTask(object):
         self._icon_service_engine = IconServiceEngine()
         self._open()
 
+        # Queries read the snapshot of state_db at the last committed block,
+        # so they can be run on multiple threads concurrently with invoke and commit
+        query_thread_count: int = self._get_query_thread_count(conf)
+
         self._thread_pool = {
             THREAD_INVOKE: ThreadPoolExecutor(1),
-            THREAD_STATUS: ThreadPoolExecutor(1),
-            THREAD_QUERY: ThreadPoolExecutor(1),
+            THREAD_STATUS: ThreadPoolExecutor(query_thread_count),
+            THREAD_QUERY: ThreadPoolExecutor(query_thread_count),
             THREAD_ESTIMATE: ThreadPoolExecutor(1),
             THREAD_VALIDATE: ThreadPoolExecutor(1)
         }
 
+        # Requests are recorded on the invoke thread only
+        self._invoke_recorder: Optional['InvokeRecorder'] = self._create_invoke_recorder(conf)
+        # Invoke requests and responses are logged on the invoke thread only
+        self._payload_logger: 'PayloadLogger' = self._create_payload_logger(conf)
+
+    @staticmethod
+    def _get_query_thread_count(conf: dict) -> int:
+        count: int = QUERY_THREAD_COUNT
+        try:
+            value: int = conf[ConfigKey.QUERY_THREAD_COUNT]
+            if value > 0:
+                count = value
+        except:
+            pass
+
+        Logger.info(tag=_TAG, msg=f"{ConfigKey.QUERY_THREAD_COUNT}: {count}")
+        return count
+
+    @staticmethod
+    def _create_invoke_recorder(conf: dict) -> Optional['InvokeRecorder']:
+        try:
+            path: str = conf[ConfigKey.INVOKE_RECORD_PATH]
+            if path:
+                Logger.info(tag=_TAG, msg=f"{ConfigKey.INVOKE_RECORD_PATH}: {path}")
+                return InvokeRecorder(path)
+        except:
+            pass
+
+        return None
+
+    @staticmethod
+    def _create_payload_logger(conf: dict) -> 'PayloadLogger':
+        max_size: int = 0
+        sample_interval: int = 1
+        try:
+            log_conf: dict = conf[ConfigKey.LOG]
+            max_size = log_conf.get(ConfigKey.LOG_PAYLOAD_MAX_SIZE, max_size)
+            sample_interval = log_conf.get(ConfigKey.LOG_PAYLOAD_SAMPLE_INTERVAL, sample_interval)
+        except:
+            pass
+
+        Logger.info(tag=_TAG, msg=f"{ConfigKey.LOG_PAYLOAD_MAX_SIZE}: {max_size} "
+                                  f"{ConfigKey.LOG_PAYLOAD_SAMPLE_INTERVAL}: {sample_interval}")
+        return PayloadLogger(max_size, sample_interval)
+
+    def _record(self, method: str, request: dict, response: dict):
+        if self._invoke_recorder is not None:
+            self._invoke_recorder.record(method, request, response)
+
     def _open(self):
         Logger.info(tag=_TAG, msg="_open() start")
         self._icon_service_engine.open(self._conf)
@@ -116,6 +177,10 @@ class IconScoreInnerTask(object):
             self._icon_service_engine.close()
             self._icon_service_engine = None
 
+        if self._invoke_recorder is not None:
+            self._invoke_recorder.close()
+            self._invoke_recorder = None
+
         Logger.info(tag=_TAG, msg="cleanup() end")
 
     @message_queue_task
@@ -150,7 +215,9 @@ class IconScoreInnerTask(object):
         :return:
         """
 
-        Logger.info(tag=_TAG, msg=f'INVOKE Request: {request}')
+        self._payload_logger.info(_TAG, "INVOKE Request", request)
+        # Records the request as it is received even if invoking it changes the request
+        recorded_request: Optional[dict] = None if self._invoke_recorder is None else deepcopy(request)
 
         try:
             params = TypeConverter.convert(request, ParamType.INVOKE)
@@ -208,7 +275,8 @@ class IconScoreInnerTask(object):
             if self._icon_service_engine:
                 self._icon_service_engine.clear_context_stack()
 
-        Logger.info(tag=_TAG, msg=f'INVOKE Response: {json.dumps(response, cls=BytesToHexJSONEncoder)}')
+        self._record(InvokeRecorder.INVOKE, recorded_request, response)
+        self._payload_logger.info(_TAG, "INVOKE Response", response, _dump_response)
         return response
 
     @message_queue_task
@@ -333,6 +401,7 @@ class IconScoreInnerTask(object):
             self._log_exception(e, _TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
 
+        self._record(InvokeRecorder.WRITE_PRECOMMIT_STATE, request, response)
         Logger.info(tag=_TAG, msg=f'WRITE_PRECOMMIT_STATE Response: {response}')
         return response
 
@@ -392,6 +461,7 @@ class IconScoreInnerTask(object):
             self._log_exception(e, _TAG)
             response = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
 
+        self._record(InvokeRecorder.ROLLBACK, request, response)
         Logger.info(tag=_TAG, msg=f"ROLLBACK Response: {response}")
         return response
 
@@ -411,19 +481,68 @@ class IconScoreInnerTask(object):
             converted_request = TypeConverter.convert(request, ParamType.VALIDATE_TRANSACTION)
             self._icon_service_engine.validate_transaction(converted_request)
             response = MakeResponse.make_response(ExceptionCode.OK)
-        except FatalException as e:
-            self._log_exception(e, _TAG)
-            response = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
-        except IconServiceBaseException as icon_e:
-            self._log_exception(icon_e, _TAG)
-            response = MakeResponse.make_error_response(icon_e.code, icon_e.message)
-        except Exception as e:
-            self._log_exception(e, _TAG)
-            response = MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
+        except BaseException as e:
+            response = self._make_validate_error_response(e)
 
         self._icon_service_engine.clear_context_stack()
         return response
 
+    @message_queue_task
+    async def validate_transactions(self, request: dict):
+        self._check_icon_service_ready()
+
+        if self._is_thread_flag_on(EnableThreadFlag.VALIDATE):
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._thread_pool[THREAD_VALIDATE],
+                                              self._validate_transactions, request)
+        else:
+            return self._validate_transactions(request)
+
+    def _validate_transactions(self, request: dict) -> dict:
+        """Validate transactions in a batch
+
+        :param request: {"transactions": [request of validate_transaction, ...]}
+        :return: {"transactions": [response of validate_transaction, ...]} in the order of the requests
+        """
+        tx_requests: list = request[ConstantKeys.TRANSACTIONS]
+        responses: list = [None] * len(tx_requests)
+
+        indexes: list = []
+        converted_requests: list = []
+        for i, tx_request in enumerate(tx_requests):
+            try:
+                converted_requests.append(TypeConverter.convert(tx_request, ParamType.VALIDATE_TRANSACTION))
+                indexes.append(i)
+            except BaseException as e:
+                responses[i] = self._make_validate_error_response(e)
+
+        try:
+            errors: list = self._icon_service_engine.validate_transactions(converted_requests)
+        except BaseException as e:
+            errors: list = [e] * len(converted_requests)
+
+        for i, error in zip(indexes, errors):
+            if error is None:
+                responses[i] = MakeResponse.make_response(ExceptionCode.OK)
+            else:
+                responses[i] = self._make_validate_error_response(error)
+
+        self._icon_service_engine.clear_context_stack()
+        return {ConstantKeys.TRANSACTIONS: responses}
+
+    def _make_validate_error_response(self, e: BaseException) -> dict:
+        if isinstance(e, FatalException):
+            self._log_exception(e, _TAG)
+            return MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
+        elif isinstance(e, IconServiceBaseException):
+            self._log_exception(e, _TAG)
+            return MakeResponse.make_error_response(e.code, e.message)
+        elif isinstance(e, Exception):
+            self._log_exception(e, _TAG)
+            return MakeResponse.make_error_response(ExceptionCode.SYSTEM_ERROR, str(e))
+
+        raise e
+
     @message_queue_task
     async def change_block_hash(self, _params):
         self._check_icon_service_ready()
@@ -32,6 +32,7 @@ from iconservice.icon_config import default_icon_config, check_config, args_to_d
 from iconservice.icon_constant import ICON_SERVICE_PROCTITLE_FORMAT, ICON_SCORE_QUEUE_NAME_FORMAT, ConfigKey
 from iconservice.icon_inner_service import IconScoreInnerService
 from iconservice.icon_service_cli import ExitCode
+from iconservice.utils.log import start_async_log, stop_async_log
 
 _TAG = 'CLI'
 
@@ -78,6 +79,8 @@ class IconService(object):
         loop = MessageQueueService.loop
         asyncio.set_event_loop(loop)
 
+        log_listener = self._start_async_log(config)
+
         try:
             self._inner_service = IconScoreInnerService(amqp_target, self._icon_score_queue_name, conf=config)
         except FatalException as e:
@@ -109,6 +112,8 @@ class IconService(object):
             # close icon service components
             self._inner_service.clean_close()
 
+            stop_async_log(log_listener)
+
             loop.close()
 
     @staticmethod
@@ -129,6 +134,17 @@ class IconService(object):
         Logger.debug(f"Get signal {signum}")
         asyncio.get_event_loop().stop()
 
+    @staticmethod
+    def _start_async_log(config: 'IconConfig'):
+        use_async_log: bool = False
+        try:
+            use_async_log = config[ConfigKey.LOG].get(ConfigKey.LOG_ASYNC, False)
+        except:
+            pass
+
+        Logger.info(tag=_TAG, msg=f"{ConfigKey.LOG_ASYNC}: {use_async_log}")
+        return start_async_log() if use_async_log else None
+
     def _set_icon_score_stub_params(self, channel: str, amqp_key: str, amqp_target: str):
         self._icon_score_queue_name = \
             ICON_SCORE_QUEUE_NAME_FORMAT.format(channel_name=channel, amqp_key=amqp_key)
@@ -15,9 +15,11 @@
 
 from copy import deepcopy
 from enum import IntEnum
+from logging import DEBUG
 
 import os
 import shutil
+import time
 from iconcommons.logger import Logger
 from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Union, Any
 
@@ -37,7 +39,8 @@ from .base.exception import (
 from .base.message import Message
 from .base.transaction import Transaction
 from .base.type_converter_templates import ConstantKeys
-from .database.db import KeyValueDatabase
+from .block_profiler import BlockProfiler, BlockProfile, TxProfile, PhaseTimer
+from .database.db import KeyValueDatabase, KeyValueDatabaseSnapshot
 from .database.factory import ContextDatabaseFactory
 from .database.wal import WriteAheadLogReader, WALDBType
 from .database.wal import WriteAheadLogWriter, IissWAL, StateWAL, WALState
@@ -47,10 +50,10 @@ from .icon_constant import (
     ICON_DEX_DB_NAME, IconServiceFlag, ConfigKey,
     Revision, BASE_TRANSACTION_INDEX,
     IISS_DB, STEP_LOG_TAG, BlockVoteStatus, WAL_LOG_TAG, ROLLBACK_LOG_TAG,
-    BLOCK_INVOKE_TIMEOUT_S, RevisionChangedFlag, RPCMethod
+    BLOCK_INVOKE_TIMEOUT_S, RevisionChangedFlag, RPCMethod, PARALLEL_TX_WORKERS, BLOCK_PROFILE_COUNT
 )
 from .iconscore.context.context import ContextContainer
-from .iconscore.icon_pre_validator import IconPreValidator
+from .iconscore.icon_pre_validator import IconPreValidator, PreValidationCache
 from .iconscore.icon_score_context import IconScoreContext, IconScoreFuncType, IconScoreContextFactory
 from .iconscore.icon_score_context import IconScoreContextType
 from .iconscore.icon_score_context_util import IconScoreContextUtil
@@ -73,17 +76,21 @@ from .iiss.storage import Storage as IISSStorage
 from .inner_call import inner_call
 from .inv import INVEngine, INVStorage
 from .meta import MetaDBStorage
+from .optimistic_executor import OptimisticTxExecutor
+from .account_prefetcher import AccountPrefetcher
 from .precommit_data_manager import PrecommitData, PrecommitDataManager, PrecommitDataWriter
 from .prep import PRepEngine, PRepStorage
 from .prep.data import PRep
 from .rollback.metadata import Metadata as RollbackMetadata
 from .utils import print_log_with_level
+from .utils.log import is_log_enabled
 from .utils import sha3_256, int_to_bytes, ContextEngine, ContextStorage
 from .utils import to_camel_case, bytes_to_hex
 from .utils.bloom import BloomFilter
 from .utils.timer import Timer
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
     from .iconscore.icon_score_event_log import EventLog
     from .prep.data import Term
 
@@ -105,6 +112,8 @@ class IconServiceEngine(ContextContainer):
         """
         self._icx_context_db = None
         self._icon_pre_validator = None
+        # Disabled until open() to compute input data sizes without it
+        self._pre_validation_cache = PreValidationCache(0)
         self._deposit_handler = None
         self._context_factory = None
         self._state_db_root_path: Optional[str] = None
@@ -115,6 +124,9 @@ class IconServiceEngine(ContextContainer):
         self._backup_cleaner: Optional[BackupCleaner] = None
         self._conf: Optional[Dict[str, Union[str, int]]] = None
         self._block_invoke_timeout_s: int = BLOCK_INVOKE_TIMEOUT_S
+        self._optimistic_tx_executor: Optional['OptimisticTxExecutor'] = None
+        self._account_prefetcher: Optional['AccountPrefetcher'] = None
+        self._block_profiler: Optional['BlockProfiler'] = None
 
         # JSON-RPC handlers
         self._handlers = {
@@ -124,12 +136,16 @@ class IconServiceEngine(ContextContainer):
             RPCMethod.ISE_GET_STATUS: self._handle_ise_get_status,
             RPCMethod.ICX_CALL: self._handle_icx_call,
             RPCMethod.DEBUG_ESTIMATE_STEP: self._handle_estimate_step,
+            RPCMethod.DEBUG_GET_BLOCK_PROFILES: self._handle_debug_get_block_profiles,
             RPCMethod.ICX_SEND_TRANSACTION: self._handle_icx_send_transaction
         }
 
         self._precommit_data_manager = PrecommitDataManager()
         self._precommit_data_writer: Optional['PrecommitDataWriter'] = None
 
+        # (the last committed block, the snapshot of state_db at that block) shared by query threads
+        self._query_state: Tuple[Optional['Block'], Optional['KeyValueDatabaseSnapshot']] = (None, None)
+
     def open(self, conf: dict):
         """Get necessary parameters and initialize diverse objects
 
@@ -152,7 +168,11 @@ class IconServiceEngine(ContextContainer):
         os.makedirs(backup_root_path, exist_ok=True)
 
         # Share one context db with all SCORE
-        ContextDatabaseFactory.open(state_db_root_path, ContextDatabaseFactory.Mode.SINGLE_DB)
+        ContextDatabaseFactory.open(state_db_root_path,
+                                    ContextDatabaseFactory.Mode.SINGLE_DB,
+                                    conf[ConfigKey.STATE_DB_CACHE_SIZE],
+                                    conf[ConfigKey.STATE_DB_BACKEND],
+                                    conf[ConfigKey.STATE_DB_BLOOM_FP_RATE])
         self._state_db_root_path = state_db_root_path
         self._rc_data_path = rc_data_path
         self._backup_root_path = backup_root_path
@@ -161,7 +181,8 @@ class IconServiceEngine(ContextContainer):
         self._context_factory = IconScoreContextFactory()
 
         self._deposit_handler = DepositHandler()
-        self._icon_pre_validator = IconPreValidator()
+        self._pre_validation_cache = PreValidationCache(conf[ConfigKey.PRE_VALIDATION_CACHE_SIZE])
+        self._icon_pre_validator = IconPreValidator(self._pre_validation_cache)
         self._backup_manager = BackupManager(backup_root_path, rc_data_path)
         self._backup_cleaner = BackupCleaner(backup_root_path, conf[ConfigKey.BACKUP_FILES])
 
@@ -176,6 +197,7 @@ class IconServiceEngine(ContextContainer):
         IconScoreContext.term_period = conf[ConfigKey.TERM_PERIOD]
         IconScoreContext.set_decentralize_trigger(conf[ConfigKey.DECENTRALIZE_TRIGGER])
         IconScoreContext.step_trace_flag = conf[ConfigKey.STEP_TRACE_FLAG]
+        IconScoreContext.score_template_flag = conf[ConfigKey.SCORE_TEMPLATE_FLAG]
         IconScoreContext.log_level = conf[ConfigKey.LOG][ConfigKey.LOG_LEVEL]
         IconScoreContext.precommitdata_log_flag = conf[ConfigKey.PRECOMMIT_DATA_LOG_FLAG]
         IconScoreContext.unstake_slot_max = conf[ConfigKey.UNSTAKE_SLOT_MAX]
@@ -218,6 +240,9 @@ class IconServiceEngine(ContextContainer):
         self._set_block_invoke_timeout(conf)
 
         self._set_block_invoke_timeout(conf)
+        self._set_optimistic_tx_executor(conf)
+        self._set_account_prefetcher(conf)
+        self._set_block_profiler(conf, log_dir)
 
         # DO NOT change the values in conf
         self._conf = conf
@@ -249,6 +274,28 @@ class IconServiceEngine(ContextContainer):
         context.storage.icx.load_last_block_info(context)
         self._precommit_data_manager.init(IconScoreContext.storage.icx.last_block)
         context.block = self._get_last_block()
+        self._update_query_state()
+
+    def _update_query_state(self):
+        """Pin the contexts for query to the last committed block and the state_db snapshot at that block
+
+        It MUST be called on the thread which commits blocks
+        """
+        snapshot: 'KeyValueDatabaseSnapshot' = self._icx_context_db.key_value_db.get_snapshot()
+        self._query_state = (self._get_last_block(), snapshot)
+
+    def _create_query_context(self, context_type: 'IconScoreContextType') -> 'IconScoreContext':
+        """Create a context reading the state at the last committed block
+        The block and the snapshot are replaced together, so a query never sees a half-applied write_batch
+
+        :param context_type: QUERY or ESTIMATION
+        :return:
+        """
+        block, snapshot = self._query_state
+        if block is None:
+            block = self._get_last_block()
+
+        return self._context_factory.create(context_type, block=block, state_db_snapshot=snapshot)
 
     @classmethod
     def _open_component_context(cls,
@@ -366,6 +413,16 @@ class IconServiceEngine(ContextContainer):
             IconScoreClassLoader.close(context.score_root_path)
         finally:
             self._pop_context()
+            _, snapshot = self._query_state
+            if snapshot is not None:
+                snapshot.close()
+            self._query_state = (None, None)
+            if self._optimistic_tx_executor is not None:
+                self._optimistic_tx_executor.close()
+                self._optimistic_tx_executor = None
+            if self._account_prefetcher is not None:
+                self._account_prefetcher.close()
+                self._account_prefetcher = None
             ContextDatabaseFactory.close()
             self._clear_context()
 
@@ -410,32 +467,46 @@ class IconServiceEngine(ContextContainer):
         # Check for block validation before invoke
         self._precommit_data_manager.validate_block_to_invoke(block)
 
-        context: 'IconScoreContext' = self._context_factory.create(
-            IconScoreContextType.INVOKE,
-            block=block,
-            prev_block_batches=self._precommit_data_manager.get_block_batches(block.prev_hash))
+        invoke_start: float = time.perf_counter()
 
-        # TODO: prev_block_votes must be support to low version about prev_block_validators by using meta storage.
-        prev_block_votes: Optional[List[Tuple['Address', int]]] = \
-            self._get_prev_block_votes(context,
-                                       prev_block_generator,
-                                       prev_block_validators,
-                                       prev_block_votes)
-        prev_block_generator = \
-            context.prep_address_converter.get_prep_address_from_node_address(prev_block_generator)
-
-        # For RC DB
-        rc_db_revision: int = self._get_rc_db_revision_before_process_transactions(context)
-
-        block_result = []
-        added_transactions = {}
+        # Accounts are read on a helper thread while the block is prepared for its transactions
+        prefetch: Optional['Future'] = None
+        if self._account_prefetcher is not None and block.height > 0:
+            prefetch = self._account_prefetcher.start(tx_requests)
+        block_profile: Optional['BlockProfile'] = BlockProfile(block) if self._block_profiler else None
 
-        self._before_transaction_process(context,
-                                         is_block_editable,
-                                         tx_requests,
-                                         added_transactions,
-                                         prev_block_generator,
-                                         prev_block_votes)
+        try:
+            context: 'IconScoreContext' = self._context_factory.create(
+                IconScoreContextType.INVOKE,
+                block=block,
+                prev_block_batches=self._precommit_data_manager.get_block_batches(block.prev_hash))
+
+            # TODO: prev_block_votes must be support to low version about prev_block_validators by using meta storage.
+            prev_block_votes: Optional[List[Tuple['Address', int]]] = \
+                self._get_prev_block_votes(context,
+                                           prev_block_generator,
+                                           prev_block_validators,
+                                           prev_block_votes)
+            prev_block_generator = \
+                context.prep_address_converter.get_prep_address_from_node_address(prev_block_generator)
+
+            # For RC DB
+            rc_db_revision: int = self._get_rc_db_revision_before_process_transactions(context)
+
+            block_result = []
+            added_transactions = {}
+
+            self._before_transaction_process(context,
+                                             is_block_editable,
+                                             tx_requests,
+                                             added_transactions,
+                                             prev_block_generator,
+                                             prev_block_votes)
+        finally:
+            # The prefetch never runs beyond this invoke even if it fails here
+            AccountPrefetcher.wait(prefetch)
+        if block_profile is not None:
+            block_profile.before_tx_process_elapsed = time.perf_counter() - invoke_start
 
         if block.height == 0:
             # Assume that there is only one tx in genesis_block
@@ -447,8 +518,16 @@ class IconServiceEngine(ContextContainer):
             tx_timer = Timer()
             tx_timer.start()
 
+            optimistic_tx_executor: Optional['OptimisticTxExecutor'] = self._optimistic_tx_executor
+            if optimistic_tx_executor is not None:
+                optimistic_tx_executor.clear()
+
+            # Requests and results are formatted only if they are logged
+            debug_log: bool = is_log_enabled(DEBUG)
+
             for index, tx_request in enumerate(tx_requests):
-                Logger.debug(_TAG, f"INVOKE tx: {tx_request}")
+                if debug_log:
+                    Logger.debug(tag=_TAG, msg=f"INVOKE tx: {tx_request}")
 
                 # Adjust the number of transactions in a block to make sure that
                 # a leader can broadcast a block candidate to validators in a specific period.
@@ -458,14 +537,25 @@ class IconServiceEngine(ContextContainer):
                         msg=f"Stop to invoke remaining transactions: {index} / {len(tx_requests)}")
                     break
 
+                tx_start: float = time.perf_counter()
+                if block_profile is not None:
+                    context.tx_profile = TxProfile(index, tx_request)
+
                 if index == BASE_TRANSACTION_INDEX and context.is_decentralized():
                     if not tx_request['params'].get('dataType') == "base":
                         raise InvalidBaseTransactionException(
                             "Invalid block: first transaction must be an base transaction")
                     tx_result = self._invoke_base_request(context, tx_request, is_block_editable)
+                elif optimistic_tx_executor is not None:
+                    tx_result = optimistic_tx_executor.invoke(context, tx_requests, index)
                 else:
                     tx_result = self._invoke_request(context, tx_request, index)
 
+                if block_profile is not None:
+                    context.tx_profile.set_result(tx_result, time.perf_counter() - tx_start)
+                    block_profile.txs.append(context.tx_profile)
+                    context.tx_profile = None
+
                 self._log_step_trace(context)
                 block_result.append(tx_result)
                 context.update_batch()
@@ -479,7 +569,8 @@ class IconServiceEngine(ContextContainer):
                 if context.revision >= Revision.IISS.value:
                     context.block_batch.block.cumulative_fee += tx_result.step_price * tx_result.step_used
 
-                Logger.debug(_TAG, f"INVOKE txResult: {tx_result}")
+                if debug_log:
+                    Logger.debug(tag=_TAG, msg=f"INVOKE txResult: {tx_result}")
 
         if self._check_end_block_height_of_calc(context):
             context.revision_changed_flag |= RevisionChangedFlag.IISS_CALC
@@ -492,10 +583,13 @@ class IconServiceEngine(ContextContainer):
                 # change the reward calculation period from 43200 to 43120 which is the same as term_period
                 context.storage.iiss.put_calc_period(context, context.term_period)
 
+        after_tx_process_start: float = time.perf_counter()
         next_preps, term, rc_state_hash = self._after_transaction_process(context,
                                                                           rc_db_revision,
                                                                           prev_block_generator,
                                                                           prev_block_votes)
+        if block_profile is not None:
+            block_profile.after_tx_process_elapsed = time.perf_counter() - after_tx_process_start
 
         # Save precommit data
         # It will be written to levelDB on commit
@@ -518,6 +612,11 @@ class IconServiceEngine(ContextContainer):
             Logger.info(tag=_TAG,
                         msg=f"Created precommit_data: \n{precommit_data}")
         self._precommit_data_manager.push(precommit_data)
+
+        if block_profile is not None:
+            block_profile.invoke_elapsed = time.perf_counter() - invoke_start
+            self._block_profiler.add(block_profile)
+
         return \
             block_result, \
             precommit_data.state_root_hash, \
@@ -973,7 +1072,7 @@ class IconServiceEngine(ContextContainer):
         from_: Address = params['from']
         to: Address = params['to']
 
-        last_block: 'Block' = self._get_last_block()
+        last_block: 'Block' = context.block
         timestamp = params.get('timestamp', last_block.timestamp)
         context.tx = Transaction(tx_hash=sha3_256(int_to_bytes(timestamp)),
                                  index=0,
@@ -1010,7 +1109,7 @@ class IconServiceEngine(ContextContainer):
 
         :return: The amount of step
         """
-        context = self._context_factory.create(IconScoreContextType.ESTIMATION, block=self._get_last_block())
+        context = self._create_query_context(IconScoreContextType.ESTIMATION)
         context.set_step_counter()
 
         params: dict = request['params']
@@ -1037,10 +1136,7 @@ class IconServiceEngine(ContextContainer):
         :param params:
         :return: the result of query
         """
-        context: 'IconScoreContext' = self._context_factory.create(
-            IconScoreContextType.QUERY,
-            block=self._get_last_block()
-        )
+        context: 'IconScoreContext' = self._create_query_context(IconScoreContextType.QUERY)
 
         if params:
             from_: 'Address' = params.get('from', None)
@@ -1070,37 +1166,78 @@ class IconServiceEngine(ContextContainer):
         """
         assert self._get_context_stack_size() == 0
 
-        method = request['method']
-        assert method in ('icx_sendTransaction', 'debug_estimateStep')
-        assert 'params' in request
-
-        params: dict = request['params']
-        to: 'Address' = params.get('to')
-
-        context = self._context_factory.create(IconScoreContextType.QUERY, self._get_last_block())
+        context = self._create_query_context(IconScoreContextType.QUERY)
         context.set_step_counter()
 
         try:
             self._push_context(context)
+            self._validate_transaction(context, request)
+        finally:
+            self._pop_context()
+
+    def validate_transactions(self, requests: List[dict]) -> List[Optional[BaseException]]:
+        """Validate JSON-RPC transaction requests in a batch
+        before putting them into transaction pool
+
+        All requests are validated on one context reading the same block,
+        and the accounts which they refer to are read from state_db at once
+
+        :param requests: JSON-RPC requests
+            values in requests have already been converted to original format
+            in IconInnerService
+        :return: None for a valid request or the exception raised on validating it, in the order of requests
+        """
+        assert self._get_context_stack_size() == 0
 
-            step_price: int = context.step_counter.step_price
-            minimum_step: int = context.inv_container.step_costs.get(StepType.DEFAULT, 0)
+        context = self._create_query_context(IconScoreContextType.QUERY)
+        context.set_step_counter()
 
-            if 'data' in params:
-                # minimum_step is the sum of
-                # default STEP cost and input STEP costs if data field exists
-                data = params['data']
-                input_size = get_input_data_size(context.revision, data)
-                minimum_step += input_size * context.inv_container.step_costs.get(StepType.INPUT, 0)
+        errors: List[Optional[BaseException]] = []
 
-            self._icon_pre_validator.execute(context, params, step_price, minimum_step)
+        try:
+            self._push_context(context)
 
-            # SCORE updating is not blocked by SCORE blacklist
-            if 'dataType' in params and params['dataType'] == 'call':
-                IconScoreContextUtil.validate_score_blacklist(context, to)
+            # Load the states to check balances and SCOREs into the read cache of state_db
+            if self._icx_context_db.key_value_db.cache is not None:
+                self._icx_context_db.multi_get(context, AccountPrefetcher.make_keys(requests))
+
+            for request in requests:
+                try:
+                    self._validate_transaction(context, request)
+                    errors.append(None)
+                except BaseException as e:
+                    # The traceback refers to the context, which pins a snapshot of state_db
+                    errors.append(e.with_traceback(None))
         finally:
             self._pop_context()
 
+        return errors
+
+    def _validate_transaction(self, context: 'IconScoreContext', request: dict):
+        method = request['method']
+        assert method in ('icx_sendTransaction', 'debug_estimateStep')
+        assert 'params' in request
+
+        params: dict = request['params']
+        to: 'Address' = params.get('to')
+
+        step_price: int = context.step_counter.step_price
+        minimum_step: int = context.inv_container.step_costs.get(StepType.DEFAULT, 0)
+
+        if 'data' in params:
+            # minimum_step is the sum of
+            # default STEP cost and input STEP costs if data field exists
+            data = params['data']
+            input_size = self._pre_validation_cache.get_input_data_size(
+                params.get('txHash'), context.revision, data)
+            minimum_step += input_size * context.inv_container.step_costs.get(StepType.INPUT, 0)
+
+        self._icon_pre_validator.execute(context, params, step_price, minimum_step)
+
+        # SCORE updating is not blocked by SCORE blacklist
+        if 'dataType' in params and params['dataType'] == 'call':
+            IconScoreContextUtil.validate_score_blacklist(context, to)
+
     def _call(self,
               context: 'IconScoreContext',
               method: str,
@@ -1265,7 +1402,8 @@ class IconServiceEngine(ContextContainer):
 
         # Every send_transaction are calculated DEFAULT STEP at first
         context.step_counter.apply_step(StepType.DEFAULT, 1)
-        input_size = get_input_data_size(context.revision, params.get('data', None))
+        input_size = self._pre_validation_cache.get_input_data_size(
+            params.get('txHash'), context.revision, params.get('data', None), update=False)
         context.step_counter.apply_step(StepType.INPUT, input_size)
 
         to: Address = params['to']
@@ -1452,15 +1590,11 @@ class IconServiceEngine(ContextContainer):
         :param event_logs: The event logs
         :return: Bloom data
         """
-        logs_bloom = BloomFilter()
-
+        bloom_bits: int = 0
         for event_log in event_logs:
-            logs_bloom.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
-            for i, indexed_item in enumerate(event_log.indexed):
-                indexed_bytes = EventLogEmitter.get_ordered_bytes(i, indexed_item)
-                logs_bloom.add(indexed_bytes)
+            bloom_bits |= event_log.get_bloom_bits()
 
-        return logs_bloom
+        return BloomFilter(bloom_bits)
 
     @classmethod
     def _handle_icx_get_score_api(cls,
@@ -1478,12 +1612,35 @@ class IconServiceEngine(ContextContainer):
         return IconScoreEngine.get_score_api(
             context, icon_score_address)
 
+    def _handle_debug_get_block_profiles(self, _context: 'IconScoreContext', params: dict) -> list:
+        """Returns the profiles of the last blocks invoked, the latest one first
+
+        :param _context:
+        :param params: {"count": the maximum number of profiles to return}
+        :return:
+        """
+        if self._block_profiler is None:
+            return []
+
+        count: Optional[int] = params.get(ConstantKeys.COUNT) if params else None
+        return self._block_profiler.get_profiles(count)
+
     def _handle_ise_get_status(self, _context: 'IconScoreContext', params: dict) -> dict:
 
         response = dict()
         if not bool(params) or params.get('filter'):
             last_block_status = self._make_last_block_status()
             response['lastBlock'] = last_block_status
+
+        filter_: Optional[list] = params.get('filter') if params else None
+        if not filter_ or 'stateDbCache' in filter_:
+            cache_status: Optional[dict] = self._icx_context_db.key_value_db.get_cache_status()
+            if cache_status is not None:
+                response['stateDbCache'] = cache_status
+        if not filter_ or 'stateDbBloom' in filter_:
+            bloom_status: Optional[dict] = self._icx_context_db.key_value_db.get_bloom_status()
+            if bloom_status is not None:
+                response['stateDbBloom'] = bloom_status
         return response
 
     def _make_last_block_status(self) -> Optional[dict]:
@@ -1513,6 +1670,9 @@ class IconServiceEngine(ContextContainer):
         :param instant_block_hash: instant hash of block being committed
         :param block_hash: hash of block being committed
         """
+        commit_start: float = time.perf_counter()
+        timer = PhaseTimer()
+
         if instant_block_hash != block_hash:
             # Only a leader node replaces the instant_block_hash with an official block_hash
             self._precommit_data_manager.change_block_hash(
@@ -1526,20 +1686,27 @@ class IconServiceEngine(ContextContainer):
         precommit_data.block_batch.set_block_to_batch(precommit_data.revision)
 
         context = self._context_factory.create(IconScoreContextType.DIRECT, block=precommit_data.block)
+        timer.lap("prepare")
 
         if precommit_data.revision < Revision.IISS.value:
-            self._commit_before_iiss(context, precommit_data)
+            self._commit_before_iiss(context, precommit_data, timer)
         else:
-            self._commit_after_iiss(context, precommit_data, instant_block_hash)
+            self._commit_after_iiss(context, precommit_data, instant_block_hash, timer)
 
-    def _commit_before_iiss(self, context: 'IconScoreContext', precommit_data: 'PrecommitData'):
+        if self._block_profiler is not None:
+            self._block_profiler.commit(
+                instant_block_hash, block_hash, time.perf_counter() - commit_start, timer.phases)
+
+    def _commit_before_iiss(self, context: 'IconScoreContext', precommit_data: 'PrecommitData', timer: 'PhaseTimer'):
         state_wal: 'StateWAL' = StateWAL(precommit_data.block_batch)
         self._process_state_commit(context, precommit_data, state_wal)
+        timer.lap("stateDb")
 
     def _commit_after_iiss(self,
                            context: 'IconScoreContext',
                            precommit_data: 'PrecommitData',
-                           instant_block_hash: bytes):
+                           instant_block_hash: bytes,
+                           timer: 'PhaseTimer'):
         # Check if this block is the start block of a calculation period
         start_calc_block_height: int = context.engine.iiss.get_start_block_of_calc(context)
         is_calc_period_start_block: bool = context.block.height == start_calc_block_height
@@ -1547,6 +1714,7 @@ class IconServiceEngine(ContextContainer):
         wal_writer, state_wal, iiss_wal = \
             self._process_wal(context, precommit_data, is_calc_period_start_block, instant_block_hash)
         wal_writer.flush()
+        timer.lap("wal")
 
         # Backup the previous block state
         self._backup_manager.run(
@@ -1561,21 +1729,25 @@ class IconServiceEngine(ContextContainer):
 
         # Clean up the oldest backup file
         self._backup_cleaner.run_on_commit(context.block.height)
+        timer.lap("backup")
 
         # Write iiss_wal to rc_db
         standby_db_info: Optional['RewardCalcDBInfo'] = \
             self._process_iiss_commit(context, precommit_data, iiss_wal, is_calc_period_start_block)
         wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
         wal_writer.flush()
+        timer.lap("rcDb")
 
         # Write state_wal to state_db
         self._process_state_commit(context, precommit_data, state_wal)
         wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
         wal_writer.flush()
+        timer.lap("stateDb")
 
         # send IPC
         self._process_ipc(context, wal_writer, precommit_data, standby_db_info, instant_block_hash)
         wal_writer.close()
+        timer.lap("ipc")
 
         try:
             os.remove(self._get_write_ahead_log_path())
@@ -1634,6 +1806,7 @@ class IconServiceEngine(ContextContainer):
         context.storage.icx.set_last_block(precommit_data.block_batch.block)
         context.engine.inv.commit(context, precommit_data)
         self._precommit_data_manager.commit(precommit_data.block_batch.block)
+        self._update_query_state()
 
     @staticmethod
     def _process_iiss_commit(context: 'IconScoreContext',
@@ -1824,9 +1997,7 @@ class IconServiceEngine(ContextContainer):
         return self._precommit_data_manager.last_block
 
     def inner_call(self, request: dict):
-        context: 'IconScoreContext' = self._context_factory.create(
-            IconScoreContextType.QUERY, block=self._get_last_block()
-        )
+        context: 'IconScoreContext' = self._create_query_context(IconScoreContextType.QUERY)
 
         return inner_call(context, request)
 
@@ -2076,6 +2247,47 @@ class IconServiceEngine(ContextContainer):
 
         Logger.info(tag=_TAG, msg=f"{ConfigKey.BLOCK_INVOKE_TIMEOUT}: {self._block_invoke_timeout_s}")
 
+    def _set_block_profiler(self, conf: Dict[str, Union[str, int]], log_dir: str):
+        count: int = BLOCK_PROFILE_COUNT
+        dump_flag: bool = False
+        try:
+            count = conf[ConfigKey.BLOCK_PROFILE_COUNT]
+            dump_flag = conf[ConfigKey.BLOCK_PROFILE_DUMP_FLAG]
+        except:
+            pass
+
+        if count > 0:
+            self._block_profiler = BlockProfiler(count, log_dir if dump_flag else None)
+
+        Logger.info(tag=_TAG, msg=f"{ConfigKey.BLOCK_PROFILE_COUNT}: {count} "
+                                  f"{ConfigKey.BLOCK_PROFILE_DUMP_FLAG}: {dump_flag}")
+
+    def _set_optimistic_tx_executor(self, conf: Dict[str, Union[str, int]]):
+        workers: int = PARALLEL_TX_WORKERS
+        try:
+            workers = conf[ConfigKey.PARALLEL_TX_WORKERS]
+        except:
+            pass
+
+        if workers > 0:
+            self._optimistic_tx_executor = OptimisticTxExecutor(self._invoke_request, workers)
+
+        Logger.info(tag=_TAG, msg=f"{ConfigKey.PARALLEL_TX_WORKERS}: {workers}")
+
+    def _set_account_prefetcher(self, conf: Dict[str, Union[str, int]]):
+        flag: bool = True
+        try:
+            flag = conf[ConfigKey.ACCOUNT_PREFETCH_FLAG]
+        except:
+            pass
+
+        # Prefetched states are kept only in the read cache of state_db
+        key_value_db: 'KeyValueDatabase' = self._icx_context_db.key_value_db
+        if flag and key_value_db.cache is not None:
+            self._account_prefetcher = AccountPrefetcher(key_value_db)
+
+        Logger.info(tag=_TAG, msg=f"{ConfigKey.ACCOUNT_PREFETCH_FLAG}: {flag}")
+
     def _continue_to_invoke(self, tx_request: Dict, tx_timer: 'Timer') -> bool:
         """If this is a block created by a leader,
         check to continue transaction invoking with block_invoke_timeout
@@ -14,7 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TypeVar, Optional, Any, Union, TYPE_CHECKING
+import copy
+from typing import TypeVar, Optional, Any, Union, TYPE_CHECKING, List
 
 from iconservice.icon_constant import IconScoreContextType, Revision
 from .context.context import ContextContainer
@@ -156,6 +157,34 @@ class ContainerUtil(object):
                 db.put(db_key, db_value)
 
 
+class CachedValue(object):
+    """Decoded value of a key in a container, which is reused while its version in a transaction is the same
+
+    Using a cached value still notifies the observer of the db, so it is charged as if it is read from the db.
+    """
+
+    def __init__(self, key: bytes, value_type: type) -> None:
+        self._key = key
+        self._value_type = value_type
+        # (version, value read from the db, decoded value)
+        self._entry: Optional[tuple] = None
+
+    def get(self, db: Union['IconScoreDatabase', 'IconScoreSubDatabase']) -> Any:
+        version: Optional[tuple] = db._get_version(self._key)
+        entry: Optional[tuple] = self._entry
+        if version is not None and entry is not None:
+            generation, batch_value = entry[0]
+            if generation == version[0] and batch_value is version[1]:
+                db._on_cached_get(self._key, entry[1])
+                return entry[2]
+
+        value: Optional[bytes] = db.get(self._key)
+        obj = ContainerUtil.decode_object(value, self._value_type)
+        if version is not None:
+            self._entry = (version, value, obj)
+        return obj
+
+
 class DictDB(object):
     """
     Utility classes wrapping the state DB.
@@ -178,6 +207,11 @@ class DictDB(object):
         self.__value_type = value_type
         self.__depth = depth
 
+    def _copy(self) -> 'DictDB':
+        """Returns a copy which shares the db, for another instance of a SCORE
+        """
+        return copy.copy(self)
+
     def remove(self, key: K) -> None:
         """
         Removes the value of given key
@@ -230,13 +264,23 @@ class ArrayDB(object):
     """
     __SIZE = 'size'
     __SIZE_BYTE_KEY = get_encoded_key(__SIZE)
+    # The number of elements which are read at once on iteration
+    READ_AHEAD_SIZE = 64
 
     def __init__(self, var_key: K, db: 'IconScoreDatabase', value_type: type) -> None:
         prefix: bytes = ContainerUtil.create_db_prefix(type(self), var_key)
         self._db = db.get_sub_db(prefix)
         self.__value_type = value_type
+        self.__size = CachedValue(self.__SIZE_BYTE_KEY, int)
         self.__legacy_size = self.__get_size_from_db()
 
+    def _copy(self) -> 'ArrayDB':
+        """Returns a copy which shares the db but not the cached size, for another instance of a SCORE
+        """
+        array_db: 'ArrayDB' = copy.copy(self)
+        array_db.__size = CachedValue(self.__SIZE_BYTE_KEY, int)
+        return array_db
+
     def put(self, value: V) -> None:
         """
         Puts the value at the end of array
@@ -279,7 +323,12 @@ class ArrayDB(object):
             return self.__get_size_from_db()
 
     def __get_size_from_db(self) -> int:
-        return ContainerUtil.decode_object(self._db.get(self.__SIZE_BYTE_KEY), int)
+        return self.__size.get(self._db)
+
+    def _get_size_key(self) -> bytes:
+        """Returns the key which is passed to IconScoreDatabase.get() to read the size
+        """
+        return self._db._hash_key(self.__SIZE_BYTE_KEY)
 
     def __set_size(self, size: int) -> None:
         self.__legacy_size = size
@@ -343,8 +392,15 @@ class ArrayDB(object):
 
     @classmethod
     def _get_generator(cls, db: Union['IconScoreDatabase', 'IconScoreSubDatabase'], size: int, value_type: type):
-        for index in range(size):
-            yield cls._get(db, size, index, value_type)
+        """Reads the elements of a contiguous run of indexes in one call and yields them one by one
+
+        Each element is charged when it is yielded as if it is read by itself.
+        """
+        for start in range(0, size, cls.READ_AHEAD_SIZE):
+            stop: int = min(start + cls.READ_AHEAD_SIZE, size)
+            keys: List[bytes] = [get_encoded_key(index) for index in range(start, stop)]
+            for key, entry in zip(keys, db._read_ahead(keys)):
+                yield ContainerUtil.decode_object(db._get_read_ahead(key, entry), value_type)
 
 
 class VarDB(object):
@@ -361,6 +417,14 @@ class VarDB(object):
         self._db = db.get_sub_db(VAR_DB_ID)
         self.__var_byte_key = get_encoded_key(var_key)
         self.__value_type = value_type
+        self.__value = CachedValue(self.__var_byte_key, value_type)
+
+    def _copy(self) -> 'VarDB':
+        """Returns a copy which shares the db but not the cached value, for another instance of a SCORE
+        """
+        var_db: 'VarDB' = copy.copy(self)
+        var_db.__value = CachedValue(self.__var_byte_key, self.__value_type)
+        return var_db
 
     def set(self, value: V) -> None:
         """
@@ -377,7 +441,7 @@ class VarDB(object):
 
         :return: value of the var db
         """
-        return ContainerUtil.decode_object(self._db.get(self.__var_byte_key), self.__value_type)
+        return self.__value.get(self._db)
 
     def remove(self) -> None:
         """
@@ -14,7 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Any
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Optional
 
 from iconcommons.logger import Logger
 
@@ -32,16 +34,90 @@ if TYPE_CHECKING:
 TAG = "PV"
 
 
+class PreValidationCache(object):
+    """Bounded cache of the input data sizes and stateless check results of transactions by tx hash
+
+    validate_transaction fills it before a transaction is put into the tx pool
+    and invoke reads it instead of computing the same values again.
+    A tx hash is the hash of the whole transaction including its data, so the values are never stale.
+    """
+
+    def __init__(self, max_count: int):
+        """Constructor
+
+        :param max_count: the number of transactions to keep (0: disabled)
+        """
+        self._max_count: int = max_count
+        # tx_hash -> [{revision: input data size}, stateless checks passed]
+        self._items: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def _get_item(self, tx_hash: Optional[bytes], create: bool) -> Optional[list]:
+        if self._max_count <= 0 or tx_hash is None:
+            return None
+
+        with self._lock:
+            item: Optional[list] = self._items.get(tx_hash)
+            if item is not None:
+                self._items.move_to_end(tx_hash)
+            elif create:
+                item = [{}, False]
+                self._items[tx_hash] = item
+                if len(self._items) > self._max_count:
+                    self._items.popitem(last=False)
+
+            return item
+
+    def get_input_data_size(self, tx_hash: Optional[bytes], revision: int, input_data: Any, update: bool = True) -> int:
+        """Returns the size of input data of a transaction
+
+        :param tx_hash: tx hash. The size is not cached if it is None
+        :param revision:
+        :param input_data: input data of the transaction
+        :param update: whether to cache the size if it is not cached yet
+        :return: size of input data
+        """
+        item: Optional[list] = self._get_item(tx_hash, update)
+        if item is None:
+            return get_input_data_size(revision, input_data)
+
+        size: Optional[int] = item[0].get(revision)
+        if size is None:
+            size = get_input_data_size(revision, input_data)
+            item[0][revision] = size
+
+        return size
+
+    def is_checked(self, tx_hash: Optional[bytes]) -> bool:
+        """Returns True if the stateless checks of a transaction have passed
+
+        :param tx_hash:
+        :return:
+        """
+        item: Optional[list] = self._get_item(tx_hash, False)
+        return item is not None and item[1]
+
+    def set_checked(self, tx_hash: Optional[bytes]):
+        item: Optional[list] = self._get_item(tx_hash, True)
+        if item is not None:
+            item[1] = True
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 class IconPreValidator:
     """Validate only icx_sendTransaction request before putting it into tx pool
 
     It does not validate query requests like icx_getBalance, icx_call and so on
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache: Optional['PreValidationCache'] = None) -> None:
         """Constructor
+
+        :param cache: skips the stateless checks of the transactions which have passed them
         """
-        pass
+        self._cache: 'PreValidationCache' = PreValidationCache(0) if cache is None else cache
 
     def execute(self, context: 'IconScoreContext', params: dict, step_price: int, minimum_step: int):
         """Validate a transaction on icx_sendTransaction
@@ -56,15 +132,10 @@ class IconPreValidator:
         :param minimum_step: minimum step
         """
 
-        self._check_input_data(params)
-
-        value: int = params.get('value', 0)
-        if value < 0:
-            raise InvalidParamsException("value < 0")
-        try:
-            value.to_bytes(DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER)
-        except OverflowError:
-            raise InvalidParamsException("exceed ICX amount you can send at one time")
+        tx_hash: Optional[bytes] = params.get('txHash')
+        if not self._cache.is_checked(tx_hash):
+            self._check_stateless(params)
+            self._cache.set_checked(tx_hash)
 
         version: int = params.get('version', 2)
         if version < 3:
@@ -80,8 +151,22 @@ class IconPreValidator:
         else:
             self._check_from_can_charge_fee_v3(context, params, step_price)
 
-    @staticmethod
-    def _check_input_data(params: dict):
+    def _check_stateless(self, params: dict):
+        """Checks the values of a transaction which do not depend on the states
+
+        :param params: params of icx_sendTransaction JSON-RPC request
+        """
+        self._check_input_data(params)
+
+        value: int = params.get('value', 0)
+        if value < 0:
+            raise InvalidParamsException("value < 0")
+        try:
+            value.to_bytes(DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER)
+        except OverflowError:
+            raise InvalidParamsException("exceed ICX amount you can send at one time")
+
+    def _check_input_data(self, params: dict):
         """
         Validates input data. It checks the input data type and the input data size.
 
@@ -95,7 +180,7 @@ class IconPreValidator:
         else:
             IconPreValidator._check_input_data_type(input_data)
 
-        IconPreValidator._check_input_data_size(input_data)
+        self._check_input_data_size(input_data, params.get('txHash'))
 
     @staticmethod
     def _check_message_data(data: Any):
@@ -127,8 +212,7 @@ class IconPreValidator:
             # The leaf value should be None or str.
             raise InvalidRequestException('Invalid data type')
 
-    @staticmethod
-    def _check_input_data_size(input_data: Any):
+    def _check_input_data_size(self, input_data: Any, tx_hash: Optional[bytes] = None):
         """
         Validates transaction data whether total bytes is less than MAX_DATA_SIZE
         If the property is a key-value object, counts key and value.
@@ -138,10 +222,11 @@ class IconPreValidator:
         But the field of 'data' has not been converted (TypeConvert marks it as LATER)
 
         :param input_data: data field of icx_sendTransaction JSON-RPC request
+        :param tx_hash: txHash field of icx_sendTransaction JSON-RPC request
         """
 
         if input_data is not None:
-            size = get_input_data_size(Revision.LATEST.value, input_data)
+            size = self._cache.get_input_data_size(tx_hash, Revision.LATEST.value, input_data)
 
             if size > MAX_DATA_SIZE:
                 raise InvalidRequestException('Invalid message length')
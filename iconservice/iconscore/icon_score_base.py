@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING, Callable, Any, List, Tuple, Mapping
 
 from .context.context import ContextGetter, ContextContainer
 from .icon_score_base2 import InterfaceScore, revert, Block
+from .icon_score_call_plan import CallPlan, get_call_plan
 from .icon_score_constant import (
     CONST_INDEXED_ARGS_COUNT,
     FORMAT_IS_NOT_FUNCTION_OBJECT,
@@ -31,6 +32,7 @@ from .icon_score_constant import (
     STR_FALLBACK,
     CONST_CLASS_API,
     CONST_CLASS_ELEMENT_METADATAS,
+    CONST_CLASS_CALL_PLANS,
     BaseType,
     T,
 )
@@ -43,7 +45,6 @@ from .typing.definition import get_score_api
 from .typing.element import (
     ScoreElementMetadataContainer,
     ScoreElementMetadata,
-    FunctionMetadata,
     set_score_flag_on,
     is_any_score_flag_on,
 )
@@ -347,6 +348,8 @@ class IconScoreBaseMeta(ABCMeta):
 
         elements: Mapping[str, ScoreElementMetadata] = create_score_element_metadatas(cls)
         setattr(cls, CONST_CLASS_ELEMENT_METADATAS, elements)
+        # Filled by get_call_plan() on the first call of each method
+        setattr(cls, CONST_CLASS_CALL_PLANS, {})
 
         api_list = get_score_api(elements.values())
         setattr(cls, CONST_CLASS_API, api_list)
@@ -409,16 +412,6 @@ class IconScoreBase(IconScoreObject, ContextGetter,
     def __get_api(cls) -> dict:
         return getattr(cls, CONST_CLASS_API, "")
 
-    def __validate_external_method(self, func_name: str) -> None:
-        """Validate the method indicated by func_name is an external method
-
-        :param func_name: name of method
-        """
-
-        if not self.__is_external_method(func_name):
-            raise MethodNotFoundException(
-                f"Method not found: {type(self).__name__}.{func_name}")
-
     @classmethod
     def __get_score_element_metadatas(cls) -> ScoreElementMetadataContainer:
         return getattr(cls, CONST_CLASS_ELEMENT_METADATAS)
@@ -432,19 +425,23 @@ class IconScoreBase(IconScoreObject, ContextGetter,
                arg_params: Optional[list] = None,
                kw_params: Optional[dict] = None) -> Any:
 
+        plan: 'CallPlan' = get_call_plan(self, func_name)
+
         if func_name == STR_FALLBACK:
             if self._context.revision >= Revision.THREE.value:
-                if not self.__is_payable_method(func_name):
+                if not plan.is_payable:
                     raise MethodNotFoundException(
                         f"Method not found: {type(self).__name__}.{func_name}")
             else:
-                self.__check_payable(func_name)
+                self.__check_payable(func_name, plan)
 
             score_func = getattr(self, func_name)
             ret = score_func()
         else:
-            self.__validate_external_method(func_name)
-            self.__check_payable(func_name)
+            if not plan.is_external:
+                raise MethodNotFoundException(
+                    f"Method not found: {type(self).__name__}.{func_name}")
+            self.__check_payable(func_name, plan)
             score_func = getattr(self, func_name)
             if arg_params is None:
                 arg_params = []
@@ -453,26 +450,11 @@ class IconScoreBase(IconScoreObject, ContextGetter,
             ret = score_func(*arg_params, **kw_params)
         return ret
 
-    def __check_payable(self, func_name: str):
-        if self.msg.value > 0 and not self.__is_payable_method(func_name):
+    def __check_payable(self, func_name: str, plan: 'CallPlan'):
+        if self.msg.value > 0 and not plan.is_payable:
             raise MethodNotPayableException(
                 f"Method not payable: {type(self).__name__}.{func_name}")
 
-    def __is_external_method(self, func_name) -> bool:
-        elements = self.__get_score_element_metadatas()
-        func: FunctionMetadata = elements.get(func_name)
-        return isinstance(func, FunctionMetadata) and func.is_external
-
-    def __is_payable_method(self, func_name) -> bool:
-        elements = self.__get_score_element_metadatas()
-        func: FunctionMetadata = elements.get(func_name)
-        return isinstance(func, FunctionMetadata) and func.is_payable
-
-    def __is_func_readonly(self, func_name: str) -> bool:
-        elements = self.__get_score_element_metadatas()
-        func: FunctionMetadata = elements.get(func_name)
-        return isinstance(func, FunctionMetadata) and func.is_readonly
-
     # noinspection PyUnusedLocal
     @staticmethod
     def __on_db_get(context: 'IconScoreContext',
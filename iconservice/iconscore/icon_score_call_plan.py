@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import TYPE_CHECKING, Optional, Dict, Any
+
+from .icon_score_constant import CONST_CLASS_ELEMENT_METADATAS, CONST_CLASS_CALL_PLANS
+from .typing.conversion import ScoreParametersConverter, ConvertOption
+from .typing.element import ScoreElementMetadata, FunctionMetadata
+from ..base.exception import MethodNotFoundException
+from ..icon_constant import IconScoreFuncType
+
+if TYPE_CHECKING:
+    from .icon_score_base import IconScoreBase
+
+
+class CallPlan(object):
+    """What is needed to call a method of a SCORE class, resolved from its metadata once
+
+    The plans of a class are kept in the class itself,
+    so a SCORE update which loads a new class never uses the plans of the old one.
+    """
+
+    def __init__(self, metadata: Optional['ScoreElementMetadata']):
+        """Constructor
+
+        :param metadata: None if the method is not an element of the SCORE
+        """
+        self._metadata = metadata
+
+        is_function: bool = isinstance(metadata, FunctionMetadata)
+        self.is_external: bool = is_function and metadata.is_external
+        self.is_payable: bool = is_function and metadata.is_payable
+        self.is_readonly: bool = is_function and metadata.is_readonly
+        self.func_type: 'IconScoreFuncType' = \
+            IconScoreFuncType.READONLY if self.is_readonly else IconScoreFuncType.WRITABLE
+
+        self._converter: Optional['ScoreParametersConverter'] = \
+            None if metadata is None else ScoreParametersConverter(metadata.signature)
+
+    @property
+    def metadata(self) -> Optional['ScoreElementMetadata']:
+        return self._metadata
+
+    def convert_params(self, score: 'IconScoreBase', func_name: str,
+                       params: Dict[str, Any], options: ConvertOption = ConvertOption.NONE) -> Dict[str, Any]:
+        """Does the same as convert_score_parameters() with the signature of the method
+
+        :param score: used for an error message
+        :param func_name: used for an error message
+        :param params: parameters in str
+        :param options:
+        :return: converted parameters
+        """
+        if self._converter is None:
+            raise MethodNotFoundException(f"Method not found: {type(score).__name__}.{func_name}")
+
+        return self._converter.convert(params, options)
+
+
+# The plan of the methods which are not the elements of a SCORE. It is not cached to bound the size of the plans
+_NOT_FOUND_PLAN = CallPlan(None)
+
+
+def get_call_plan(score: 'IconScoreBase', func_name: str) -> 'CallPlan':
+    """Returns the call plan of a method of a given SCORE
+
+    :param score: SCORE instance
+    :param func_name: method name
+    :return:
+    """
+    plans: Optional[dict] = getattr(type(score), CONST_CLASS_CALL_PLANS, None)
+    if plans is not None:
+        plan: Optional['CallPlan'] = plans.get(func_name)
+        if plan is not None:
+            return plan
+
+    elements = getattr(score, CONST_CLASS_ELEMENT_METADATAS)
+    metadata: Optional['ScoreElementMetadata'] = elements.get(func_name)
+    if metadata is None:
+        return _NOT_FOUND_PLAN
+
+    plan = CallPlan(metadata)
+    if plans is not None:
+        plans[func_name] = plan
+
+    return plan
@@ -25,6 +25,7 @@ BaseType = TypeVar("BaseType", bool, int, str, bytes, list, dict, Address)
 
 CONST_CLASS_API = '__api'
 CONST_CLASS_ELEMENT_METADATAS = '__element_metadatas'
+CONST_CLASS_CALL_PLANS = '__call_plans'
 
 CONST_SCORE_FLAG = '__score_flag'
 CONST_INDEXED_ARGS_COUNT = '__indexed_args_count'
@@ -39,7 +40,10 @@ STR_ON_UPDATE = 'on_update'
 
 ATTR_SCORE_GET_API = "_IconScoreBase__get_api"
 ATTR_SCORE_CALL = "_IconScoreBase__call"
-ATTR_SCORE_VALIDATE_EXTERNAL_METHOD = "_IconScoreBase__validate_external_method"
+
+# The message of the AttributeError which Python raised when a method was called on an inactive SCORE (None).
+# It is recorded in transaction results, so it MUST NOT be changed.
+MESSAGE_INACTIVE_SCORE = "'NoneType' object has no attribute '_IconScoreBase__is_func_readonly'"
 
 
 @unique
@@ -17,15 +17,17 @@
 import warnings
 from abc import ABC
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Optional, List, Iterable
+from typing import TYPE_CHECKING, Optional, List, Iterable, Mapping
 
 from iconcommons.logger import Logger
 
+from .icon_score_call_plan import get_call_plan
+from .icon_score_constant import MESSAGE_INACTIVE_SCORE
 from .icon_score_mapper import IconScoreMapper
 from .icon_score_step import IconScoreStepCounter
 from .icon_score_trace import Trace
 from ..base.block import Block
-from ..base.exception import FatalException, AccessDeniedException
+from ..base.exception import FatalException, AccessDeniedException, InactiveScoreError
 from ..base.message import Message
 from ..base.transaction import Transaction
 from ..database.batch import BlockBatch, TransactionBatch
@@ -44,7 +46,10 @@ if TYPE_CHECKING:
     from ..utils import ContextEngine, ContextStorage
     from ..prep.prep_address_converter import PRepAddressConverter
     from ..inv.container import Container as INVContainer
-    from ..database.batch import Batch
+    from ..database.batch import Batch, BatchValue, BlockBatchValue
+    from ..database.db import KeyValueDatabaseSnapshot
+    from ..block_profiler import TxProfile
+    from ..optimistic_executor import Speculation
 
 
 class IconScoreContext(ABC):
@@ -67,6 +72,7 @@ class IconScoreContext(ABC):
 
     precommitdata_log_flag = False
     step_trace_flag: bool = False
+    score_template_flag: bool = False
     log_level: str = None
     unstake_slot_max: int = UNSTAKE_SLOT_MAX
 
@@ -90,6 +96,10 @@ class IconScoreContext(ABC):
         # For 2-depth block invocation
         self._prev_block_batches: Optional[List['BlockBatch']] = \
             [] if context_type == IconScoreContextType.INVOKE else None
+        # Flattened index of prev_block_batches: key -> BlockBatchValue
+        self._prev_block_batch_index: Optional[Mapping[bytes, 'BlockBatchValue']] = None
+        # Read-only view of state_db at the last committed block (QUERY and ESTIMATION only)
+        self.state_db_snapshot: Optional['KeyValueDatabaseSnapshot'] = None
         self.rc_block_batch: list = []
         self.rc_tx_batch: list = []
         self.new_icon_score_mapper: Optional['IconScoreMapper'] = None
@@ -113,6 +123,10 @@ class IconScoreContext(ABC):
         self._inv_container: Optional['INVContainer'] = None
         self.regulator: Optional['Regulator'] = None
         self.revision_changed_flag: 'RevisionChangedFlag' = RevisionChangedFlag.NONE
+        # Not None only while a transaction is executed speculatively
+        self.speculation: Optional['Speculation'] = None
+        # Not None only while a transaction is invoked with the block profiler enabled
+        self.tx_profile: Optional['TxProfile'] = None
 
     @classmethod
     def set_decentralize_trigger(cls, decentralize_trigger: float):
@@ -162,7 +176,7 @@ class IconScoreContext(ABC):
 
     def get_batches(self) -> Iterable['Batch']:
         """Used to support 2-depth block invocation
-        It is called in ContextDatabase.get_from_batch() on estimation or invoke
+        Use get_batch_value() to look up a value for a key
 
         Searching order: tx_batch -> block_batch -> prev_block_batch -> state_db
         """
@@ -174,6 +188,70 @@ class IconScoreContext(ABC):
             for prev_block_batch in self._prev_block_batches:
                 yield prev_block_batch
 
+    def set_prev_block_batches(self, prev_block_batches: Iterable['BlockBatch']):
+        """Set the precommit block batches which the block to invoke is based on
+
+        :param prev_block_batches: block batches ordered from the parent block to the oldest one
+        """
+        self._prev_block_batches = [batch for batch in prev_block_batches]
+
+        if len(self._prev_block_batches) == 0:
+            self._prev_block_batch_index = None
+        elif len(self._prev_block_batches) == 1:
+            self._prev_block_batch_index = self._prev_block_batches[0]
+        else:
+            # The states of a newer block overwrite those of older ones
+            index = {}
+            for prev_block_batch in reversed(self._prev_block_batches):
+                index.update(prev_block_batch)
+            self._prev_block_batch_index = index
+
+    def get_batch_value(self, key: bytes) -> Optional['BatchValue']:
+        """Returns the latest batch value for a given key without visiting every batch
+        It is called in ContextDatabase.get_from_batch() on estimation or invoke
+
+        Searching order: tx_batch -> block_batch -> prev_block_batch
+
+        :param key:
+        :return: None if no batch contains a given key
+        """
+        value: Optional['BatchValue'] = self.tx_batch[key]
+        if value is None:
+            value = self.block_batch.get(key)
+            if value is None and self._prev_block_batch_index is not None:
+                value = self._prev_block_batch_index.get(key)
+
+        return value
+
+    def fork(self) -> 'IconScoreContext':
+        """Returns a context to execute a transaction on the current block state
+        The states of this context are shared, so the returned context MUST NOT change them
+
+        :return: a context with an empty tx_batch
+        """
+        context = IconScoreContext(self.type)
+        context.block = self.block
+        context.block_batch = self.block_batch
+        context.tx_batch = TransactionBatch()
+        context._prev_block_batches = self._prev_block_batches
+        context._prev_block_batch_index = self._prev_block_batch_index
+        context.new_icon_score_mapper = self.new_icon_score_mapper
+
+        context._preps = self._preps
+        context._tx_dirty_preps = OrderedDict()
+        context._term = self._term
+        context._prep_address_converter = self._prep_address_converter
+        context._inv_container = self._inv_container
+        context.regulator = self.regulator
+        context.revision_changed_flag = self.revision_changed_flag
+
+        return context
+
+    def has_tx_side_effects(self) -> bool:
+        """Returns whether the current transaction has changed the states out of tx_batch
+        """
+        return bool(self.rc_tx_batch) or bool(self._tx_dirty_preps)
+
     def is_decentralized(self) -> bool:
         return self._term is not None
 
@@ -181,9 +259,12 @@ class IconScoreContext(ABC):
         return self._term.sequence == 0 and self.block.height == self._term.start_block_height
 
     def set_func_type_by_icon_score(self, icon_score: 'IconScoreBase', func_name: str):
-        is_func_readonly = getattr(icon_score, '_IconScoreBase__is_func_readonly')
-        if func_name is not None and is_func_readonly(func_name):
-            self.func_type = IconScoreFuncType.READONLY
+        if icon_score is None:
+            # Transaction results calling an inactive SCORE have recorded this message as SYSTEM_ERROR
+            raise InactiveScoreError(MESSAGE_INACTIVE_SCORE)
+
+        if func_name is not None:
+            self.func_type = get_call_plan(icon_score, func_name).func_type
         else:
             self.func_type = IconScoreFuncType.WRITABLE
 
@@ -371,16 +452,18 @@ class IconScoreContextFactory(object):
     def create(self,
                context_type: 'IconScoreContextType',
                block: 'Block',
-               prev_block_batches: Iterable['Batch'] = None):
+               prev_block_batches: Iterable['Batch'] = None,
+               state_db_snapshot: Optional['KeyValueDatabaseSnapshot'] = None):
         context: 'IconScoreContext' = self._create_context(context_type)
         context.block = block
+        context.state_db_snapshot = state_db_snapshot
 
         if context_type == IconScoreContextType.DIRECT:
             return context
 
         # For 2-depth block invocation
         if prev_block_batches:
-            context._prev_block_batches = [batch for batch in prev_block_batches]
+            context.set_prev_block_batches(prev_block_batches)
         self._set_context_attributes_for_processing_tx(context)
         return context
 
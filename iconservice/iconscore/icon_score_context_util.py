@@ -91,7 +91,7 @@ class IconScoreContextUtil(object):
 
         # Create a SCORE instance every time
         # to prevent consensus failure by using wrong member variables in SCORE
-        return score_info.get_score(context.revision)
+        return score_info.get_score(context.revision, context.score_template_flag)
 
     @staticmethod
     def get_score_info(context: 'IconScoreContext', address: 'Address') -> Optional['IconScoreInfo']:
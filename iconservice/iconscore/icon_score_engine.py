@@ -16,17 +16,14 @@
 """IconScoreEngine module
 """
 
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any
 
 from .icon_score_constant import STR_FALLBACK, ATTR_SCORE_GET_API, ATTR_SCORE_CALL
 from .icon_score_context import IconScoreContext
 from .icon_score_context_util import IconScoreContextUtil
-from .typing.conversion import convert_score_parameters, ConvertOption
-from .typing.element import (
-    ScoreElementMetadata,
-    get_score_element_metadata,
-)
+from .icon_score_call_plan import CallPlan, get_call_plan
+from .typing.conversion import ConvertOption
+from .typing.copier import copy_score_value
 from ..base.address import Address, SYSTEM_SCORE_ADDRESS
 from ..base.exception import ScoreNotFoundException, InvalidParamsException
 from ..icon_constant import Revision
@@ -118,7 +115,7 @@ class IconScoreEngine(object):
         ret = score_func(func_name=func_name, kw_params=converted_params)
 
         # No problem even though ret is None
-        return deepcopy(ret)
+        return copy_score_value(ret)
 
     @classmethod
     def _convert_score_params_by_annotations(
@@ -135,10 +132,8 @@ class IconScoreEngine(object):
         ):
             options = ConvertOption.IGNORE_UNKNOWN_PARAMS
 
-        element_metadata: ScoreElementMetadata = get_score_element_metadata(icon_score, func_name)
-        params = convert_score_parameters(kw_params, element_metadata.signature, options)
-
-        return params
+        plan: 'CallPlan' = get_call_plan(icon_score, func_name)
+        return plan.convert_params(icon_score, func_name, kw_params, options)
 
     @staticmethod
     def _fallback(context: 'IconScoreContext',
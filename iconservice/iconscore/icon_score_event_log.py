@@ -14,18 +14,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, List, Optional, Any
+from typing import TYPE_CHECKING, List, Optional, Any, Dict
 
 from .icon_score_step import StepType
 from ..base.address import Address, ICON_ADDRESS_BYTES_SIZE, ICON_ADDRESS_BODY_SIZE
 from ..base.exception import InvalidEventLogException
 from ..icon_constant import DATA_BYTE_ORDER, Revision
 from ..utils import int_to_bytes, byte_length_of_int
+from ..utils.bloom import get_bloom_bits_of
 
 if TYPE_CHECKING:
     from .icon_score_constant import BaseType
     from .icon_score_context import IconScoreContext
 
+# The maximum number of bloom bits which are memoized per kind
+MAX_MEMOIZED_BLOOM_BITS = 1024
+
+# Bloom bits of score addresses and event signatures, which appear in event logs over and over
+_score_address_bloom_bits: Dict['Address', int] = {}
+_signature_bloom_bits: Dict[bytes, int] = {}
+
+
+def _memoize_bloom_bits(memo: dict, key: Any, bloom_bits: int) -> int:
+    if len(memo) >= MAX_MEMOIZED_BLOOM_BITS:
+        memo.clear()
+    memo[key] = bloom_bits
+    return bloom_bits
+
 
 class EventLog(object):
     """ A DataClass of a event log.
@@ -35,13 +50,15 @@ class EventLog(object):
             self,
             score_address: 'Address',
             indexed: List['BaseType'],
-            data: List['BaseType']) -> None:
+            data: List['BaseType'],
+            indexed_bytes: Optional[List[bytes]] = None) -> None:
         """
         Constructor
 
         :param score_address: an address of SCORE in which the event is invoked
         :param indexed: a list of indexed arguments including a event signature
         :param data: a list of normal arguments
+        :param indexed_bytes: the bytes of indexed arguments in the logs bloom, made on emit
         """
 
         assert score_address.is_contract
@@ -51,9 +68,42 @@ class EventLog(object):
         self.score_address: 'Address' = score_address
         self.indexed: 'List[BaseType]' = indexed
         self.data: 'List[BaseType]' = data
+        # Private attributes are not the fields of an event log
+        self._indexed_bytes: Optional[List[bytes]] = indexed_bytes
 
     def __str__(self) -> str:
-        return '\n'.join([f'{k}: {v}' for k, v in self.__dict__.items()])
+        return '\n'.join([f'{k}: {v}' for k, v in self.__dict__.items() if not k.startswith('_')])
+
+    @property
+    def indexed_bytes(self) -> List[bytes]:
+        """The bytes of indexed arguments in the logs bloom, which are prefixed by their indexes
+        """
+        if self._indexed_bytes is None:
+            self._indexed_bytes = [EventLogEmitter.get_ordered_bytes(i, item) for i, item in enumerate(self.indexed)]
+        return self._indexed_bytes
+
+    def get_bloom_bits(self) -> int:
+        """Returns the bits which this event log sets in the logs bloom
+
+        :return: bloom bits in one int
+        """
+        score_address: 'Address' = self.score_address
+        bloom_bits: Optional[int] = _score_address_bloom_bits.get(score_address)
+        if bloom_bits is None:
+            bloom_bits = _memoize_bloom_bits(
+                _score_address_bloom_bits, score_address,
+                get_bloom_bits_of(EventLogEmitter.get_ordered_bytes(0xff, score_address)))
+
+        for i, value in enumerate(self.indexed_bytes):
+            if i == 0:
+                signature_bits: Optional[int] = _signature_bloom_bits.get(value)
+                if signature_bits is None:
+                    signature_bits = _memoize_bloom_bits(_signature_bloom_bits, value, get_bloom_bits_of(value))
+                bloom_bits |= signature_bits
+            else:
+                bloom_bits |= get_bloom_bits_of(value)
+
+        return bloom_bits
 
     def to_dict(self, casing: Optional[callable] = None) -> dict:
         """
@@ -62,7 +112,7 @@ class EventLog(object):
         """
         new_dict = {}
         for key, value in self.__dict__.items():
-            if value is None:
+            if value is None or key.startswith('_'):
                 # Excludes properties which have `None` value
                 continue
 
@@ -104,6 +154,7 @@ class EventLogEmitter:
 
         event_size = EventLogEmitter.__get_byte_length(context, event_signature)
         indexed: List['BaseType'] = [event_signature]
+        indexed_bytes: List[bytes] = [cls.get_ordered_bytes(0, event_signature)]
         data: List['BaseType'] = []
         for i, argument in enumerate(arguments):
             event_size += EventLogEmitter.__get_byte_length(context, argument)
@@ -111,6 +162,7 @@ class EventLogEmitter:
             # Separates indexed type and base type with keeping order.
             if i < indexed_args_count:
                 indexed.append(argument)
+                indexed_bytes.append(cls.get_ordered_bytes(i + 1, argument))
             else:
                 data.append(argument)
 
@@ -118,7 +170,7 @@ class EventLogEmitter:
         if fee_charge:
             context.step_counter.apply_step(StepType.EVENT_LOG, event_size)
 
-        event = EventLog(score_address, indexed, data)
+        event = EventLog(score_address, indexed, data, indexed_bytes)
         context.event_logs.append(event)
 
     @classmethod
@@ -16,6 +16,7 @@
 
 from typing import TYPE_CHECKING
 
+from .icon_score_template import IconScoreTemplate
 from ..base.address import Address
 from ..base.exception import InvalidParamsException
 from ..icon_constant import Revision
@@ -43,6 +44,7 @@ class IconScoreInfo(object):
         self._score_class = score_class
         self._score_db = score_db
         self._score = None
+        self._template = IconScoreTemplate(score_class, score_db)
 
     @property
     def tx_hash(self) -> bytes:
@@ -60,12 +62,13 @@ class IconScoreInfo(object):
     def address(self) -> 'Address':
         return self._score_db.address
 
-    def get_score(self, revision: int) -> 'IconScoreBase':
+    def get_score(self, revision: int, use_template: bool = False) -> 'IconScoreBase':
         """Provide a score instance according to the revision.
         1. revision <= 2: Returns a cached score instance
         2. revision > 2: Returns a newly created score instance
 
         :param revision:
+        :param use_template: create a new instance from the template of the SCORE if possible
         :return:
         """
         if revision <= Revision.TWO.value or is_builtin_score(str(self.address)):
@@ -74,10 +77,13 @@ class IconScoreInfo(object):
 
             return self._score
 
+        if use_template:
+            return self._template.get_score()
+
         return self.create_score()
 
     def create_score(self) -> 'IconScoreBase':
-        return self._score_class(self._score_db)
+        return self._template.create_score()
 
 
 class IconScoreMapperObject(dict):
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import json
+import re
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any, List, Tuple, Optional
 
@@ -41,7 +42,7 @@ def get_input_data_size(revision: int, input_data: Any) -> int:
     if revision >= Revision.FOUR.value and input_data is None:
         return 0
 
-    return get_data_size_using_json_dumps(input_data)
+    return get_json_data_size(input_data)
 
 
 def get_data_size_using_json_dumps(data) -> int:
@@ -49,6 +50,58 @@ def get_data_size_using_json_dumps(data) -> int:
     return len(data.encode())
 
 
+# Characters which json.dumps escapes with ensure_ascii=False
+_JSON_ESCAPE = re.compile(r'[\x00-\x1f\\"]')
+_JSON_ESCAPE_BYTES = bytes(range(0x20)) + b'\\"'
+_JSON_SHORT_ESCAPES = frozenset('\\"\b\f\n\r\t')
+
+
+def get_json_data_size(data) -> int:
+    """
+    Returns the same size as get_data_size_using_json_dumps()
+    without building the json string, which is costly for a large deploy content
+
+    :param data: input data of transaction
+    :return: size of data
+    """
+    if isinstance(data, str):
+        encoded: bytes = data.encode()
+        # 2 bytes for the quotes
+        size = len(encoded) + 2
+        # Escaped characters are single bytes in utf-8, so they are counted without a regex in most cases
+        if len(encoded.translate(None, _JSON_ESCAPE_BYTES)) < len(encoded):
+            for match in _JSON_ESCAPE.finditer(data):
+                # "\n" or "\u001f"
+                size += 1 if match.group() in _JSON_SHORT_ESCAPES else 5
+        return size
+    elif isinstance(data, dict):
+        # braces and commas
+        size = len(data) + 1 if data else 2
+        for k, v in data.items():
+            if not isinstance(k, str):
+                return get_data_size_using_json_dumps(data)
+            # 1 byte for the colon
+            size += get_json_data_size(k) + get_json_data_size(v) + 1
+        return size
+    elif isinstance(data, (list, tuple)):
+        # brackets and commas
+        size = len(data) + 1 if data else 2
+        for v in data:
+            size += get_json_data_size(v)
+        return size
+    elif data is None:
+        return 4
+    elif data is True:
+        return 4
+    elif data is False:
+        return 5
+    elif isinstance(data, int):
+        return len(int.__repr__(data))
+
+    # float and the types which json.dumps does not support
+    return get_data_size_using_json_dumps(data)
+
+
 def get_deploy_content_size(revision: int, content: str) -> int:
     """
     Returns size of deploying content.
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ast
+import inspect
+import textwrap
+from collections import Counter
+from threading import Lock
+from typing import TYPE_CHECKING, Optional, List, Tuple
+
+from iconcommons.logger import Logger
+
+from .context.context import ContextContainer
+from .icon_container_db import VarDB, DictDB, ArrayDB
+from .icon_score_constant import ATTR_SCORE_GET_API
+from ..database.db import IconScoreDatabase, IconScoreSubDatabase
+
+if TYPE_CHECKING:
+    from .icon_score_base import IconScoreBase
+
+_TAG = "SCORE_TEMPLATE"
+
+# The attributes which IconScoreBase.__init__() sets. They only depend on the address of a SCORE
+_BASE_ATTRIBUTES = frozenset((
+    "_IconScoreBase__db",
+    "_IconScoreBase__address",
+    "_IconScoreBase__owner",
+    "_IconScoreBase__icx",
+))
+
+# The types of the attributes which keep no state of their own for revision 3 and later.
+# ArrayDB keeps its size only for the revisions before 3
+_STATELESS_TYPES = (type(None), VarDB, DictDB, ArrayDB, IconScoreDatabase, IconScoreSubDatabase)
+
+_CONTAINER_TYPES = (VarDB, DictDB, ArrayDB)
+
+# Nodes of the constants in the arguments of container dbs. Python 3.8 and later parse every constant to ast.Constant
+_CONSTANT_NODES = tuple(getattr(ast, name) for name in ("Constant", "Str", "Bytes", "Num", "NameConstant")
+                        if hasattr(ast, name))
+
+
+def _is_none(node: 'ast.AST') -> bool:
+    return isinstance(node, _CONSTANT_NODES) and getattr(node, "value", False) is None
+
+
+def _is_plain_expr(node: 'ast.AST') -> bool:
+    """Check if an expression has no side effect: a constant, a name or an attribute of a name
+    """
+    if isinstance(node, _CONSTANT_NODES) or isinstance(node, ast.Name):
+        return True
+    if isinstance(node, ast.Attribute):
+        return _is_plain_expr(node.value)
+    return False
+
+
+def _is_super_init(node: 'ast.AST', db_name: str) -> bool:
+    """Check if a statement is super().__init__(db)
+    """
+    if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+        return False
+
+    call: 'ast.Call' = node.value
+    func = call.func
+    return isinstance(func, ast.Attribute) and func.attr == "__init__" \
+        and isinstance(func.value, ast.Call) \
+        and isinstance(func.value.func, ast.Name) and func.value.func.id == "super" \
+        and all(isinstance(arg, ast.Name) for arg in func.value.args) \
+        and len(call.args) == 1 and isinstance(call.args[0], ast.Name) and call.args[0].id == db_name \
+        and not call.keywords
+
+
+def _is_declaration(node: 'ast.AST', self_name: str, init_globals: dict) -> bool:
+    """Check if a statement is self.<name> = <container db>(...) or self.<name> = None
+    """
+    if isinstance(node, ast.Assign) and len(node.targets) == 1:
+        target, value = node.targets[0], node.value
+    elif isinstance(node, ast.AnnAssign) and node.value is not None:
+        target, value = node.target, node.value
+    else:
+        return False
+
+    if not isinstance(target, ast.Attribute) \
+            or not isinstance(target.value, ast.Name) or target.value.id != self_name:
+        return False
+    if _is_none(value):
+        return True
+
+    return isinstance(value, ast.Call) \
+        and isinstance(value.func, ast.Name) and init_globals.get(value.func.id) in _CONTAINER_TYPES \
+        and all(_is_plain_expr(arg) for arg in value.args) \
+        and all(keyword.arg is not None and _is_plain_expr(keyword.value) for keyword in value.keywords)
+
+
+def _declares_containers_only(init) -> bool:
+    """Check if the source of __init__() only calls super().__init__(db) and declares container dbs
+
+    :param init: __init__() of a SCORE class
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(init)))
+    except (OSError, TypeError, SyntaxError):
+        return False
+
+    func = tree.body[0]
+    if not isinstance(func, ast.FunctionDef) or func.decorator_list \
+            or len(func.args.args) != 2 or func.args.vararg or func.args.kwarg or func.args.kwonlyargs:
+        return False
+
+    self_name, db_name = func.args.args[0].arg, func.args.args[1].arg
+    for i, node in enumerate(func.body):
+        if i == 0 and isinstance(node, ast.Expr) and isinstance(node.value, _CONSTANT_NODES):
+            # docstring
+            continue
+        if isinstance(node, ast.Pass) or _is_super_init(node, db_name) \
+                or _is_declaration(node, self_name, init.__globals__):
+            continue
+        return False
+
+    return True
+
+
+def _copy_attribute(value):
+    """Copies a container db to give every instance its own cached values. The other attributes are shared
+    """
+    return value._copy() if type(value) in _CONTAINER_TYPES else value
+
+
+def is_templatable(score_class: type) -> bool:
+    """Check if creating an instance of a SCORE class has no effect but the attributes of the instance
+
+    It is checked statically, since the attributes of an instance do not show
+    whether __init__() changed globals or class attributes.
+    Every __init__() of the SCORE classes must only call super().__init__(db)
+    and set attributes to container dbs or None.
+
+    :param score_class: a subclass of IconScoreBase
+    """
+    if type(score_class).__call__ is not type.__call__:
+        return False
+
+    for cls in score_class.__mro__:
+        if ATTR_SCORE_GET_API in vars(cls):
+            # IconScoreBase
+            return True
+        if "__setattr__" in vars(cls):
+            return False
+        if "__init__" in vars(cls) and not _declares_containers_only(vars(cls)["__init__"]):
+            return False
+
+    return False
+
+
+class IconScoreTemplate(object):
+    """Creates the instances of a SCORE without running its __init__()
+
+    The attributes of the first instance right after __init__() are kept as a template,
+    and the other instances are created with a copy of them.
+    Container dbs are copied for each instance, so no instance shares their cached values with another one.
+    The template is used only if it is verified that a new __init__() would make the same attributes
+    and read the same keys from score_db:
+
+    - Every __init__() only declares container dbs, checked by is_templatable()
+    - Every attribute is a container db, a score db or None which keeps no state
+    - __init__() only reads the sizes of the ArrayDBs in the attributes and writes nothing.
+      The reads are replayed for every instance to apply the same steps
+
+    Otherwise, every instance is created by __init__() as before.
+    """
+
+    def __init__(self, score_class: type, score_db: 'IconScoreDatabase'):
+        self._score_class = score_class
+        self._score_db = score_db
+        # Held only while the template is built.
+        # The other instances are created by __init__() meanwhile instead of waiting for it
+        self._lock = Lock()
+
+        self._attributes: Optional[dict] = None
+        # The keys which __init__() reads from score_db
+        self._init_reads: Tuple[bytes, ...] = ()
+        # None: not verified yet
+        self._verified: Optional[bool] = None
+
+    @property
+    def verified(self) -> Optional[bool]:
+        return self._verified
+
+    def create_score(self) -> 'IconScoreBase':
+        """Creates an instance by __init__()
+
+        The accesses in it are not tracked even while the template is built,
+        since only the accesses in the context which builds the template are tracked.
+        """
+        return self._score_class(self._score_db)
+
+    def get_score(self) -> 'IconScoreBase':
+        """Creates an instance with a copy of the template if it is verified
+
+        :return:
+        """
+        if self._verified is None:
+            return self._create_template()
+        if not self._verified:
+            return self.create_score()
+
+        score: 'IconScoreBase' = self._score_class.__new__(self._score_class)
+        score.__dict__.update((name, _copy_attribute(value)) for name, value in self._attributes.items())
+
+        # Apply the steps of the reads in __init__()
+        for key in self._init_reads:
+            self._score_db.get(key)
+
+        return score
+
+    def _create_template(self) -> 'IconScoreBase':
+        if not self._lock.acquire(blocking=False):
+            # Another thread is building the template
+            return self.create_score()
+
+        try:
+            if self._verified is not None:
+                return self.create_score()
+
+            if is_templatable(self._score_class):
+                context = ContextContainer._get_context()
+                self._score_db.start_tracking(context)
+                try:
+                    score: 'IconScoreBase' = self._score_class(self._score_db)
+                finally:
+                    accesses: List[Tuple[str, bytes]] = self._score_db.stop_tracking()
+
+                verified: bool = self._verify(score, accesses)
+            else:
+                score: 'IconScoreBase' = self.create_score()
+                accesses: List[Tuple[str, bytes]] = []
+                verified: bool = False
+
+            if verified:
+                # The containers of the template are not the ones which the first instance uses
+                self._attributes = {name: _copy_attribute(value) for name, value in score.__dict__.items()}
+                self._init_reads = tuple(key for _, key in accesses)
+            # get_score() reads it without the lock, so it is set last
+            self._verified = verified
+
+            Logger.debug(tag=_TAG, msg=f"{self._score_db.address} verified={self._verified}")
+            return score
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def _verify(score: 'IconScoreBase', accesses: List[Tuple[str, bytes]]) -> bool:
+        attributes: Optional[dict] = getattr(score, "__dict__", None)
+        if attributes is None:
+            return False
+
+        size_keys: List[bytes] = []
+        for name, value in attributes.items():
+            if name in _BASE_ATTRIBUTES:
+                continue
+            if type(value) not in _STATELESS_TYPES:
+                return False
+            if type(value) is ArrayDB:
+                size_keys.append(value._get_size_key())
+
+        if any(op != "get" for op, _ in accesses):
+            return False
+
+        return Counter(key for _, key in accesses) == Counter(size_keys)
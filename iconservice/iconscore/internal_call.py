@@ -21,13 +21,15 @@ from .icon_score_context_util import IconScoreContextUtil
 from .icon_score_event_log import EventLogEmitter
 from .icon_score_step import StepType
 from .icon_score_trace import Trace, TraceType
-from .typing.element import (
-    get_score_element_metadata,
-    ScoreElementMetadata,
-)
+from .icon_score_call_plan import CallPlan, get_call_plan
 from .typing.verification import verify_internal_call_arguments
 from ..base.address import Address, SYSTEM_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
-from ..base.exception import StackOverflowException, ScoreNotFoundException
+from ..base.exception import (
+    StackOverflowException,
+    ScoreNotFoundException,
+    AccessDeniedException,
+    MethodNotFoundException,
+)
 from ..base.message import Message
 from ..icon_constant import ICX_TRANSFER_EVENT_LOG, MAX_CALL_STACK_SIZE, IconScoreContextType, Revision
 
@@ -76,6 +78,11 @@ class InternalCall(object):
                 InternalCall.emit_event_log_for_icx_transfer(context, addr_from, addr_to, amount)
 
             if addr_to.is_contract:
+                # System SCORE changes the states out of tx_batch which speculative execution cannot track
+                if addr_to == SYSTEM_SCORE_ADDRESS and context.speculation is not None:
+                    context.speculation.abort()
+                    raise AccessDeniedException(f"{SYSTEM_SCORE_ADDRESS} cannot be called on speculative execution")
+
                 # System SCORE inter-call enabled after Revision.SYSTEM_SCORE_ENABLED
                 # Exception
                 #   - Governance SCORE can call system SCORE inter-call
@@ -153,8 +160,10 @@ class InternalCall(object):
             score_func = getattr(icon_score, ATTR_SCORE_CALL)
 
             if context.revision >= Revision.SCORE_FUNC_PARAMS_CHECK.value:
-                metadata: ScoreElementMetadata = get_score_element_metadata(icon_score, func_name)
-                verify_internal_call_arguments(metadata.signature, arg_params, kw_params)
+                plan: 'CallPlan' = get_call_plan(icon_score, func_name)
+                if plan.metadata is None:
+                    raise MethodNotFoundException(f"Method not found: {type(icon_score).__name__}.{func_name}")
+                verify_internal_call_arguments(plan.metadata.signature, arg_params, kw_params)
 
             return score_func(func_name=func_name, arg_params=arg_params, kw_params=kw_params)
         finally:
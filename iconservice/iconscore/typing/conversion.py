@@ -16,7 +16,7 @@
 from collections import OrderedDict
 from enum import Flag, auto
 from inspect import Signature, Parameter
-from typing import Optional, Dict, Union, Any, List
+from typing import Optional, Dict, Union, Any, List, Callable, Tuple
 
 from . import (
     BaseObject,
@@ -27,7 +27,6 @@ from . import (
     get_args,
     get_annotations,
 )
-from .verification import set_default_value_to_params
 from ...base.address import Address
 from ...base.exception import InvalidParamsException
 
@@ -143,11 +142,42 @@ def convert_score_parameters(
             if not (options & ConvertOption.IGNORE_UNKNOWN_PARAMS):
                 raise InvalidParamsException(f"Unknown param: key={k} value={v}")
 
-    set_default_value_to_params(params, parameters)
-
     return converted_params
 
 
+class ScoreParametersConverter(object):
+    """Does the same as convert_score_parameters() with the type hints of a signature resolved in advance
+    """
+
+    def __init__(self, sig: Signature):
+        self._parameters = sig.parameters
+        self._required: Tuple[str, ...] = tuple(
+            k for k, parameter in self._parameters.items() if parameter.default is Parameter.empty)
+        self._converters: Dict[str, Callable[[Any], Any]] = {
+            k: compile_str_to_object(parameter.annotation) for k, parameter in self._parameters.items()
+        }
+
+    def convert(self, params: Dict[str, Any], options: ConvertOption = ConvertOption.NONE) -> Dict[str, Any]:
+        for k in self._required:
+            if k not in params:
+                raise InvalidParamsException(f"Argument not found: {k}")
+
+        converted_params = {}
+        converters = self._converters
+
+        for k, v in params.items():
+            if not isinstance(k, str):
+                raise InvalidParamsException(f"Invalid key type: key={k}")
+
+            try:
+                converted_params[k] = converters[k](v)
+            except KeyError:
+                if not (options & ConvertOption.IGNORE_UNKNOWN_PARAMS):
+                    raise InvalidParamsException(f"Unknown param: key={k} value={v}")
+
+        return converted_params
+
+
 def _verify_arguments(params: Dict[str, Any], sig: Signature):
     """Check if all required arguments are present
 
@@ -186,6 +216,100 @@ def str_to_object(value: Union[str, list, dict, None], type_hint: type) -> Any:
     raise InvalidParamsException(f"Type mismatch: value={value} type_hint={type_hint}")
 
 
+def compile_str_to_object(type_hint: type) -> Callable[[Any], Any]:
+    """Returns a function which does the same as str_to_object(value, type_hint)
+    with the origins and the arguments of type_hint resolved in advance
+
+    :param type_hint:
+    :return:
+    """
+    origin = get_origin(type_hint)
+
+    if is_base_type(origin):
+        def convert(value):
+            return str_to_base_object(value, origin)
+    elif is_struct(origin) and get_annotations(type_hint, None) is not None:
+        convert = _compile_str_to_object_in_struct(type_hint)
+    elif origin is list and len(get_args(type_hint)) > 0:
+        convert = _compile_str_to_object_in_list(type_hint)
+    elif origin is dict and len(get_args(type_hint)) > 1:
+        convert = _compile_str_to_object_in_dict(type_hint)
+    elif origin is Union and len(get_args(type_hint)) > 0:
+        convert = _compile_str_to_object_in_union(type_hint)
+    else:
+        def convert(value):
+            return str_to_object(value, type_hint)
+        return convert
+
+    def _str_to_object(value):
+        if not isinstance(value, (dict, list, str, type(None))):
+            raise InvalidParamsException(f"Invalid value type: {value}")
+
+        return convert(value)
+
+    return _str_to_object
+
+
+def _compile_str_to_object_in_struct(type_hint: type) -> Callable[[Any], Any]:
+    fields: Dict[str, Callable[[Any], Any]] = {
+        k: compile_str_to_object(v) for k, v in get_annotations(type_hint, None).items()
+    }
+
+    def convert(value):
+        if not isinstance(value, dict):
+            raise InvalidParamsException(f"Type mismatch: value={value} type_hint={type_hint}")
+
+        ret = OrderedDict()
+
+        for k, v in value.items():
+            if k not in fields:
+                raise InvalidParamsException(f"Unknown field in struct: key={k}")
+
+            ret[k] = fields[k](v)
+
+        if len(ret) != len(fields):
+            raise InvalidParamsException(f"Missing field in struct")
+
+        return ret
+
+    return convert
+
+
+def _compile_str_to_object_in_list(type_hint: type) -> Callable[[Any], Any]:
+    convert_item = compile_str_to_object(get_args(type_hint)[0])
+
+    def convert(value):
+        if not isinstance(value, list):
+            raise InvalidParamsException(f"Type mismatch: value={value} type_hint={type_hint}")
+
+        return [convert_item(i) for i in value]
+
+    return convert
+
+
+def _compile_str_to_object_in_dict(type_hint: type) -> Callable[[Any], Any]:
+    convert_value = compile_str_to_object(get_args(type_hint)[1])
+
+    def convert(value):
+        if not isinstance(value, dict):
+            raise InvalidParamsException(f"Type mismatch: value={value} type_hint={type_hint}")
+
+        return OrderedDict(
+            (k, convert_value(v)) for k, v in value.items()
+        )
+
+    return convert
+
+
+def _compile_str_to_object_in_union(type_hint: type) -> Callable[[Any], Any]:
+    convert_arg = compile_str_to_object(get_args(type_hint)[0])
+
+    def convert(value):
+        return None if value is None else convert_arg(value)
+
+    return convert
+
+
 def str_to_object_in_struct(value: Dict[str, Optional[str]], type_hint: type) -> Dict[str, Any]:
     if not isinstance(value, dict):
         raise InvalidParamsException(f"Type mismatch: value={value} type_hint={type_hint}")
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from copy import deepcopy
+from typing import Any, Dict
+
+from ...base.address import Address
+
+# Immutable types which a SCORE method can return. They are not copied
+_IMMUTABLE_TYPES = frozenset((int, str, bytes, bool, type(None), Address))
+
+# Nested lists and dicts deeper than this are copied by deepcopy() as a whole
+# to fail at the same depth as before on a too deep value
+MAX_DEPTH = 32
+
+
+class _UnsupportedValue(Exception):
+    pass
+
+
+def copy_score_value(value: Any) -> Any:
+    """Does the same as deepcopy(value) for the values which a SCORE method can return
+
+    The immutable leaves (int, str, bytes, bool, None and Address) are shared instead of copied.
+    Lists and dicts are copied with a memo keyed by their ids as deepcopy() does,
+    so a container referred to more than once is copied once and the copy is shared in the same way.
+    A value which has any other type, e.g. a subclass of dict, is copied by deepcopy() as a whole,
+    so it raises the same exception as before if it can not be copied.
+
+    :param value: return value of a SCORE method
+    :return: copied value
+    """
+    try:
+        return _copy(value, 0, {})
+    except _UnsupportedValue:
+        return deepcopy(value)
+
+
+def _copy(value: Any, depth: int, memo: Dict[int, Any]) -> Any:
+    value_type = type(value)
+
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+
+    copied = memo.get(id(value))
+    if copied is not None:
+        return copied
+
+    if depth >= MAX_DEPTH:
+        raise _UnsupportedValue
+
+    if value_type is list:
+        ret = []
+        # Registered before its items are copied to refer to itself
+        memo[id(value)] = ret
+        ret.extend(v if type(v) in _IMMUTABLE_TYPES else _copy(v, depth + 1, memo) for v in value)
+        return ret
+
+    if value_type is dict:
+        ret = {}
+        memo[id(value)] = ret
+        for k, v in value.items():
+            if type(k) not in _IMMUTABLE_TYPES:
+                raise _UnsupportedValue
+            ret[k] = v if type(v) in _IMMUTABLE_TYPES else _copy(v, depth + 1, memo)
+        return ret
+
+    raise _UnsupportedValue
@@ -170,6 +170,17 @@ class CoinPart(BasePart):
         self._balance += value
         self.set_dirty(True)
 
+    def copy(self) -> 'CoinPart':
+        """Returns a new CoinPart with the same data as the one decoded from the bytes of this part
+        BasePartState is not copied
+
+        :return: (CoinPart)
+        """
+        return CoinPart(coin_part_type=self._type,
+                        flags=self._flags,
+                        balance=self._balance,
+                        is_first=False)
+
     def __eq__(self, other) -> bool:
         """operator == overriding
 
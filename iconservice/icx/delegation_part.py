@@ -136,6 +136,15 @@ class DelegationPart(BasePart):
 
         return MsgPackForDB.dumps(data)
 
+    def copy(self) -> 'DelegationPart':
+        """Returns a new DelegationPart with the same data
+        BasePartState is not copied
+
+        :return: (DelegationPart)
+        """
+        delegations: list = [(address, value) for address, value in self._delegations]
+        return DelegationPart(delegated_amount=self._delegated_amount, delegations=delegations)
+
     def __eq__(self, other) -> bool:
         """operator == overriding
 
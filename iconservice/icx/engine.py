@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from .icx_account import Account
 from ..base.ComponentBase import EngineBase
@@ -23,6 +23,7 @@ from ..base.exception import InvalidParamsException
 
 if TYPE_CHECKING:
     from ..iconscore.icon_score_context import IconScoreContext
+    from ..optimistic_executor import Speculation
 
 
 class Engine(EngineBase):
@@ -59,7 +60,32 @@ class Engine(EngineBase):
         :param fee:
         :return:
         """
-        self._transfer(context, from_, context.storage.icx.fee_treasury, fee)
+        treasury: 'Address' = context.storage.icx.fee_treasury
+        speculation: Optional['Speculation'] = context.speculation
+
+        if speculation is None:
+            self._transfer(context, from_, treasury, fee)
+        elif from_ != treasury and fee > 0:
+            # On speculative execution, the fee is deposited to the treasury on commit
+            # not to make every transaction depend on the balance of the treasury
+            from_account = context.storage.icx.get_account(context, from_)
+            from_account.withdraw(fee)
+            context.storage.icx.put_account(context, from_account)
+            speculation.treasury_fee += fee
+
+    def deposit_fee(self,
+                    context: 'IconScoreContext',
+                    fee: int):
+        """Deposit the fee charged on speculative execution to the treasury
+
+        :param context:
+        :param fee:
+        :return:
+        """
+        if fee > 0:
+            treasury_account = context.storage.icx.get_account(context, context.storage.icx.fee_treasury)
+            treasury_account.deposit(fee)
+            context.storage.icx.put_account(context, treasury_account)
 
     def transfer(self,
                  context: 'IconScoreContext',
@@ -235,6 +235,17 @@ class StakePart(BasePart):
 
         return MsgPackForDB.dumps(data)
 
+    def copy(self) -> 'StakePart':
+        """Returns a new StakePart with the same data
+        BasePartState is not copied
+
+        :return: (StakePart)
+        """
+        return StakePart(stake=self._stake,
+                         unstake=self._unstake,
+                         unstake_block_height=self._unstake_block_height,
+                         unstakes_info=[list(info) for info in self._unstakes_info])
+
     def __eq__(self, other) -> bool:
         """operator == overriding
 
@@ -16,7 +16,7 @@
 
 import json
 from enum import IntEnum, IntFlag
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Optional, Union, Dict, Tuple, List
 
 from iconcommons import Logger
 
@@ -27,7 +27,8 @@ from .stake_part import StakePart
 from ..base.ComponentBase import StorageBase
 from ..base.address import Address
 from ..base.block import Block, NULL_BLOCK
-from ..icon_constant import DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER, ICX_LOG_TAG, ROLLBACK_LOG_TAG, IconScoreContextType
+from ..icon_constant import DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER, ICX_LOG_TAG, ROLLBACK_LOG_TAG, IconScoreContextType, \
+    Revision
 from ..utils import bytes_to_hex
 
 if TYPE_CHECKING:
@@ -52,6 +53,56 @@ class Intent(IntEnum):
     ALL = AccountPartFlag.COIN | AccountPartFlag.STAKE | AccountPartFlag.DELEGATION
 
 
+AccountPart = Union['CoinPart', 'StakePart', 'DelegationPart']
+
+
+class AccountPartCache(object):
+    """Decoded account parts which have been read or written while invoking a block
+
+    Each part is kept with its encoded bytes and returned only when the bytes
+    which ContextDatabase returns for its key are the same.
+    So the values in tx_batch and block_batch, including reverted ones, are always respected.
+    """
+
+    def __init__(self):
+        self._block_hash: Optional[bytes] = None
+        # key: (encoded bytes, decoded part)
+        self._parts: Dict[bytes, Tuple[bytes, 'AccountPart']] = {}
+
+    def __len__(self) -> int:
+        return len(self._parts)
+
+    def set_block(self, block: Optional['Block']):
+        """Drops all cached parts when a different block starts to be invoked
+
+        :param block: the block being invoked
+        """
+        block_hash: Optional[bytes] = block.hash if block else None
+        if block_hash != self._block_hash:
+            self._parts.clear()
+            self._block_hash = block_hash
+
+    def get(self, key: bytes, value: bytes) -> Optional['AccountPart']:
+        """Returns a new copy of the part decoded from value
+
+        :param key: db key of a part
+        :param value: encoded bytes of the part
+        :return: None if not cached
+        """
+        entry: Optional[Tuple[bytes, 'AccountPart']] = self._parts.get(key)
+        if entry is None or entry[0] != value:
+            return None
+
+        return entry[1].copy()
+
+    def put(self, key: bytes, value: bytes, part: 'AccountPart'):
+        self._parts[key] = value, part.copy()
+
+    def clear(self):
+        self._block_hash = None
+        self._parts.clear()
+
+
 class Storage(StorageBase):
     """Icx coin state manager embedding a state db wrapper"""
 
@@ -62,6 +113,13 @@ class Storage(StorageBase):
     LAST_BLOCK_KEY = b'last_block'
     _TOTAL_SUPPLY_KEY = b'total_supply'
 
+    # Parts of an account in the order they are read
+    _PART_CLASSES = (
+        (AccountPartFlag.COIN, CoinPart),
+        (AccountPartFlag.STAKE, StakePart),
+        (AccountPartFlag.DELEGATION, DelegationPart)
+    )
+
     def __init__(self, db: 'ContextDatabase'):
         """Constructor
 
@@ -72,6 +130,8 @@ class Storage(StorageBase):
         self._last_block = NULL_BLOCK
         self._genesis: Optional['Address'] = None
         self._fee_treasury: Optional['Address'] = None
+        # Used only on the thread which invokes blocks. Speculative executions use their own caches
+        self._part_cache = AccountPartCache()
 
     def open(self, context: 'IconScoreContext'):
         self._load_special_address(context, self._GENESIS_DB_KEY)
@@ -81,6 +141,7 @@ class Storage(StorageBase):
         Logger.info(tag=ROLLBACK_LOG_TAG,
                     msg=f"rollback() start: block_height={block_height} block_hash={bytes_to_hex(block_hash)}")
 
+        self._part_cache.clear()
         self._load_special_address(context, self._GENESIS_DB_KEY)
         self._load_special_address(context, self._TREASURY_DB_KEY)
         self.load_last_block_info(context)
@@ -283,6 +344,45 @@ class Storage(StorageBase):
                        stake_part=stake_part,
                        delegation_part=delegation_part)
 
+    def get_accounts(self,
+                     context: 'IconScoreContext',
+                     addresses: List['Address'],
+                     intent: 'Intent' = Intent.TRANSFER) -> List['Account']:
+        """Returns the accounts indicated by addresses
+
+        The parts of all accounts are read from the state db in one call
+
+        :param context:
+        :param addresses: account addresses
+        :param intent:
+        :return: accounts in the order of addresses
+        """
+        part_flags: 'AccountPartFlag' = AccountPartFlag(intent)
+        part_classes: list = [part_class for flag, part_class in self._PART_CLASSES if flag in part_flags]
+
+        keys: List[bytes] = [part_class.make_key(address) for address in addresses for part_class in part_classes]
+        values: List[Optional[bytes]] = self._db.multi_get(context, keys)
+
+        accounts: List['Account'] = []
+        i = 0
+        for address in addresses:
+            parts: dict = {}
+            for part_class in part_classes:
+                parts[part_class] = self._decode_part(context, part_class, address, keys[i], values[i])
+                i += 1
+
+            coin_part: Optional['CoinPart'] = parts.get(CoinPart)
+            stake_part: Optional['StakePart'] = parts.get(StakePart)
+            if stake_part is None and coin_part is not None and CoinPartFlag.HAS_UNSTAKE in coin_part.flags:
+                stake_part = self._get_part(context, StakePart, address)
+
+            accounts.append(Account(address, context.block.height, context.revision,
+                                    coin_part=coin_part,
+                                    stake_part=stake_part,
+                                    delegation_part=parts.get(DelegationPart)))
+
+        return accounts
+
     def get_treasury_account(self, context: 'IconScoreContext') -> 'Account':
         """Returns the instance of treasury account
 
@@ -291,16 +391,47 @@ class Storage(StorageBase):
         """
         return context.storage.icx.get_account(context, context.storage.icx.fee_treasury)
 
+    def _get_part_cache(self, context: 'IconScoreContext') -> Optional['AccountPartCache']:
+        if context.type != IconScoreContextType.INVOKE:
+            return None
+
+        if context.speculation is not None:
+            # A forked context runs on a worker thread
+            return context.speculation.part_cache
+
+        self._part_cache.set_block(context.block)
+        return self._part_cache
+
     def _get_part(self, context: 'IconScoreContext',
                   part_class: Union[type(CoinPart), type(StakePart), type(DelegationPart)],
                   address: 'Address') -> Union['CoinPart', 'StakePart', 'DelegationPart']:
         key: bytes = part_class.make_key(address)
         value: bytes = self._db.get(context, key)
 
+        return self._decode_part(context, part_class, address, key, value)
+
+    def _decode_part(self,
+                     context: 'IconScoreContext',
+                     part_class: Union[type(CoinPart), type(StakePart), type(DelegationPart)],
+                     address: 'Address',
+                     key: bytes,
+                     value: Optional[bytes]) -> Union['CoinPart', 'StakePart', 'DelegationPart']:
         if value is None and part_class is CoinPart:
             Logger.info(tag="PV", msg=f"No CoinPart: {address} {context.block}")
 
-        return part_class.from_bytes(value) if value else part_class()
+        if not value:
+            return part_class()
+
+        part_cache: Optional['AccountPartCache'] = self._get_part_cache(context)
+        if part_cache is None:
+            return part_class.from_bytes(value)
+
+        part: Optional['AccountPart'] = part_cache.get(key, value)
+        if part is None:
+            part = part_class.from_bytes(value)
+            part_cache.put(key, value, part)
+
+        return part
 
     def put_account(self,
                     context: 'IconScoreContext',
@@ -312,6 +443,7 @@ class Storage(StorageBase):
         :param account: account to save
         """
         parts = [account.coin_part, account.stake_part, account.delegation_part]
+        part_cache: Optional['AccountPartCache'] = self._get_part_cache(context)
 
         for part in parts:
             if part and part.is_dirty():
@@ -324,6 +456,11 @@ class Storage(StorageBase):
 
                 self._db.put(context, key, value)
 
+                # unstakes_info of StakePart is not encoded before Revision.MULTIPLE_UNSTAKE
+                if part_cache is not None and \
+                        (not isinstance(part, StakePart) or context.revision >= Revision.MULTIPLE_UNSTAKE.value):
+                    part_cache.put(key, value, part)
+
     def delete_account(self,
                        context: 'IconScoreContext',
                        account: 'Account'):
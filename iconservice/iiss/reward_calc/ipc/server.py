@@ -15,12 +15,14 @@
 
 import asyncio
 from asyncio import StreamReader, StreamWriter
+from logging import DEBUG
 from typing import Optional
 
 from iconcommons import Logger
 from .message import MessageType, Request
 from .message_queue import MessageQueue
 from .message_unpacker import MessageUnpacker
+from ....utils.log import is_log_enabled
 
 _TAG = "RCP"
 
@@ -101,7 +103,8 @@ class IPCServer(object):
                     break
 
                 data: bytes = request.to_bytes()
-                Logger.debug(tag=_TAG, msg=f"on_send(): data({data.hex()}")
+                if is_log_enabled(DEBUG):
+                    Logger.debug(tag=_TAG, msg=f"on_send(): data({data.hex()}")
                 Logger.info(tag=_TAG, msg=f"Sending Data : {request}")
                 writer.write(data)
                 await writer.drain()
@@ -125,7 +128,8 @@ class IPCServer(object):
                 if not isinstance(data, bytes) or len(data) == 0:
                     break
 
-                Logger.debug(tag=_TAG, msg=f"_on_recv(): data({data.hex()})")
+                if is_log_enabled(DEBUG):
+                    Logger.debug(tag=_TAG, msg=f"_on_recv(): data({data.hex()})")
 
                 self._unpacker.feed(data)
 
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from typing import Optional, Iterator
+
+from iconcommons.logger import Logger
+
+_TAG = "RECORDER"
+
+
+class InvokeRecorder(object):
+    """Records the requests which change the state as json lines to replay them offline
+
+    Each line is {"method": str, "request": dict, "stateRootHash": str}
+    and the requests are recorded as they are received, before the type conversion.
+    stateRootHash is only recorded on invoke.
+    """
+
+    INVOKE = "invoke"
+    WRITE_PRECOMMIT_STATE = "write_precommit_state"
+    ROLLBACK = "rollback"
+
+    def __init__(self, path: str):
+        dir_path: str = os.path.dirname(path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+
+        self._path: str = path
+        self._file = open(path, "a")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def record(self, method: str, request: dict, response: dict):
+        """Appends a request with the state root hash in its response
+
+        :param method: INVOKE, WRITE_PRECOMMIT_STATE or ROLLBACK
+        :param request: the request not converted
+        :param response: the response to the request
+        :return:
+        """
+        record = {"method": method, "request": request}
+        state_root_hash: Optional[str] = response.get("stateRootHash") if isinstance(response, dict) else None
+        if state_root_hash is not None:
+            record["stateRootHash"] = state_root_hash
+
+        try:
+            self._file.write(json.dumps(record))
+            self._file.write("\n")
+            self._file.flush()
+        except BaseException as e:
+            Logger.warning(tag=_TAG, msg=f"Failed to record {method}: {e}")
+
+    def close(self):
+        self._file.close()
+
+    @staticmethod
+    def load(path: str) -> Iterator[dict]:
+        """Reads the records from a file written by InvokeRecorder
+
+        :param path: the path of a record file
+        :return: records in order
+        """
+        with open(path, "r") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
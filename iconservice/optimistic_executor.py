@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
+
+from iconcommons.logger import Logger
+
+from .base.address import SYSTEM_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS
+from .block_profiler import TxProfile
+from .icx.storage import AccountPartCache
+
+if TYPE_CHECKING:
+    from .iconscore.icon_score_context import IconScoreContext
+    from .iconscore.icon_score_result import TransactionResult
+
+_TAG = "OPT"
+
+# The maximum number of transactions executed speculatively at a time per worker
+_WINDOW_SIZE_PER_WORKER = 8
+
+
+class Speculation(object):
+    """Records what a transaction has done while it is executed speculatively
+    """
+
+    def __init__(self):
+        # Keys of the states read from batches or state_db
+        self.read_keys: Set[bytes] = set()
+        # The fee which will be deposited to the treasury on commit
+        self.treasury_fee: int = 0
+        self.is_aborted: bool = False
+        # Account parts decoded in this execution. The cache of the block context is not shared with worker threads
+        self.part_cache = AccountPartCache()
+
+    def abort(self):
+        self.is_aborted = True
+
+
+class _SpeculativeResult(object):
+    def __init__(self,
+                 context: 'IconScoreContext',
+                 tx_result: Optional['TransactionResult']):
+        self.context = context
+        self.tx_result = tx_result
+
+    def is_valid(self, written_keys: Set[bytes]) -> bool:
+        """Returns whether this result is the same as the one of serial execution
+
+        :param written_keys: keys written by the transactions committed after this speculation started
+        :return:
+        """
+        if self.tx_result is None:
+            return False
+
+        speculation: 'Speculation' = self.context.speculation
+        if speculation.is_aborted or self.context.has_tx_side_effects():
+            return False
+
+        return speculation.read_keys.isdisjoint(written_keys)
+
+
+class OptimisticTxExecutor(object):
+    """Executes the transactions of a block speculatively on multiple threads
+
+    Transactions in a window are executed in parallel on the same block state,
+    each one with its own context which records the keys it reads.
+    Their results are committed in block order.
+    A transaction which has read a key written by a preceding one in the window is executed again.
+
+    Transactions which can change the states out of state_db (e.g. P-Rep, IISS, INV and deployed SCOREs)
+    are executed serially on the block context:
+    - Transactions to System SCORE or Governance SCORE and the ones with the data types except call and message
+    - Transactions which call System SCORE internally, detected on execution
+    """
+
+    def __init__(self,
+                 invoke_request: Callable[['IconScoreContext', dict, int], 'TransactionResult'],
+                 workers: int):
+        """Constructor
+
+        :param invoke_request: executes a transaction on a given context
+        :param workers: the number of threads to execute transactions
+        """
+        self._invoke_request = invoke_request
+        self._window_size: int = workers * _WINDOW_SIZE_PER_WORKER
+        self._thread_pool = ThreadPoolExecutor(workers)
+
+        # tx index: speculative result of the current window
+        self._results: Dict[int, '_SpeculativeResult'] = {}
+        # Keys written by the transactions committed in the current window
+        self._written_keys: Set[bytes] = set()
+
+        self._speculative_count: int = 0
+        self._reexecuted_count: int = 0
+        self._serial_count: int = 0
+
+    def close(self):
+        self.clear()
+        self._thread_pool.shutdown()
+
+    def clear(self):
+        """Discards the results of the current window
+        """
+        self._results.clear()
+        self._written_keys.clear()
+
+    def get_status(self) -> dict:
+        return {
+            "speculative": self._speculative_count,
+            "reexecuted": self._reexecuted_count,
+            "serial": self._serial_count
+        }
+
+    @staticmethod
+    def is_speculative(request: dict) -> bool:
+        params: dict = request['params']
+        if params.get('dataType') not in (None, 'call', 'message'):
+            return False
+
+        return params['to'] not in (SYSTEM_SCORE_ADDRESS, GOVERNANCE_SCORE_ADDRESS)
+
+    def invoke(self,
+               context: 'IconScoreContext',
+               tx_requests: List[dict],
+               index: int) -> 'TransactionResult':
+        """Invokes tx_requests[index] on the block context
+        It MUST be called in order of tx index and context.update_batch() MUST be called after each call
+
+        :param context: block context
+        :param tx_requests: transactions in a block
+        :param index: index of the transaction to invoke
+        :return:
+        """
+        tx_request: dict = tx_requests[index]
+
+        if not self.is_speculative(tx_request):
+            return self._invoke_serially(context, tx_request, index)
+
+        if index not in self._results:
+            self._execute_window(context, tx_requests, index)
+
+        result: '_SpeculativeResult' = self._results.pop(index)
+        if result.is_valid(self._written_keys):
+            self._speculative_count += 1
+        else:
+            # Execute it again on the current block state in which no conflict can occur
+            result = self._execute(context, tx_request, index)
+            if not result.is_valid(set()):
+                return self._invoke_serially(context, tx_request, index)
+            self._reexecuted_count += 1
+
+        return self._commit(context, result)
+
+    def _invoke_serially(self,
+                         context: 'IconScoreContext',
+                         tx_request: dict,
+                         index: int) -> 'TransactionResult':
+        # The remaining results can be invalidated by the states out of state_db
+        self.clear()
+        self._serial_count += 1
+
+        return self._invoke_request(context, tx_request, index)
+
+    def _execute_window(self, context: 'IconScoreContext', tx_requests: List[dict], start: int):
+        self.clear()
+
+        futures = {}
+        for index in range(start, min(start + self._window_size, len(tx_requests))):
+            tx_request: dict = tx_requests[index]
+            if not self.is_speculative(tx_request):
+                break
+
+            futures[index] = self._thread_pool.submit(self._execute, context, tx_request, index)
+
+        for index, future in futures.items():
+            self._results[index] = future.result()
+
+    def _execute(self,
+                 context: 'IconScoreContext',
+                 tx_request: dict,
+                 index: int) -> '_SpeculativeResult':
+        speculative_context: 'IconScoreContext' = context.fork()
+        speculative_context.speculation = Speculation()
+        if context.tx_profile is not None:
+            # Merged into the profile of the block context on commit
+            speculative_context.tx_profile = TxProfile(index, tx_request)
+
+        try:
+            tx_result: Optional['TransactionResult'] = \
+                self._invoke_request(speculative_context, tx_request, index)
+        except BaseException as e:
+            # It will be raised again on serial execution
+            Logger.info(tag=_TAG, msg=f"Speculative execution failed: index={index} {e}")
+            tx_result = None
+
+        return _SpeculativeResult(speculative_context, tx_result)
+
+    def _commit(self, context: 'IconScoreContext', result: '_SpeculativeResult') -> 'TransactionResult':
+        speculative_context: 'IconScoreContext' = result.context
+        tx_result: 'TransactionResult' = result.tx_result
+
+        for key, value in speculative_context.tx_batch.items():
+            context.tx_batch[key] = value
+
+        if context.tx_profile is not None and speculative_context.tx_profile is not None:
+            context.tx_profile.merge(speculative_context.tx_profile)
+
+        # The same as the fee charged on serial execution, which is always the last state update of a transaction
+        context.engine.icx.deposit_fee(context, speculative_context.speculation.treasury_fee)
+
+        self._written_keys.update(context.tx_batch)
+
+        context.tx = speculative_context.tx
+        context.msg = speculative_context.msg
+        context.step_counter = speculative_context.step_counter
+        context.event_logs = speculative_context.event_logs
+        context.traces = speculative_context.traces
+
+        tx_result.cumulative_step_used = context.cumulative_step_used + tx_result.step_used
+        context.cumulative_step_used += tx_result.step_used
+
+        return tx_result
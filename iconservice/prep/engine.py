@@ -166,13 +166,14 @@ class Engine(EngineBase, IISSEngineListener):
         icx_storage: 'IcxStorage' = context.storage.icx
         preps = PRepContainer()
 
-        for prep in context.storage.prep.get_prep_iterator():
+        prep_list: List['PRep'] = list(context.storage.prep.get_prep_iterator())
+        # Reads the accounts of all preps at once
+        accounts: List['Account'] = icx_storage.get_accounts(context, [prep.address for prep in prep_list], Intent.ALL)
 
+        for prep, account in zip(prep_list, accounts):
             if prep.status == PRepStatus.ACTIVE:
                 self.prep_address_converter.add_node_address(node=prep.node_address, prep=prep.address)
 
-            account: 'Account' = icx_storage.get_account(context, prep.address, Intent.ALL)
-
             prep.stake = account.stake
             prep.delegated = account.delegated_amount
 
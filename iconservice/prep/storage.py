@@ -84,10 +84,9 @@ class Storage(StorageBase):
         self._db.delete(context, key)
 
     def get_prep_iterator(self) -> Iterable['PRep']:
-        with self._db.key_value_db.get_sub_db(PRep.PREFIX).iterator() as it:
-            for key, value in it:
-                if key[0] == 0x00 and len(key) == 21:
-                    yield PRep.from_bytes(value)
+        for key, value in self._db.key_value_db.get_sub_db(PRep.PREFIX).scan(prefix=b"\x00"):
+            if len(key) == 21:
+                yield PRep.from_bytes(value)
 
     def put_term(self, context: 'IconScoreContext', term: 'Term'):
         value: bytes = MsgPackForDB.dumps(term.to_list())
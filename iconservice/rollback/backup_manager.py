@@ -15,7 +15,7 @@
 
 import os
 from enum import Flag
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List
 
 from iconcommons import Logger
 from iconservice.database.db import KeyValueDatabase
@@ -106,9 +106,8 @@ class BackupManager(object):
     @classmethod
     def _backup_rc_db(cls, writer: 'WriteAheadLogWriter', db: 'KeyValueDatabase', iiss_wal: 'IissWAL'):
         def get_rc_db_generator():
-            for key, _ in iiss_wal:
-                value: Optional[bytes] = db.get(key)
-                yield key, value
+            keys: List[bytes] = [key for key, _ in iiss_wal]
+            yield from zip(keys, db.multi_get(keys))
 
         writer.write_walogable(get_rc_db_generator())
 
@@ -118,8 +117,7 @@ class BackupManager(object):
             block_batch = {}
 
         def get_state_db_generator():
-            for key in block_batch:
-                value: Optional[bytes] = db.get(key)
-                yield key, value
+            keys: List[bytes] = list(block_batch)
+            yield from zip(keys, db.multi_get(keys))
 
         writer.write_walogable(get_state_db_generator())
@@ -29,6 +29,15 @@ def get_bloom_bits(value):
         yield bloom_bits
 
 
+def get_bloom_bits_of(value: bytes) -> int:
+    """Returns all bloom bits of a value in one int, which is the same as OR-ing get_bloom_bits(value)
+    """
+    h = hashlib.sha3_256(value).digest()
+    return (1 << (((h[0] << 8) | h[1]) & 2047)) | \
+        (1 << (((h[2] << 8) | h[3]) & 2047)) | \
+        (1 << (((h[4] << 8) | h[5]) & 2047))
+
+
 class BloomFilter(numbers.Number):
     value = None
 
@@ -41,8 +50,7 @@ class BloomFilter(numbers.Number):
     def add(self, value):
         if not isinstance(value, bytes):
             raise TypeError("Value must be of type `bytes`")
-        for bloom_bits in get_bloom_bits(value):
-            self.value |= bloom_bits
+        self.value |= get_bloom_bits_of(value)
 
     def extend(self, iterable):
         for value in iterable:
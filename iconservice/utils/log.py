@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from logging import INFO
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+from typing import Any, Callable, Dict, Optional
+
+from iconcommons.logger import Logger
+from iconcommons.logger._logger import icon_logger
+
+
+def is_log_enabled(level: int) -> bool:
+    """Returns True if the messages of a given level are logged
+
+    Check it before formatting a costly message
+    which Logger would format even if it is not logged
+
+    Logger.isEnabledFor() is not used because its cache is not cleared on setLevel()
+    for icon_logger which is not registered in the logging manager
+
+    :param level: logging.DEBUG, logging.INFO and so on
+    :return:
+    """
+    return level >= icon_logger.getEffectiveLevel()
+
+
+class PayloadLogger(object):
+    """Logs big payloads like the requests and responses of invoke at INFO level
+
+    A payload is formatted only when it is logged.
+    Only one out of every sample_interval payloads with the same title is logged,
+    and a logged one is truncated to max_size characters.
+    """
+
+    def __init__(self, max_size: int = 0, sample_interval: int = 1):
+        """Constructor
+
+        :param max_size: the maximum length of a logged payload (0: unlimited)
+        :param sample_interval: log one out of every sample_interval payloads with the same title
+        """
+        self._max_size: int = max_size
+        self._sample_interval: int = max(1, sample_interval)
+        # title -> the number of payloads
+        self._counts: Dict[str, int] = {}
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def sample_interval(self) -> int:
+        return self._sample_interval
+
+    def info(self, tag: str, title: str, payload: Any, formatter: Callable[[Any], str] = str):
+        """Logs "{title}: {formatter(payload)}"
+
+        The request and the response of a method are sampled together
+        if both of them are logged with their own titles on every call
+
+        :param tag:
+        :param title: e.g. "INVOKE Request"
+        :param payload:
+        :param formatter: converts payload to str
+        """
+        if not is_log_enabled(INFO):
+            return
+
+        count: int = self._counts.get(title, 0)
+        self._counts[title] = count + 1
+        if count % self._sample_interval != 0:
+            return
+
+        text: str = formatter(payload)
+        if 0 < self._max_size < len(text):
+            text = f"{text[:self._max_size]}...({len(text)} chars)"
+
+        Logger.info(tag=tag, msg=f"{title}: {text}")
+
+
+def start_async_log() -> 'QueueListener':
+    """Moves the handlers of the logger to a thread
+
+    The caller only puts log records into a queue,
+    and the thread writes them to the console or files.
+
+    :return: listener to pass to stop_async_log()
+    """
+    handlers: list = list(icon_logger.handlers)
+    queue = Queue(-1)
+
+    listener = QueueListener(queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        icon_logger.removeHandler(handler)
+    icon_logger.addHandler(QueueHandler(queue))
+
+    listener.start()
+    return listener
+
+
+def stop_async_log(listener: Optional['QueueListener']):
+    """Writes the queued log records and restores the handlers of the logger
+
+    :param listener: returned by start_async_log()
+    """
+    if listener is None:
+        return
+
+    listener.stop()
+
+    for handler in list(icon_logger.handlers):
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            icon_logger.removeHandler(handler)
+    for handler in listener.handlers:
+        icon_logger.addHandler(handler)
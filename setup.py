@@ -19,6 +19,9 @@ extra_requires = {
         "pytest-cov>=2.5.1",
         "iconsdk",
         "pytest-mock"
+    ],
+    "lmdb": [
+        "lmdb>=1.0.0"
     ]
 }
 
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Block profiler testcase
+"""
+
+import json
+import os
+from typing import TYPE_CHECKING, List
+
+from iconservice.block_profiler import BlockProfiler
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP, RPCMethod
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateBlockProfiler(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {
+            ConfigKey.BLOCK_PROFILE_COUNT: 2,
+            ConfigKey.BLOCK_PROFILE_DUMP_FLAG: True,
+            ConfigKey.LOG: {ConfigKey.LOG_FILE_PATH: f"{self._precommit_log_path}/"}
+        }
+
+    def test_block_profiles(self):
+        tx_results: List['TransactionResult'] = self.deploy_score(
+            score_root="sample_deploy_scores",
+            score_name="install/sample_token",
+            from_=self._admin,
+            deploy_params={"init_supply": hex(1000), "decimal": hex(18)})
+        token_address: 'Address' = tx_results[0].score_address
+
+        tx_list: list = [
+            self.create_transfer_icx_tx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP),
+            self.create_score_call_tx(from_=self._admin,
+                                      to_=token_address,
+                                      func_name="transfer",
+                                      params={"addr_to": str(self._accounts[0].address), "value": hex(1)}),
+            self.create_score_call_tx(from_=self._admin,
+                                      to_=token_address,
+                                      func_name="transfer",
+                                      params={"addr_to": str(self._accounts[1].address), "value": hex(2)})
+        ]
+        tx_results: List['TransactionResult'] = self.process_confirm_block_tx(tx_list)
+
+        profiles: list = self._query({"count": 1}, RPCMethod.DEBUG_GET_BLOCK_PROFILES)
+        self.assertEqual(1, len(profiles))
+
+        profile: dict = profiles[0]
+        self.assertEqual(self._block_height, profile["blockHeight"])
+        self.assertEqual(self._prev_block_hash, profile["blockHash"])
+        self.assertEqual(len(tx_list), profile["txCount"])
+        self.assertIsNotNone(profile["commitElapsedUs"])
+        # Blocks are committed without WAL before the revision of IISS
+        self.assertEqual(["prepare", "stateDb"], list(profile["commitPhasesUs"]))
+        self.assertGreaterEqual(profile["commitElapsedUs"], sum(profile["commitPhasesUs"].values()))
+        self.assertGreaterEqual(profile["invokeElapsedUs"],
+                                profile["beforeTxProcessElapsedUs"] + profile["afterTxProcessElapsedUs"])
+
+        for tx_result, tx_profile in zip(tx_results, profile["txs"]):
+            self.assertEqual(tx_result.tx_hash, tx_profile["txHash"])
+            self.assertEqual(tx_result.step_used, tx_profile["stepUsed"])
+            self.assertEqual(len(tx_result.event_logs), tx_profile["eventLogs"])
+            self.assertGreater(tx_profile["dbGets"], 0)
+            self.assertGreater(tx_profile["dbPuts"], 0)
+
+        token_transfer: dict = profile["scores"][str(token_address)]["transfer"]
+        self.assertEqual(2, token_transfer["count"])
+        self.assertEqual(tx_results[1].step_used + tx_results[2].step_used, token_transfer["stepUsed"])
+        self.assertEqual(1, profile["scores"][str(self._accounts[0].address)]["transfer"]["count"])
+
+        # Only the last 2 blocks are kept
+        self.transfer_icx(from_=self._admin, to_=self._accounts[1], value=ICX_IN_LOOP)
+        profiles: list = self._query({}, RPCMethod.DEBUG_GET_BLOCK_PROFILES)
+        self.assertEqual([self._block_height, self._block_height - 1], [p["blockHeight"] for p in profiles])
+
+        # Every committed block is dumped
+        with open(os.path.join(self._precommit_log_path, BlockProfiler.FILE_NAME)) as f:
+            dumped_profiles: list = [json.loads(line) for line in f]
+        self.assertEqual(list(range(self._block_height + 1)), [p["blockHeight"] for p in dumped_profiles])
+
+
+class TestIntegrateBlockProfilerParallel(TestIntegrateBlockProfiler):
+    """Transactions are executed on forked contexts of worker threads
+    """
+
+    def _make_init_config(self) -> dict:
+        conf: dict = super()._make_init_config()
+        conf[ConfigKey.PARALLEL_TX_WORKERS] = 4
+        return conf
@@ -19,12 +19,15 @@
 import hashlib
 import time
 import unittest
+from unittest.mock import patch
 
 from iconservice.base.address import AddressPrefix, MalformedAddress, GOVERNANCE_SCORE_ADDRESS
 from iconservice.base.block import Block
 from iconservice.base.exception import ExceptionCode, InvalidParamsException
 from iconservice.base.type_converter import TypeConverter
 from iconservice.base.type_converter_templates import ParamType
+from iconservice.database.db import KeyValueDatabase, KeyValueDatabaseSnapshot
+from iconservice.icon_service_engine import IconServiceEngine
 from iconservice.icon_constant import ConfigKey
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from iconservice.iconscore.icon_score_result import TransactionResult
@@ -689,6 +692,39 @@ class TestIconServiceEngine(TestIntegrateBase):
                 converted_request['method'], converted_request['params'])
             self.assertEqual(0, balance)
 
+    def test_close_right_after_invoke(self):
+        snapshots = []
+
+        def get_snapshot(db: 'KeyValueDatabase') -> 'KeyValueDatabaseSnapshot':
+            snapshot = get_snapshot.original(db)
+            snapshots.append(snapshot)
+            return snapshot
+
+        get_snapshot.original = KeyValueDatabase.get_snapshot
+
+        tx = self.create_transfer_icx_tx(self._admin, self._accounts[0], icx_to_loop(1))
+        with patch.object(KeyValueDatabase, "get_snapshot", autospec=True, side_effect=get_snapshot), \
+                patch.object(KeyValueDatabaseSnapshot, "close", autospec=True,
+                             side_effect=KeyValueDatabaseSnapshot.close) as close:
+            self.make_and_req_block([tx])
+
+            # The accounts are prefetched even if the block fails before its transactions
+            with patch.object(IconServiceEngine, "_before_transaction_process",
+                              side_effect=InvalidParamsException("before transactions")):
+                with self.assertRaises(InvalidParamsException):
+                    self.make_and_req_block([tx])
+
+            self.icon_service_engine.close()
+
+        # Every snapshot, including the ones for prefetching, is closed before state_db is closed
+        closed = [call[0][0] for call in close.call_args_list]
+        self.assertTrue(len(snapshots) > 0)
+        self.assertTrue(all(any(snapshot is c for c in closed) for snapshot in snapshots))
+
+        # Opened again to be closed on tearDown
+        self.icon_service_engine = IconServiceEngine()
+        self.icon_service_engine.open(self._config)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Speculative transaction execution testcase
+"""
+
+from typing import TYPE_CHECKING, List
+
+from iconservice.base.address import SYSTEM_SCORE_ADDRESS
+from iconservice.base.block import Block
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP
+from iconservice.optimistic_executor import OptimisticTxExecutor
+from tests import create_address, create_block_hash, create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateParallelInvoke(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {
+            ConfigKey.SERVICE: {ConfigKey.SERVICE_FEE: True},
+            ConfigKey.PARALLEL_TX_WORKERS: 4
+        }
+
+    def setUp(self):
+        super().setUp()
+
+        tx_list: list = [
+            self.create_transfer_icx_tx(from_=self._admin, to_=account, value=1000 * ICX_IN_LOOP)
+            for account in self._accounts[:10]
+        ]
+        self.process_confirm_block_tx(tx_list)
+
+        tx_results: List['TransactionResult'] = self.deploy_score(
+            score_root="sample_deploy_scores",
+            score_name="install/sample_token",
+            from_=self._accounts[0],
+            deploy_params={"init_supply": hex(1000), "decimal": hex(18)},
+            step_limit=10 ** 10)
+        self.token_address: 'Address' = tx_results[0].score_address
+
+    def _invoke(self, tx_list: list, block: 'Block', parallel: bool) -> tuple:
+        engine = self.icon_service_engine
+        executor: 'OptimisticTxExecutor' = engine._optimistic_tx_executor
+
+        if not parallel:
+            engine._optimistic_tx_executor = None
+        try:
+            tx_results, state_root_hash, _, _ = engine.invoke(block=block, tx_requests=tx_list)
+        finally:
+            engine._optimistic_tx_executor = executor
+
+        results: list = []
+        for tx_result in tx_results:
+            result: dict = tx_result.to_dict()
+            del result['block_hash']
+            results.append(result)
+
+        return results, state_root_hash
+
+    def _assert_same_as_serial_invoke(self, tx_list: list) -> dict:
+        """Invokes a block with and without speculative execution and compares the results
+
+        :return: the numbers of the transactions counted by OptimisticTxExecutor on this block
+        """
+        executor: 'OptimisticTxExecutor' = self.icon_service_engine._optimistic_tx_executor
+        prev_status: dict = executor.get_status()
+
+        block_height: int = self._block_height + 1
+        timestamp_us: int = create_timestamp()
+        parallel_block = Block(block_height, create_block_hash(), timestamp_us, self._prev_block_hash, 0)
+        serial_block = Block(block_height, create_block_hash(), timestamp_us, self._prev_block_hash, 0)
+
+        parallel_results, parallel_state_root_hash = self._invoke(tx_list, parallel_block, parallel=True)
+        serial_results, serial_state_root_hash = self._invoke(tx_list, serial_block, parallel=False)
+
+        self.assertEqual(serial_results, parallel_results)
+        self.assertEqual(serial_state_root_hash, parallel_state_root_hash)
+
+        self._write_precommit_state(parallel_block)
+
+        status: dict = executor.get_status()
+        return {key: status[key] - prev_status[key] for key in status}
+
+    def test_independent_transfers(self):
+        tx_list: list = [
+            self.create_transfer_icx_tx(from_=self._accounts[i], to_=create_address(), value=ICX_IN_LOOP)
+            for i in range(10)
+        ]
+        status: dict = self._assert_same_as_serial_invoke(tx_list)
+        self.assertEqual(10, status["speculative"])
+
+    def test_conflicting_transfers(self):
+        tx_list: list = []
+        for i in range(9):
+            # Each transfer depends on the balance changed by the previous one
+            tx_list.append(self.create_transfer_icx_tx(from_=self._accounts[i],
+                                                       to_=self._accounts[i + 1],
+                                                       value=(i + 1) * ICX_IN_LOOP))
+        # Succeeds only when the transfer to accounts[9] is applied
+        tx_list.append(self.create_transfer_icx_tx(from_=self._accounts[9],
+                                                   to_=self._accounts[0],
+                                                   value=1005 * ICX_IN_LOOP,
+                                                   disable_pre_validate=True))
+        # Reads the balance of the fee treasury changed by all the preceding transactions
+        tx_list.append(self.create_transfer_icx_tx(from_=self._accounts[1],
+                                                   to_=self._fee_treasury,
+                                                   value=ICX_IN_LOOP))
+
+        self._assert_same_as_serial_invoke(tx_list)
+
+    def test_token_transfers_and_deploy(self):
+        tx_list: list = []
+        for i in range(1, 6):
+            tx_list.append(self.create_score_call_tx(from_=self._accounts[0],
+                                                     to_=self.token_address,
+                                                     func_name="transfer",
+                                                     params={"addr_to": str(self._accounts[i].address),
+                                                             "value": hex(i * ICX_IN_LOOP)}))
+        # Deploying a SCORE is executed serially
+        tx_list.append(self.create_deploy_score_tx(score_root="sample_deploy_scores",
+                                                   score_name="install/sample_token",
+                                                   from_=self._accounts[1],
+                                                   to_=SYSTEM_SCORE_ADDRESS,
+                                                   deploy_params={"init_supply": hex(10), "decimal": hex(18)},
+                                                   step_limit=10 ** 10))
+        for i in range(1, 6):
+            tx_list.append(self.create_score_call_tx(from_=self._accounts[i],
+                                                     to_=self.token_address,
+                                                     func_name="transfer",
+                                                     params={"addr_to": str(self._accounts[0].address),
+                                                             "value": hex(ICX_IN_LOOP)}))
+
+        status: dict = self._assert_same_as_serial_invoke(tx_list)
+        self.assertEqual(1, status["serial"])
+
+    def test_reexecution_with_default_params(self):
+        tx_results: List['TransactionResult'] = self.deploy_score(
+            score_root="sample_deploy_scores",
+            score_name="install/sample_score_fee_sharing",
+            from_=self._accounts[0],
+            step_limit=10 ** 10)
+        score_address: 'Address' = tx_results[0].score_address
+
+        # Conflicts on the balance of the sender are resolved by executing them again on the same requests
+        # which must not be changed by the former execution, e.g. by filling "proportion" with its default value
+        tx_list: list = [
+            self.create_score_call_tx(from_=self._accounts[1],
+                                      to_=score_address,
+                                      func_name="set_value",
+                                      params={"value": hex(i)},
+                                      step_limit=10 ** 7)
+            for i in range(3)
+        ]
+
+        status: dict = self._assert_same_as_serial_invoke(tx_list)
+        self.assertEqual(2, status["reexecuted"])
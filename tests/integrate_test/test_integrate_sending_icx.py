@@ -19,6 +19,7 @@
 
 from typing import TYPE_CHECKING, List
 
+from iconservice.base.exception import OutOfBalanceException, InvalidParamsException
 from iconservice.icon_constant import ICX_IN_LOOP
 from tests.integrate_test.test_integrate_base import TestIntegrateBase
 
@@ -490,3 +491,22 @@ class TestIntegrateSendingIcx(TestIntegrateBase):
 
         # Checks sending SCORE balance. It should be 1
         self.assertEqual(value, self.get_balance(sending_score_address))
+
+    def test_validate_transactions(self):
+        value = 1 * ICX_IN_LOOP
+        txs: List[dict] = [
+            self.create_transfer_icx_tx(self._admin, self._accounts[1], value, disable_pre_validate=True),
+            # No balance to pay the fee
+            self.create_transfer_icx_tx(self._accounts[1], self._accounts[2], value, disable_pre_validate=True),
+            self.create_transfer_icx_tx(self._admin, self._accounts[2], -1, disable_pre_validate=True),
+            self.create_transfer_icx_tx(self._admin, self._accounts[2], value, disable_pre_validate=True),
+        ]
+
+        errors: list = self.icon_service_engine.validate_transactions(txs)
+
+        self.assertEqual(len(txs), len(errors))
+        self.assertIsNone(errors[0])
+        self.assertIsInstance(errors[1], OutOfBalanceException)
+        self.assertIsInstance(errors[2], InvalidParamsException)
+        self.assertIsNone(errors[3])
+        self.assertEqual([], self.icon_service_engine.validate_transactions([]))
@@ -61,6 +61,10 @@ class TestIntegrateSimpleInvoke(TestIntegrateBase):
         self.assertTrue(isinstance(last_block['timestamp'], int))
         self.assertTrue(last_block['timestamp'])
 
+        state_db_cache = response['stateDbCache']
+        for key in ('maxSize', 'size', 'count', 'hits', 'misses', 'evictions'):
+            self.assertTrue(isinstance(state_db_cache[key], int))
+
     def test_invoke_success(self):
         value1 = 3 * ICX_IN_LOOP
         self.transfer_icx(from_=self._admin,
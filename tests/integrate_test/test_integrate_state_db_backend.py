@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""State DB backend testcase
+"""
+
+import os
+from typing import TYPE_CHECKING, List
+
+from iconservice.database.backend import MemoryBackend
+from iconservice.database.factory import ContextDatabaseFactory
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP, ICON_DEX_DB_NAME, DBBackend
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateStateDBBackend(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.STATE_DB_BACKEND: DBBackend.MEMORY}
+
+    def test_memory_backend(self):
+        self.assertIsInstance(ContextDatabaseFactory.get_shared_db().key_value_db._db, MemoryBackend)
+        self.assertFalse(os.path.exists(os.path.join(self._state_db_root_path, ICON_DEX_DB_NAME)))
+
+        tx_results: List['TransactionResult'] = self.deploy_score(
+            score_root="sample_deploy_scores",
+            score_name="install/sample_token",
+            from_=self._admin,
+            deploy_params={"init_supply": hex(1000), "decimal": hex(18)})
+        token_address: 'Address' = tx_results[0].score_address
+
+        self.transfer_icx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP)
+        self.score_call(from_=self._admin,
+                        to_=token_address,
+                        func_name="transfer",
+                        params={"addr_to": str(self._accounts[0].address), "value": hex(1)})
+
+        self.assertEqual(ICX_IN_LOOP, self.get_balance(self._accounts[0]))
+        balance: int = self.query_score(from_=None,
+                                        to_=token_address,
+                                        func_name="balance_of",
+                                        params={"addr_from": str(self._accounts[0].address)})
+        self.assertEqual(1, balance)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""State DB bloom index testcase
+"""
+
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateStateDBBloom(TestIntegrateBase):
+
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.STATE_DB_BLOOM_FP_RATE: 0.01}
+
+    def test_bloom_index(self):
+        status: dict = self._query({"filter": ["stateDbBloom"]}, "ise_getStatus")["stateDbBloom"]
+        avoided: int = status["avoided"]
+        self.assertEqual(0.01, status["falsePositiveRate"])
+
+        # Transfers to new accounts read the parts which do not exist
+        for account in self._accounts[:3]:
+            self.transfer_icx(from_=self._admin, to_=account, value=ICX_IN_LOOP)
+            self.assertEqual(ICX_IN_LOOP, self.get_balance(account))
+
+        status: dict = self._query({"filter": ["stateDbBloom"]}, "ise_getStatus")["stateDbBloom"]
+        self.assertGreater(status["avoided"], avoided)
+        self.assertGreaterEqual(status["lookups"], status["avoided"])
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import shutil
+import unittest
+
+from iconservice.database.bloom_index import BloomIndex
+from iconservice.database.db import KeyValueDatabase
+from iconservice.icon_constant import DBBackend
+from tests import rmtree
+
+
+class TestBloomIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.path = "state_db.bloom"
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_might_contain(self):
+        bloom = BloomIndex(10_000, 0.01)
+        keys = [i.to_bytes(8, "big") for i in range(10_000)]
+        for key in keys:
+            bloom.add(key)
+
+        self.assertTrue(all(bloom.might_contain(key) for key in keys))
+
+        false_positives = sum(1 for i in range(10_000, 20_000) if bloom.might_contain(i.to_bytes(8, "big")))
+        self.assertLess(false_positives, 10_000 * 0.01 * 2)
+
+        status: dict = bloom.get_status()
+        self.assertEqual(20_000, status["lookups"])
+        self.assertEqual(10_000 - false_positives, status["avoided"])
+        # Keys which collide with the added ones on all bits are not counted
+        self.assertLessEqual(status["count"], 10_000)
+        self.assertGreater(status["count"], 10_000 * (1 - 0.01))
+
+    def test_is_full(self):
+        bloom = BloomIndex(0, 0.01)
+        self.assertEqual(BloomIndex.MIN_CAPACITY, bloom.capacity)
+
+        keys = []
+        while bloom.count < bloom.capacity:
+            keys.append(len(keys).to_bytes(8, "big"))
+            bloom.add(keys[-1])
+        self.assertFalse(bloom.is_full())
+
+        # Rewriting keys does not fill the index
+        for key in keys:
+            bloom.add(key)
+        self.assertEqual(bloom.capacity, bloom.count)
+        self.assertFalse(bloom.is_full())
+
+        bloom.add(b"key")
+        self.assertTrue(bloom.is_full())
+
+    def test_invalid_fp_rate(self):
+        for fp_rate in (0.0, 1.0, -0.1):
+            with self.assertRaises(ValueError):
+                BloomIndex(100, fp_rate)
+
+    def test_save_and_load(self):
+        bloom = BloomIndex.build((b"key0", b"key1"), 100, 0.01)
+        marker = os.urandom(BloomIndex.MARKER_SIZE)
+        bloom.save(self.path, marker)
+
+        loaded: BloomIndex = BloomIndex.load(self.path, 0.01, marker)
+        self.assertEqual(2, loaded.count)
+        self.assertTrue(loaded.might_contain(b"key0"))
+        self.assertTrue(loaded.might_contain(b"key1"))
+        # The file is removed on load so that a stale index is not loaded after a crash
+        self.assertFalse(os.path.exists(self.path))
+        self.assertIsNone(BloomIndex.load(self.path, 0.01, marker))
+
+        # An index with another false positive rate is not loaded
+        bloom.save(self.path, marker)
+        self.assertIsNone(BloomIndex.load(self.path, 0.001, marker))
+
+        # An index saved with another database is not loaded
+        for other_marker in (None, os.urandom(BloomIndex.MARKER_SIZE)):
+            bloom.save(self.path, marker)
+            self.assertIsNone(BloomIndex.load(self.path, 0.01, other_marker))
+            self.assertFalse(os.path.exists(self.path))
+
+        with open(self.path, "wb") as f:
+            f.write(b"invalid")
+        self.assertIsNone(BloomIndex.load(self.path, 0.01, marker))
+
+
+class TestKeyValueDatabaseWithBloomIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.state_db_root_path = "state_db"
+        rmtree(self.state_db_root_path)
+        os.mkdir(self.state_db_root_path)
+        self.path = os.path.join(self.state_db_root_path, "db")
+        self.bloom_path = f"{self.path}.bloom"
+
+    def tearDown(self):
+        rmtree(self.state_db_root_path)
+
+    def test_get(self):
+        db = KeyValueDatabase.from_path(self.path, bloom_fp_rate=0.01, cache_size=1024)
+        db.put(b"key0", b"value0")
+        db.write_batch([(b"key1", b"value1"), (b"key0", None)])
+
+        self.assertIsNone(db.get(b"key0"))
+        self.assertEqual(b"value1", db.get(b"key1"))
+        self.assertIsNone(db.get(b"key2"))
+        self.assertEqual([None, b"value1", None], db.multi_get([b"key0", b"key1", b"key3"]))
+        self.assertEqual(b"value1", db.get_snapshot().get(b"key1"))
+        self.assertIsNone(db.get_snapshot().get(b"key4"))
+
+        status: dict = db.get_bloom_status()
+        self.assertEqual(2, status["count"])
+        # key2, key3 and key4 are skipped
+        self.assertEqual(3, status["avoided"])
+        db.close()
+
+    def test_persistence(self):
+        db = KeyValueDatabase.from_path(self.path, bloom_fp_rate=0.01)
+        db.put(b"key0", b"value0")
+        self.assertFalse(os.path.exists(self.bloom_path))
+        db.close()
+        self.assertTrue(os.path.exists(self.bloom_path))
+
+        # The saved index is loaded and removed until the db is closed again
+        db = KeyValueDatabase.from_path(self.path, bloom_fp_rate=0.01)
+        self.assertFalse(os.path.exists(self.bloom_path))
+        self.assertEqual(1, db.bloom_index.count)
+        self.assertEqual(b"value0", db.get(b"key0"))
+        db.put(b"key1", b"value1")
+        db.close()
+
+        # The index is rebuilt from the db if it was not saved, e.g. on a crash
+        os.remove(self.bloom_path)
+        db = KeyValueDatabase.from_path(self.path, bloom_fp_rate=0.01)
+        self.assertEqual(2, db.bloom_index.count)
+        self.assertEqual(b"value0", db.get(b"key0"))
+        self.assertEqual(b"value1", db.get(b"key1"))
+        db.close()
+
+        # The index is not loaded with the database restored from a backup made while it was open
+        db = KeyValueDatabase.from_path(self.path, bloom_fp_rate=0.01)
+        shutil.copytree(self.path, f"{self.path}.backup")
+        db.put(b"key2", b"value2")
+        db.close()
+        self.assertTrue(os.path.exists(self.bloom_path))
+        rmtree(self.path)
+        os.rename(f"{self.path}.backup", self.path)
+
+        db = KeyValueDatabase.from_path(self.path, bloom_fp_rate=0.01)
+        self.assertEqual(2, db.bloom_index.count)
+        self.assertEqual(b"value1", db.get(b"key1"))
+        self.assertIsNone(db.get(b"key2"))
+        db.close()
+
+        # The index is not loaded after the database was opened without it
+        db = KeyValueDatabase.from_path(self.path)
+        db.put(b"key3", b"value3")
+        db.close()
+        db = KeyValueDatabase.from_path(self.path, bloom_fp_rate=0.01)
+        self.assertEqual(b"value3", db.get(b"key3"))
+        db.close()
+
+        # The index of the memory backend is not saved
+        os.remove(self.bloom_path)
+        db = KeyValueDatabase.from_path(self.path, bloom_fp_rate=0.01, backend=DBBackend.MEMORY)
+        db.close()
+        self.assertFalse(os.path.exists(self.bloom_path))
+
+    def test_rebuild(self):
+        db = KeyValueDatabase.from_path(self.path, bloom_fp_rate=0.01)
+        bloom: BloomIndex = db.bloom_index
+        snapshot = db.get_snapshot()
+
+        # Some keys collide with the added ones on all bits, so they do not fill the index
+        keys = [i.to_bytes(8, "big") for i in range(bloom.capacity * 11 // 10)]
+        db.write_batch((key, b"value") for key in keys)
+
+        # The index grows as more keys than its capacity are written
+        self.assertIsNot(bloom, db.bloom_index)
+        self.assertLessEqual(db.bloom_index.count, len(keys))
+        self.assertLess(db.bloom_index.count, db.bloom_index.capacity)
+        self.assertEqual(b"value", db.get(keys[-1]))
+        self.assertIsNone(snapshot.get(keys[-1]))
+        db.close()
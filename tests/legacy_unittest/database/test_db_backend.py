@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import os
+import unittest
+
+from iconservice.base.exception import DatabaseException
+from iconservice.database.backend import KeyValueBackend, open_backend
+from iconservice.database.db import KeyValueDatabase
+from iconservice.icon_constant import DBBackend
+from tests import rmtree
+
+try:
+    import lmdb
+except ImportError:
+    lmdb = None
+
+
+class _TestBackend(object):
+    """Runs the same cases on every backend to check that they behave like LevelDB
+    """
+    BACKEND: str = None
+    KEYS = [b"a", b"a1", b"a2", b"b", b"b\xff", b"b\xff\x01", b"c1", b"c2"]
+
+    def setUp(self):
+        self.path = "backend_db"
+        rmtree(self.path)
+
+        self.db = open_backend(self.BACKEND, self.path)
+        for key in self.KEYS:
+            self.db.put(key, key + b"-value")
+
+    def tearDown(self):
+        self.db.close()
+        rmtree(self.path)
+
+    def test_is_backend(self):
+        self.assertIsInstance(self.db, KeyValueBackend)
+
+    def test_get_put_delete(self):
+        db = self.db
+
+        self.assertEqual(b"a1-value", db.get(b"a1"))
+        self.assertIsNone(db.get(b"d"))
+        self.assertEqual(b"default", db.get(b"d", b"default"))
+
+        db.put(b"a1", b"new")
+        self.assertEqual(b"new", db.get(b"a1"))
+
+        db.delete(b"a1")
+        self.assertIsNone(db.get(b"a1"))
+        # Deleting an absent key is not an error
+        db.delete(b"a1")
+
+    def test_write_batch(self):
+        db = self.db
+
+        with db.write_batch() as batch:
+            batch.put(b"d", b"d-value")
+            batch.delete(b"a")
+            batch.put(b"a1", b"new")
+            self.assertIsNone(db.get(b"d"))
+
+        self.assertEqual(b"d-value", db.get(b"d"))
+        self.assertIsNone(db.get(b"a"))
+        self.assertEqual(b"new", db.get(b"a1"))
+
+        with self.assertRaises(ValueError):
+            with db.write_batch(transaction=True) as batch:
+                batch.put(b"e", b"e-value")
+                raise ValueError
+        self.assertIsNone(db.get(b"e"))
+
+        batch = db.write_batch()
+        batch.put(b"e", b"e-value")
+        batch.write()
+        self.assertEqual(b"e-value", db.get(b"e"))
+
+    def test_iterator(self):
+        db = self.db
+
+        self.assertEqual([(key, key + b"-value") for key in self.KEYS], list(db.iterator()))
+        self.assertEqual(self.KEYS[::-1], list(db.iterator(reverse=True, include_value=False)))
+        self.assertEqual([b"a1-value"], list(db.iterator(start=b"a1", stop=b"a2", include_key=False)))
+
+        cases = [
+            dict(start=b"a1"),
+            dict(start=b"a1", include_start=False),
+            dict(stop=b"b"),
+            dict(stop=b"b", include_stop=True),
+            dict(start=b"a0", stop=b"b0"),
+            dict(start=b"a1", stop=b"c1", include_start=False, include_stop=True),
+            dict(start=b"d"),
+            dict(stop=b"0"),
+            dict(prefix=b"a"),
+            dict(prefix=b"b\xff"),
+            dict(prefix=b"d"),
+        ]
+        for kwargs in cases:
+            keys = [key for key in self.KEYS if self._in_range(key, **kwargs)]
+            self.assertEqual(keys, list(db.iterator(include_value=False, **kwargs)), kwargs)
+            self.assertEqual(keys[::-1], list(db.iterator(reverse=True, include_value=False, **kwargs)), kwargs)
+
+        with self.assertRaises(TypeError):
+            list(db.iterator(prefix=b"a", start=b"a1"))
+
+        with db.iterator() as it:
+            self.assertEqual((b"a", b"a-value"), next(it))
+
+    @staticmethod
+    def _in_range(key: bytes, start=None, stop=None, include_start=True, include_stop=False, prefix=None) -> bool:
+        if prefix is not None:
+            return key.startswith(prefix)
+        if start is not None and (key < start or (key == start and not include_start)):
+            return False
+        if stop is not None and (key > stop or (key == stop and not include_stop)):
+            return False
+        return True
+
+    def test_prefixed_db(self):
+        db = self.db.prefixed_db(b"b")
+
+        self.assertEqual(b"b\xff-value", db.get(b"\xff"))
+        self.assertIsNone(db.get(b"1"))
+
+        db.put(b"1", b"b1-value")
+        self.assertEqual(b"b1-value", self.db.get(b"b1"))
+
+        self.assertEqual([b"", b"1", b"\xff", b"\xff\x01"], list(db.iterator(include_value=False)))
+        self.assertEqual([b"\xff\x01", b"\xff"], list(db.iterator(reverse=True, prefix=b"\xff", include_value=False)))
+        self.assertEqual([b"1"], list(db.iterator(start=b"0", stop=b"\xff", include_value=False)))
+
+        with db.write_batch() as batch:
+            batch.delete(b"1")
+            batch.put(b"2", b"b2-value")
+        self.assertIsNone(self.db.get(b"b1"))
+        self.assertEqual(b"b2-value", self.db.get(b"b2"))
+
+    def test_snapshot(self):
+        db = self.db
+
+        snapshot = db.snapshot()
+        db.put(b"a1", b"new")
+        db.delete(b"c1")
+        db.put(b"d", b"d-value")
+
+        self.assertEqual(b"a1-value", snapshot.get(b"a1"))
+        self.assertEqual(b"c1-value", snapshot.get(b"c1"))
+        self.assertIsNone(snapshot.get(b"d"))
+        self.assertEqual(self.KEYS, list(snapshot.iterator(include_value=False)))
+        self.assertEqual(b"new", db.get(b"a1"))
+        snapshot.close()
+
+        snapshot = db.prefixed_db(b"c").snapshot()
+        db.put(b"c3", b"c3-value")
+        self.assertEqual([b"2"], list(snapshot.iterator(include_value=False)))
+        self.assertIsNone(snapshot.get(b"3"))
+        snapshot.close()
+
+    def test_key_value_database(self):
+        kv_db = KeyValueDatabase(self.db)
+
+        kv_db.put(b"d", b"d-value")
+        self.assertEqual(b"d-value", kv_db.get(b"d"))
+        self.assertEqual([b"c1-value", b"c2-value"], [value for _, value in kv_db.get_sub_db(b"c").iterator()])
+
+        snapshot = kv_db.get_snapshot()
+        kv_db.delete(b"d")
+        self.assertEqual(b"d-value", snapshot.get(b"d"))
+
+
+class TestLevelDBBackend(_TestBackend, unittest.TestCase):
+    BACKEND = DBBackend.LEVELDB
+
+
+class TestMemoryBackend(_TestBackend, unittest.TestCase):
+    BACKEND = DBBackend.MEMORY
+
+    def test_close(self):
+        self.db.close()
+        self.assertIsNone(self.db.get(b"a"))
+
+    def test_snapshot_copy_on_write(self):
+        db = self.db
+
+        # Snapshots share the data until it is changed
+        snapshot0 = db.snapshot()
+        snapshot1 = db.snapshot()
+        self.assertIs(snapshot0._data, snapshot1._data)
+        self.assertIs(db._data, snapshot0._data)
+
+        # Deleting a missing key changes nothing
+        db.delete(b"d")
+        self.assertIs(db._data, snapshot0._data)
+
+        with db.write_batch() as batch:
+            batch.put(b"a1", b"new")
+            batch.put(b"d", b"d-value")
+        self.assertIsNot(db._data, snapshot0._data)
+        self.assertEqual(b"a1-value", snapshot1.get(b"a1"))
+        self.assertIsNone(snapshot1.get(b"d"))
+        self.assertEqual(self.KEYS, list(snapshot1.iterator(include_value=False)))
+
+        # The copied data is changed in place until the next snapshot
+        data = db._data
+        db.put(b"e", b"e-value")
+        self.assertIs(data, db._data)
+
+        # An iterator of the backend sees the changes after it was created
+        it = db.iterator(prefix=b"a")
+        db.snapshot()
+        db.put(b"a1", b"newer")
+        self.assertEqual(b"newer", dict(it)[b"a1"])
+
+
+@unittest.skipIf(lmdb is None, "lmdb is not installed")
+class TestLMDBBackend(_TestBackend, unittest.TestCase):
+    BACKEND = DBBackend.LMDB
+
+    def test_create_if_missing(self):
+        with self.assertRaises(DatabaseException):
+            open_backend(self.BACKEND, os.path.join(self.path, "missing"), create_if_missing=False)
+
+
+class TestOpenBackend(unittest.TestCase):
+
+    def test_unknown_backend(self):
+        with self.assertRaises(DatabaseException):
+            open_backend("rocksdb", "backend_db")
+
+    def test_from_path(self):
+        db = KeyValueDatabase.from_path("backend_db", backend=DBBackend.MEMORY)
+        db.put(b"key", b"value")
+        self.assertEqual(b"value", db.get(b"key"))
+        self.assertFalse(os.path.exists("backend_db"))
+        db.close()
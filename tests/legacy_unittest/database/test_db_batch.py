@@ -171,6 +171,27 @@ class TestBatch(unittest.TestCase):
         ret = block_batch.digest()
         self.assertEqual(expected, ret)
 
+    def test_digest_with_large_data(self):
+        # The digest is computed in chunks but MUST be the same as the one of the joined bytes
+        block_batch = self.block_batch
+
+        tx_batch = TransactionBatch(create_hash_256())
+        data = []
+        for i in range(3000):
+            key = create_hash_256()
+            value = i.to_bytes(4, 'big') * (i % 50) if i % 7 else None
+            tx_batch[key] = TransactionBatchValue(value, i % 11 != 0)
+
+            if i % 11 != 0:
+                data.append(key)
+                if value is not None:
+                    data.append(value)
+
+        block_batch.update(tx_batch)
+        expected = sha3_256(b'|'.join(data))
+        self.assertEqual(expected, block_batch.digest())
+        self.assertEqual(expected, tx_batch.digest())
+
     def test_block_batch_update_tx_index(self):
         block_batch = self.block_batch
 
@@ -195,3 +216,25 @@ class TestBatch(unittest.TestCase):
         actual_overwrite_value: 'BlockBatchValue' = block_batch.get(overwrite_key)
         assert actual_overwrite_value.value == last_value
         assert actual_overwrite_value.tx_indexes == [0, 1, 2]
+
+    def test_to_list(self):
+        block_batch = self.block_batch
+
+        key0 = create_hash_256()
+        key1 = create_hash_256()
+        tx_batch = TransactionBatch(create_hash_256())
+        tx_batch[key0] = TransactionBatchValue(b'value0', True, 0)
+        tx_batch[key1] = TransactionBatchValue(None, False, 0)
+        block_batch.update(tx_batch)
+
+        tx_batch = TransactionBatch(create_hash_256())
+        tx_batch[key0] = TransactionBatchValue(b'value1', True, 1)
+        block_batch.update(tx_batch)
+
+        expected = [
+            {"key": key0, "value": b'value1', "includeStateRootHash": True, "txIndexes": [0, 1]},
+            {"key": key1, "value": None, "includeStateRootHash": False, "txIndexes": [0]}
+        ]
+        self.assertEqual(expected, block_batch.to_list())
+        self.assertEqual({"value": b'value0', "include_state_root_hash": True, "tx_index": 0},
+                         TransactionBatchValue(b'value0', True, 0).to_dict())
@@ -24,7 +24,7 @@ from iconservice.base.exception import DatabaseException, InvalidParamsException
 from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue, BlockBatchValue
 from iconservice.database.db import ContextDatabase, MetaContextDatabase
 from iconservice.database.db import IconScoreDatabase
-from iconservice.database.db import KeyValueDatabase
+from iconservice.database.db import KeyValueDatabase, KeyValueDatabaseSnapshot, LRUCache
 from iconservice.icon_constant import DATA_BYTE_ORDER
 from iconservice.iconscore.icon_score_context import IconScoreContextType, IconScoreContext
 from iconservice.iconscore.icon_score_context import IconScoreFuncType
@@ -67,6 +67,164 @@ class TestKeyValueDatabase(unittest.TestCase):
         self.assertEqual(b'value1', db.get(b'key1'))
         self.assertEqual(b'value0', db.get(b'key0'))
 
+    def test_scan(self):
+        db = self.db
+        for key in (b'a0', b'a1', b'a2', b'b0', b'b1'):
+            db.put(key, key + b'-value')
+
+        self.assertEqual([(b'a0', b'a0-value'), (b'a1', b'a1-value'), (b'a2', b'a2-value')],
+                         list(db.scan(prefix=b'a')))
+        self.assertEqual([b'b1', b'b0'], [key for key, _ in db.scan(prefix=b'b', reverse=True)])
+        self.assertEqual([b'a1', b'a2'], [key for key, _ in db.scan(start=b'a1', stop=b'b0')])
+        self.assertEqual([b'a2', b'b0'], [key for key, _ in db.scan(start=b'a2', limit=2)])
+        self.assertEqual([b'b1'], [key for key, _ in db.scan(reverse=True, limit=1)])
+        self.assertEqual([], list(db.scan(prefix=b'c')))
+
+        with self.assertRaises(InvalidParamsException):
+            list(db.scan(prefix=b'a', start=b'a1'))
+
+        snapshot: KeyValueDatabaseSnapshot = db.get_snapshot()
+        db.delete(b'a1')
+        db.put(b'a3', b'a3-value')
+        self.assertEqual([b'a0', b'a1', b'a2'], [key for key, _ in snapshot.scan(prefix=b'a')])
+        self.assertEqual([b'a0', b'a2', b'a3'], [key for key, _ in db.scan(prefix=b'a')])
+
+    def test_multi_get(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+        db.put(b'key1', b'value1')
+
+        self.assertEqual([b'value1', None, b'value0'], db.multi_get([b'key1', b'key2', b'key0']))
+        self.assertEqual([], db.multi_get([]))
+
+        snapshot: KeyValueDatabaseSnapshot = db.get_snapshot()
+        db.delete(b'key0')
+        self.assertEqual([b'value0', b'value1'], snapshot.multi_get([b'key0', b'key1']))
+        self.assertEqual([None, b'value1'], db.multi_get([b'key0', b'key1']))
+
+
+class TestKeyValueDatabaseWithCache(unittest.TestCase):
+
+    def setUp(self):
+        self.state_db_root_path = 'state_db'
+        rmtree(self.state_db_root_path)
+        os.mkdir(self.state_db_root_path)
+
+        self.db = KeyValueDatabase.from_path(self.state_db_root_path, True, cache_size=1024)
+
+    def tearDown(self):
+        self.db.close()
+        rmtree(self.state_db_root_path)
+
+    def test_get_with_cache(self):
+        db = self.db
+        cache = db.cache
+        self.assertIsInstance(cache, LRUCache)
+
+        db.put(b'key0', b'value0')
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key1'))
+        self.assertIsNone(db.get(b'key1'))
+
+        status: dict = db.get_cache_status()
+        self.assertEqual(2, status['hits'])
+        self.assertEqual(2, status['misses'])
+        self.assertEqual(2, status['count'])
+
+    def test_write_batch_invalidates_cache(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key1'))
+
+        data = {
+            b'key0': BlockBatchValue(None, True, [-1]),
+            b'key1': BlockBatchValue(b'value1', True, [-1])
+        }
+        db.write_batch(StateWAL(data))
+
+        self.assertIsNone(db.get(b'key0'))
+        self.assertEqual(b'value1', db.get(b'key1'))
+
+        db.delete(b'key1')
+        self.assertIsNone(db.get(b'key1'))
+
+    def test_stale_value_is_not_cached(self):
+        db = self.db
+        cache = db.cache
+        db.put(b'key0', b'value0')
+
+        # The value read before invalidation should be discarded
+        generation: int = cache.generation
+        cache.invalidate([b'key0'])
+        cache.put(b'key0', b'value0', generation)
+        self.assertEqual(0, len(cache))
+
+    def test_eviction(self):
+        db = self.db
+        cache = db.cache
+        value = b'v' * 100
+
+        for i in range(20):
+            key = i.to_bytes(4, 'big')
+            db.put(key, value)
+            self.assertEqual(value, db.get(key))
+
+        status: dict = db.get_cache_status()
+        self.assertTrue(status['size'] <= status['maxSize'])
+        self.assertTrue(status['evictions'] > 0)
+        self.assertEqual(20 - status['evictions'], len(cache))
+
+        # The least recently used key has been evicted
+        hit, _ = cache.get((0).to_bytes(4, 'big'))
+        self.assertFalse(hit)
+        hit, _ = cache.get((19).to_bytes(4, 'big'))
+        self.assertTrue(hit)
+
+    def test_snapshot(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+        db.put(b'key1', b'value1')
+
+        snapshot: KeyValueDatabaseSnapshot = db.get_snapshot()
+        self.assertIs(db, snapshot.source)
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+
+        data = {
+            b'key0': BlockBatchValue(b'value00', True, [-1]),
+            b'key1': BlockBatchValue(None, True, [-1])
+        }
+        db.write_batch(StateWAL(data))
+
+        # The snapshot still reads the values before write_batch
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+        self.assertEqual(b'value1', snapshot.get(b'key1'))
+        self.assertEqual(b'value00', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key1'))
+
+        # The old values read from the stale snapshot are not cached
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+        self.assertEqual(b'value00', db.get(b'key0'))
+        self.assertEqual(b'value00', db.get_snapshot().get(b'key0'))
+
+    def test_multi_get_with_cache(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+        self.assertEqual(b'value0', db.get(b'key0'))
+
+        self.assertEqual([b'value0', None], db.multi_get([b'key0', b'key1']))
+        status: dict = db.get_cache_status()
+        self.assertEqual(1, status['hits'])
+        self.assertEqual(2, status['count'])
+
+        snapshot: KeyValueDatabaseSnapshot = db.get_snapshot()
+        db.put(b'key1', b'value1')
+
+        # The snapshot does not use the cache invalidated after it was taken
+        self.assertEqual([b'value0', None], snapshot.multi_get([b'key0', b'key1']))
+        self.assertEqual([b'value0', b'value1'], db.multi_get([b'key0', b'key1']))
+
 
 class TestContextDatabaseOnWriteMode(unittest.TestCase):
     def setUp(self):
@@ -140,6 +298,80 @@ class TestContextDatabaseOnWriteMode(unittest.TestCase):
         self.assertRaises(DatabaseException, self.context_db._put, context, b'key3', b'value3', True)
         self.assertRaises(DatabaseException, self.context_db._delete, context, b'key3', True)
 
+    def test_get_from_prev_block_batches(self):
+        context = self.context
+        db = self.context_db
+
+        db.key_value_db.put(b'key0', b'state_db')
+        db.key_value_db.put(b'key1', b'state_db')
+
+        # The oldest precommit block
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = TransactionBatchValue(b'block0', True)
+        tx_batch[b'key1'] = TransactionBatchValue(b'block0', True)
+        tx_batch[b'key2'] = TransactionBatchValue(b'block0', True)
+        block_batch0 = BlockBatch()
+        block_batch0.update(tx_batch)
+
+        # The parent precommit block
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = TransactionBatchValue(b'block1', True)
+        tx_batch[b'key1'] = TransactionBatchValue(None, True)
+        block_batch1 = BlockBatch()
+        block_batch1.update(tx_batch)
+
+        context.set_prev_block_batches([block_batch1, block_batch0])
+        self.assertEqual(b'block1', db.get(context, b'key0'))
+        self.assertIsNone(db.get(context, b'key1'))
+        self.assertEqual(b'block0', db.get(context, b'key2'))
+        self.assertIsNone(db.get(context, b'key3'))
+
+        db._put(context, b'key2', b'tx', True)
+        self.assertEqual(b'tx', db.get(context, b'key2'))
+
+        context.block_batch.update(context.tx_batch)
+        context.tx_batch.clear()
+        self.assertEqual(b'tx', db.get(context, b'key2'))
+
+    def test_multi_get(self):
+        context = self.context
+        db = self.context_db
+
+        db.key_value_db.put(b'key0', b'state_db')
+        db.key_value_db.put(b'key1', b'state_db')
+        db.key_value_db.put(b'key2', b'state_db')
+
+        tx_batch = TransactionBatch()
+        tx_batch[b'key1'] = TransactionBatchValue(b'block0', True)
+        tx_batch[b'key2'] = TransactionBatchValue(None, True)
+        block_batch0 = BlockBatch()
+        block_batch0.update(tx_batch)
+        context.set_prev_block_batches([block_batch0])
+
+        db._put(context, b'key3', b'tx', True)
+
+        keys = [b'key0', b'key1', b'key2', b'key3', b'key4']
+        self.assertEqual([b'state_db', b'block0', None, b'tx', None], db.multi_get(context, keys))
+        self.assertEqual([db.get(context, key) for key in keys], db.multi_get(context, keys))
+
+        context = IconScoreContext(IconScoreContextType.QUERY)
+        context.state_db_snapshot = db.key_value_db.get_snapshot()
+        db.key_value_db.put(b'key0', b'value0')
+        self.assertEqual([b'state_db', b'state_db'], db.multi_get(context, [b'key0', b'key1']))
+
+    def test_get_from_snapshot_on_query(self):
+        db = self.context_db
+        db.key_value_db.put(b'key0', b'value0')
+
+        context = IconScoreContext(IconScoreContextType.QUERY)
+        context.state_db_snapshot = db.key_value_db.get_snapshot()
+
+        db.key_value_db.put(b'key0', b'value1')
+        self.assertEqual(b'value0', db.get(context, b'key0'))
+
+        context.state_db_snapshot = None
+        self.assertEqual(b'value1', db.get(context, b'key0'))
+
     def test_put_on_readonly_exception(self):
         context = self.context
         context.func_type = IconScoreFuncType.READONLY
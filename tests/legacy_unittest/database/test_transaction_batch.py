@@ -17,6 +17,7 @@ import unittest
 
 from iconservice.base.exception import DatabaseException
 from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue, BlockBatchValue
+from iconservice.utils import sha3_256
 
 
 class TestTransactionBatch(unittest.TestCase):
@@ -52,6 +53,59 @@ class TestTransactionBatch(unittest.TestCase):
         self.assertEqual(TransactionBatchValue(b'value', True), tx_batch[b'key'])
         self.assertEqual(call_count, tx_batch.call_count)
 
+    def test_revert_call_restores_parent_values(self):
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value0', True)
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value1', True)
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value2', True)
+        tx_batch[b'key1'] = TransactionBatchValue(b'value2', True)
+        self.assertEqual(TransactionBatchValue(b'value2', True), tx_batch[b'key0'])
+
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+        self.assertEqual(TransactionBatchValue(b'value1', True), tx_batch[b'key0'])
+        self.assertFalse(b'key1' in tx_batch)
+        self.assertIsNone(tx_batch[b'key1'])
+
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+        self.assertEqual(TransactionBatchValue(b'value0', True), tx_batch[b'key0'])
+
+        tx_batch.clear()
+        self.assertFalse(b'key0' in tx_batch)
+
+    def test_digest_order(self):
+        # The keys written in inter-SCORE calls are ordered as if each call batch were merged into its parent
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value0', True)
+
+        tx_batch.enter_call()
+        tx_batch[b'key1'] = TransactionBatchValue(b'value1', True)
+        tx_batch[b'key0'] = TransactionBatchValue(b'value00', True)
+
+        tx_batch.enter_call()
+        tx_batch[b'key2'] = TransactionBatchValue(b'value2', True)
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+
+        tx_batch.enter_call()
+        tx_batch[b'key3'] = TransactionBatchValue(b'value3', False)
+        tx_batch.leave_call()
+
+        tx_batch.leave_call()
+        tx_batch[b'key2'] = TransactionBatchValue(None, True)
+
+        self.assertEqual([b'key0', b'key1', b'key3', b'key2'], list(tx_batch))
+        self.assertEqual(sha3_256(b'key0|value00|key1|value1|key2'), tx_batch.digest())
+
+        tx_batch.enter_call()
+        with self.assertRaises(DatabaseException):
+            tx_batch.digest()
+
     def test_iter(self):
         tx_batch = TransactionBatch()
         tx_batch[b'key0'] = TransactionBatchValue(b'value0', True)
@@ -84,11 +138,11 @@ class TestTransactionBatch(unittest.TestCase):
         tx_batch[b'key0'] = TransactionBatchValue(None, True)
         tx_batch[b'key1'] = TransactionBatchValue(b'key1', True)
         tx_batch[b'key2'] = TransactionBatchValue(b'value2', True)
-        self.assertEqual(5, len(tx_batch))
+        self.assertEqual(3, len(tx_batch))
         self.assertEqual(init_call_count + 2, tx_batch.call_count)
 
         tx_batch.leave_call()
-        self.assertEqual(4, len(tx_batch))
+        self.assertEqual(3, len(tx_batch))
         self.assertEqual(TransactionBatchValue(b'key1', True), tx_batch[b'key1'])
         self.assertEqual(init_call_count + 1, tx_batch.call_count)
 
@@ -124,7 +178,7 @@ class TestTransactionBatch(unittest.TestCase):
         tx_batch[b'key0'] = TransactionBatchValue(None, True)
         tx_batch[b'key1'] = TransactionBatchValue(b'key1', True)
         tx_batch[b'key2'] = TransactionBatchValue(b'value2', True)
-        self.assertEqual(5, len(tx_batch))
+        self.assertEqual(3, len(tx_batch))
         self.assertEqual(init_call_count + 2, tx_batch.call_count)
 
         keys = [b'key0', b'key1', b'key2']
@@ -150,3 +204,20 @@ class TestTransactionBatch(unittest.TestCase):
         block_batch = BlockBatch()
         block_batch.update(tx_batch)
         self.assertEqual(BlockBatchValue(b'value0', True, [-1]), block_batch[b'key0'])
+
+    def test_generation(self):
+        tx_batch = TransactionBatch()
+        generations = {tx_batch.generation, TransactionBatch().generation}
+        self.assertEqual(2, len(generations))
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value0', True)
+        self.assertIn(tx_batch.generation, generations)
+
+        tx_batch.revert_call()
+        tx_batch.leave_call()
+        self.assertNotIn(tx_batch.generation, generations)
+        generations.add(tx_batch.generation)
+
+        tx_batch.clear()
+        self.assertNotIn(tx_batch.generation, generations)
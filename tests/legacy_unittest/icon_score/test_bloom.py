@@ -22,6 +22,8 @@ from hypothesis import (
 
 from iconservice.utils.bloom import (
     BloomFilter,
+    get_bloom_bits,
+    get_bloom_bits_of,
 )
 
 
@@ -78,6 +80,15 @@ def test_bloom_filter_from_iterable_method(log_entries):
     check_bloom(bloom, log_entries)
 
 
+@given(topic)
+def test_get_bloom_bits_of(value):
+    expected = 0
+    for bloom_bits in get_bloom_bits(value):
+        expected |= bloom_bits
+
+    assert get_bloom_bits_of(value) == expected
+
+
 def test_casting_to_integer():
     bloom = BloomFilter()
 
@@ -22,11 +22,11 @@ from iconservice.base.exception import ExceptionCode, InvalidRequestException, \
     InvalidParamsException, OutOfBalanceException
 from iconservice.deploy import DeployEngine
 from iconservice.icon_constant import MAX_DATA_SIZE, FIXED_FEE
-from iconservice.iconscore.icon_pre_validator import IconPreValidator
+from iconservice.iconscore.icon_pre_validator import IconPreValidator, PreValidationCache
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from iconservice.icx import IcxEngine, IcxStorage
 from iconservice.utils import ContextEngine, ContextStorage
-from tests import create_address
+from tests import create_address, create_tx_hash
 
 
 class DeployStorage(object):
@@ -663,3 +663,66 @@ class TestTransactionValidator(unittest.TestCase):
         self.validator._is_score_active = Mock(return_value=False)
         self.assertTrue(self.validator._is_inactive_score(self.context, address))
         self.validator._is_score_active.assert_called_once_with(self.context, address)
+
+
+class TestPreValidationCache(unittest.TestCase):
+
+    def test_get_input_data_size(self):
+        cache = PreValidationCache(2)
+        data = {"method": "transfer", "params": {"_value": "0x1"}}
+        tx_hashes = [create_tx_hash() for _ in range(3)]
+
+        with patch('iconservice.iconscore.icon_pre_validator.get_input_data_size') as mock:
+            mock.return_value = 100
+            self.assertEqual(100, cache.get_input_data_size(tx_hashes[0], 5, data))
+            self.assertEqual(100, cache.get_input_data_size(tx_hashes[0], 5, data))
+            mock.assert_called_once_with(5, data)
+
+            # The size depends on the revision
+            mock.reset_mock()
+            cache.get_input_data_size(tx_hashes[0], 2, data)
+            mock.assert_called_once_with(2, data)
+
+            # The size is not cached without a tx hash or with update=False
+            mock.reset_mock()
+            cache.get_input_data_size(None, 5, data)
+            cache.get_input_data_size(tx_hashes[1], 5, data, update=False)
+            cache.get_input_data_size(tx_hashes[1], 5, data)
+            self.assertEqual(3, mock.call_count)
+            self.assertEqual(2, len(cache))
+
+        # The least recently used one is evicted
+        cache.set_checked(tx_hashes[1])
+        cache.set_checked(tx_hashes[2])
+        self.assertEqual(2, len(cache))
+        self.assertFalse(cache.is_checked(tx_hashes[0]))
+        self.assertTrue(cache.is_checked(tx_hashes[1]))
+        self.assertTrue(cache.is_checked(tx_hashes[2]))
+        self.assertFalse(cache.is_checked(None))
+
+    def test_disabled(self):
+        cache = PreValidationCache(0)
+        tx_hash = create_tx_hash()
+
+        cache.set_checked(tx_hash)
+        self.assertFalse(cache.is_checked(tx_hash))
+        self.assertEqual(2, cache.get_input_data_size(tx_hash, 5, {}))
+        self.assertEqual(0, len(cache))
+
+    def test_execute(self):
+        validator = IconPreValidator(PreValidationCache(10))
+        validator._validate_transaction_v3 = Mock()
+        validator._check_input_data = Mock()
+        params = {"version": 3, "txHash": create_tx_hash(), "value": 1}
+
+        validator.execute(None, params, ANY, ANY)
+        validator.execute(None, params, ANY, ANY)
+        validator._check_input_data.assert_called_once_with(params)
+        self.assertEqual(2, validator._validate_transaction_v3.call_count)
+
+        # A failed transaction is checked again
+        params = {"version": 3, "txHash": create_tx_hash(), "value": -1}
+        for _ in range(2):
+            with self.assertRaises(InvalidParamsException):
+                validator.execute(None, params, ANY, ANY)
+        self.assertEqual(3, validator._check_input_data.call_count)
@@ -31,6 +31,8 @@ from iconservice.iconscore.icon_score_context import IconScoreContextType, IconS
 from iconservice.icx.coin_part import CoinPart
 from iconservice.icx.icx_account import Account
 from iconservice.icx import IcxStorage
+from iconservice.icx.storage import Intent
+from iconservice.optimistic_executor import Speculation
 from tests import create_address
 
 if TYPE_CHECKING:
@@ -102,6 +104,120 @@ class TestIcxStorage(unittest.TestCase):
         self.assertEqual(putting_total_supply_amount, actual_stored_total_supply)
 
 
+class TestIcxStorageWithPartCache(unittest.TestCase):
+    def setUp(self):
+        self.db_name = 'icx.db'
+
+        db = ContextDatabase.from_path(self.db_name)
+        self.storage = IcxStorage(db)
+
+        context = IconScoreContext(IconScoreContextType.INVOKE)
+        context.tx_batch = TransactionBatch()
+        context.block = Block(block_height=1, block_hash=b'1' * 32, timestamp=0, prev_hash=b'0' * 32)
+        context.block_batch = BlockBatch()
+        self.context = context
+
+    def tearDown(self):
+        context = self.context
+        self.storage.close(context)
+
+        shutil.rmtree(self.db_name)
+
+    def _put_balance(self, address: 'Address', balance: int):
+        context = self.context
+        coin_part: 'CoinPart' = CoinPart(balance=balance)
+        coin_part.set_dirty(True)
+        account: 'Account' = Account(address, context.block.height, context.revision, coin_part=coin_part)
+        self.storage.put_account(context, account)
+
+    def test_get_account_from_cache(self):
+        context = self.context
+        storage = self.storage
+        address = create_address(AddressPrefix.EOA)
+
+        self._put_balance(address, 100)
+        self.assertEqual(1, len(storage._part_cache))
+
+        account: 'Account' = storage.get_account(context, address)
+        self.assertEqual(100, account.balance)
+
+        # Changes on the returned account do not affect the cached part
+        account.deposit(10)
+        account2: 'Account' = storage.get_account(context, address)
+        self.assertEqual(100, account2.balance)
+        self.assertIsNot(account.coin_part, account2.coin_part)
+
+        storage.put_account(context, account)
+        self.assertEqual(110, storage.get_account(context, address).balance)
+
+    def test_get_accounts(self):
+        context = self.context
+        storage = self.storage
+        addresses = [create_address(AddressPrefix.EOA) for _ in range(3)]
+
+        self._put_balance(addresses[0], 100)
+        self._put_balance(addresses[2], 300)
+
+        for intent in (Intent.TRANSFER, Intent.ALL, Intent.DELEGATED):
+            accounts = storage.get_accounts(context, addresses, intent)
+            self.assertEqual([storage.get_account(context, address, intent) for address in addresses], accounts)
+
+        accounts = storage.get_accounts(context, addresses, Intent.ALL)
+        self.assertEqual([100, 0, 300], [account.balance for account in accounts])
+        self.assertEqual([], storage.get_accounts(context, [], Intent.ALL))
+
+    def test_revert_call(self):
+        context = self.context
+        storage = self.storage
+        address = create_address(AddressPrefix.EOA)
+
+        self._put_balance(address, 100)
+
+        context.tx_batch.enter_call()
+        self._put_balance(address, 200)
+        self.assertEqual(200, storage.get_account(context, address).balance)
+
+        # The part reverted in tx_batch is not returned from the cache
+        context.tx_batch.revert_call()
+        context.tx_batch.leave_call()
+        self.assertEqual(100, storage.get_account(context, address).balance)
+
+    def test_cache_is_scoped_to_block(self):
+        context = self.context
+        storage = self.storage
+        address = create_address(AddressPrefix.EOA)
+
+        self._put_balance(address, 100)
+        self.assertEqual(1, len(storage._part_cache))
+
+        context.block = Block(block_height=2, block_hash=b'2' * 32, timestamp=0, prev_hash=b'1' * 32)
+        self.assertEqual(100, storage.get_account(context, address).balance)
+        self.assertEqual(1, len(storage._part_cache))
+
+        # Only the contexts for invoke use the cache
+        storage._part_cache.clear()
+        context.type = IconScoreContextType.ESTIMATION
+        self.assertEqual(100, storage.get_account(context, address).balance)
+        self.assertEqual(0, len(storage._part_cache))
+
+    def test_forked_context_has_own_cache(self):
+        storage = self.storage
+        address = create_address(AddressPrefix.EOA)
+        self._put_balance(address, 100)
+        self.assertEqual(1, len(storage._part_cache))
+        self.context.update_state_db_batch()
+
+        forked_context = self.context.fork()
+        forked_context.speculation = Speculation()
+        self.assertEqual(100, storage.get_account(forked_context, address).balance)
+
+        # Worker threads do not touch the cache of the block context
+        self.assertEqual(1, len(forked_context.speculation.part_cache))
+        storage._part_cache.clear()
+        self.assertEqual(100, storage.get_account(forked_context, address).balance)
+        self.assertEqual(0, len(storage._part_cache))
+
+
 class TestIcxStorageForMalformedAddress(unittest.TestCase):
     def setUp(self):
         empty_address = MalformedAddress.from_string('')
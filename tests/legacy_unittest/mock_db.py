@@ -62,6 +62,9 @@ class MockPlyvelDB(object):
     def prefixed_db(self, bytes_prefix) -> 'MockPlyvelDB':
         return MockPlyvelDB(MockPlyvelDB.make_db())
 
+    def snapshot(self) -> 'MockPlyvelDB':
+        return MockPlyvelDB(dict(self._db))
+
     def write_batch(self, *args, **kwargs) -> 'MockWriteBatch':
         return MockWriteBatch(self)
 
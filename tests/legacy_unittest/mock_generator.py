@@ -100,8 +100,13 @@ def _create_inner_task(
     def rc_get(key):
         return rc_db.get(key)
 
+    state_key_value_db = Mock(spec=KeyValueDatabase)
+    state_key_value_db.get = state_db.get
+    state_key_value_db.get_snapshot.return_value = None
+    state_key_value_db.cache = None
+
     context_db = Mock(spec=ContextDatabase)
-    context_db.key_value_db = state_db
+    context_db.key_value_db = state_key_value_db
     context_db.get = state_get
     context_db.put = state_put
 
@@ -175,8 +180,13 @@ def _create_service_engine(
     def rc_get(key):
         return rc_db.get(key)
 
+    state_key_value_db = Mock(spec=KeyValueDatabase)
+    state_key_value_db.get = state_db.get
+    state_key_value_db.get_snapshot.return_value = None
+    state_key_value_db.cache = None
+
     context_db = Mock(spec=ContextDatabase)
-    context_db.key_value_db = state_db
+    context_db.key_value_db = state_key_value_db
     context_db.get = state_get
     context_db.put = state_put
 
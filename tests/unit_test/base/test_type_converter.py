@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from copy import deepcopy
 from typing import TYPE_CHECKING, Optional, Union
 
 import pytest
@@ -970,3 +971,43 @@ def test_wrong_block_convert():
         TypeConverter.convert(request, ParamType.BLOCK)
 
     assert "TypeConvert Exception int value :1, type: <class 'int'>" == e.value.message
+
+
+def test_convert_does_not_change_request():
+    data_params = {ConstantKeys.VALUE: hex(10)}
+    request = {
+        ConstantKeys.METHOD: "icx_sendTransaction",
+        ConstantKeys.PARAMS: {
+            ConstantKeys.OLD_TX_HASH: bytes.hex(create_block_hash()),
+            ConstantKeys.FROM: str(create_address()),
+            ConstantKeys.TO: str(create_address(1)),
+            ConstantKeys.VALUE: hex(1),
+            ConstantKeys.DATA_TYPE: "call",
+            ConstantKeys.DATA: {
+                ConstantKeys.METHOD: "transfer",
+                ConstantKeys.PARAMS: data_params
+            }
+        }
+    }
+    copied_request = deepcopy(request)
+
+    ret_params = TypeConverter.convert(request, ParamType.INVOKE_TRANSACTION)
+    assert copied_request == request
+    assert ConstantKeys.TX_HASH in ret_params[ConstantKeys.PARAMS]
+
+    # A value converted later is copied not to be changed by injecting default values into it
+    ret_data_params = ret_params[ConstantKeys.PARAMS][ConstantKeys.DATA][ConstantKeys.PARAMS]
+    assert data_params == ret_data_params
+    assert data_params is not ret_data_params
+    ret_data_params["proportion"] = 0
+    assert copied_request == request
+
+    # So is an empty one
+    request[ConstantKeys.PARAMS][ConstantKeys.DATA][ConstantKeys.PARAMS] = {}
+    ret_params = TypeConverter.convert(request, ParamType.INVOKE_TRANSACTION)
+    ret_params[ConstantKeys.PARAMS][ConstantKeys.DATA][ConstantKeys.PARAMS]["proportion"] = 0
+    assert request[ConstantKeys.PARAMS][ConstantKeys.DATA][ConstantKeys.PARAMS] == {}
+
+    # A converter compiled from a template is reused
+    ret_params[ConstantKeys.PARAMS][ConstantKeys.DATA][ConstantKeys.PARAMS] = {}
+    assert TypeConverter.convert(request, ParamType.INVOKE_TRANSACTION) == ret_params
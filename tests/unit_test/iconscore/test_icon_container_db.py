@@ -14,12 +14,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import Mock, PropertyMock, patch
+
 import pytest
 
 from iconservice import Address
 from iconservice.base.address import AddressPrefix
 from iconservice.base.exception import InvalidParamsException
+from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue
 from iconservice.database.db import IconScoreDatabase
+from iconservice.icon_constant import Revision
 from iconservice.iconscore.context.context import ContextContainer
 from iconservice.iconscore.icon_container_db import ContainerUtil, DictDB, ArrayDB, VarDB
 from iconservice.iconscore.icon_score_context import IconScoreContextType, IconScoreContext
@@ -331,3 +335,188 @@ class TestIconContainerDB:
     def test_when_create_var_db_prefix_using_container_util_should_raise_error(self):
         with pytest.raises(InvalidParamsException):
             ContainerUtil.create_db_prefix(VarDB, 'vardb')
+
+    @pytest.mark.parametrize("size", [0, 1, ArrayDB.READ_AHEAD_SIZE, ArrayDB.READ_AHEAD_SIZE * 2 + 1])
+    def test_iterate_array_db(self, score_db, size):
+        array_db = ArrayDB('array_db', score_db, value_type=int)
+        for i in range(size):
+            array_db.put(i * 10)
+
+        observer = Mock()
+        score_db.set_observer(observer)
+
+        assert [value for value in array_db] == [i * 10 for i in range(size)]
+        # The size and each element are charged
+        assert observer.on_get.call_count == size + 1
+
+    def test_iterate_array_db_partially(self, score_db):
+        array_db = ArrayDB('array_db', score_db, value_type=int)
+        for i in range(ArrayDB.READ_AHEAD_SIZE):
+            array_db.put(i)
+
+        observer = Mock()
+        score_db.set_observer(observer)
+
+        # Elements read ahead are not charged until they are used
+        assert 2 in array_db
+        assert observer.on_get.call_count == 1 + 3
+
+    def test_write_array_db_while_iterating(self, score_db):
+        array_db = ArrayDB('array_db', score_db, value_type=int)
+        for i in range(5):
+            array_db.put(i)
+
+        values = []
+        for i, value in enumerate(array_db):
+            if i == 1:
+                array_db[3] = 30
+            values.append(value)
+
+        assert values == [0, 1, 2, 30, 4]
+
+    def test_reuse_sub_db(self, score_db):
+        sub_db = score_db.get_sub_db(b'a')
+        assert score_db.get_sub_db(b'a') is sub_db
+        assert sub_db.get_sub_db(b'b') is score_db.get_sub_db(b'a|b')
+
+        dict_db = DictDB('dict_db', score_db, value_type=int, depth=2)
+        dict_db['a']['b'] = 1
+        assert dict_db['a']._db is dict_db['a']._db
+        assert dict_db['a']['b'] == 1
+
+    def test_reuse_sub_db_with_limit(self, score_db, monkeypatch):
+        monkeypatch.setattr(IconScoreDatabase, "MAX_SUB_DBS", 2)
+
+        sub_db = score_db.get_sub_db(b'a')
+        score_db.get_sub_db(b'b')
+        assert score_db.get_sub_db(b'a') is sub_db
+
+        # All sub dbs are dropped when the number of them reaches the limit
+        score_db.get_sub_db(b'c')
+        assert score_db.get_sub_db(b'a') is not sub_db
+
+
+@pytest.fixture
+def invoke_context(score_db):
+    context = IconScoreContext(IconScoreContextType.INVOKE)
+    context.current_address = score_db.address
+    context.block_batch = BlockBatch()
+    context.tx_batch = TransactionBatch()
+
+    ContextContainer._push_context(context)
+    with patch.object(IconScoreContext, "revision", new_callable=PropertyMock, return_value=Revision.THREE.value):
+        yield context
+
+
+class TestCachedValue:
+    @pytest.fixture
+    def reads(self, context_db):
+        with patch.object(context_db, "get", wraps=context_db.get) as get:
+            yield get
+
+    @pytest.fixture
+    def observer(self, score_db):
+        observer = Mock()
+        score_db.set_observer(observer)
+        return observer
+
+    def test_var_db(self, score_db, invoke_context, reads, observer):
+        var_db = VarDB('var_db', score_db, value_type=Address)
+        address = create_address()
+        var_db.set(address)
+        reads.reset_mock()
+        observer.reset_mock()
+
+        for _ in range(3):
+            assert var_db.get() == address
+
+        # A cached value is charged as if it is read from the db
+        assert reads.call_count == 1
+        assert observer.on_get.call_count == 3
+        assert len(set(map(str, observer.on_get.call_args_list))) == 1
+
+        var_db.set(create_address())
+        reads.reset_mock()
+        assert var_db.get() != address
+        assert reads.call_count == 1
+
+    def test_revert(self, score_db, invoke_context):
+        var_db = VarDB('var_db', score_db, value_type=int)
+        var_db.set(1)
+
+        invoke_context.tx_batch.enter_call()
+        var_db.set(2)
+        assert var_db.get() == 2
+        invoke_context.tx_batch.revert_call()
+        invoke_context.tx_batch.leave_call()
+
+        assert var_db.get() == 1
+
+    def test_transaction_is_over(self, score_db, invoke_context, reads):
+        var_db = VarDB('var_db', score_db, value_type=int)
+        assert var_db.get() == 0
+
+        # The preceding transaction is over
+        key: bytes = score_db._hash_key(var_db._db._hash_key(b'var_db'))
+        tx_batch = TransactionBatch()
+        tx_batch[key] = TransactionBatchValue(b'\x05', True)
+        invoke_context.block_batch.update(tx_batch)
+        invoke_context.tx_batch.clear()
+        assert var_db.get() == 5
+
+        # Written out of the db, e.g. by a speculative execution
+        invoke_context.tx_batch[key] = TransactionBatchValue(b'\x06', True)
+        assert var_db.get() == 6
+        assert reads.call_count == 3
+
+    def test_array_db_size(self, score_db, invoke_context, reads):
+        array_db = ArrayDB('array_db', score_db, value_type=int)
+        for i in range(3):
+            array_db.put(i)
+        reads.reset_mock()
+
+        for _ in range(3):
+            assert len(array_db) == 3
+        assert reads.call_count == 1
+
+        assert array_db.pop() == 2
+        assert len(array_db) == 2
+
+    def test_iterate_array_db(self, score_db, context_db, invoke_context, reads):
+        array_db = ArrayDB('array_db', score_db, value_type=int)
+        for i in range(5):
+            array_db.put(i)
+        reads.reset_mock()
+
+        # The elements are read ahead, so only the size is read by itself
+        assert [value for value in array_db] == [0, 1, 2, 3, 4]
+        assert reads.call_count == 1
+
+        # Written through another db of the same SCORE
+        other = ArrayDB('array_db', IconScoreDatabase(score_db.address, context_db), value_type=int)
+        values = []
+        for i, value in enumerate(array_db):
+            if i == 1:
+                other[3] = 30
+            values.append(value)
+        assert values == [0, 1, 2, 30, 4]
+
+        # Reverted by a failed inter-SCORE call
+        invoke_context.tx_batch.enter_call()
+        array_db[3] = 300
+        values = []
+        for i, value in enumerate(array_db):
+            if i == 1:
+                invoke_context.tx_batch.revert_call()
+            values.append(value)
+        invoke_context.tx_batch.leave_call()
+        assert values == [0, 1, 2, 30, 4]
+
+    def test_direct_context(self, score_db, reads):
+        var_db = VarDB('var_db', score_db, value_type=int)
+        var_db.set(1)
+        reads.reset_mock()
+
+        for _ in range(3):
+            assert var_db.get() == 1
+        assert reads.call_count == 3
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from iconservice.base.address import Address
+from iconservice.base.exception import (
+    ExceptionCode,
+    IconServiceBaseException,
+    InactiveScoreError,
+    MethodNotFoundException,
+)
+from iconservice.database.db import IconScoreDatabase
+from iconservice.icon_constant import IconScoreFuncType
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_base import IconScoreBase, external, payable, eventlog
+from iconservice.iconscore.icon_score_call_plan import get_call_plan
+from iconservice.iconscore.icon_score_constant import CONST_CLASS_CALL_PLANS, MESSAGE_INACTIVE_SCORE
+from iconservice.iconscore.icon_score_context import IconScoreContext
+
+
+class SampleScore(IconScoreBase):
+    def __init__(self, db: IconScoreDatabase):
+        super().__init__(db)
+
+    def on_install(self) -> None:
+        pass
+
+    def on_update(self) -> None:
+        pass
+
+    @eventlog
+    def Transfer(self, _from: Address, _to: Address, _value: int):
+        pass
+
+    @external
+    def transfer(self, _to: Address, _value: int, _data: bytes = None):
+        pass
+
+    @external
+    @payable
+    def deposit(self):
+        pass
+
+    @external(readonly=True)
+    def balanceOf(self, _owner: Address) -> int:
+        pass
+
+    def internal(self):
+        pass
+
+
+class UpdatedScore(SampleScore):
+    @external(readonly=True)
+    def transfer(self, _to: Address, _value: int, _data: bytes = None):
+        pass
+
+
+def _new_score(score_class: type) -> 'IconScoreBase':
+    # Call plans do not need the attributes made by __init__()
+    return score_class.__new__(score_class)
+
+
+@pytest.mark.parametrize("func_name,is_external,is_payable,is_readonly", [
+    ("transfer", True, False, False),
+    ("deposit", True, True, False),
+    ("balanceOf", True, False, True),
+    ("Transfer", False, False, False),
+    ("internal", False, False, False),
+    ("unknown", False, False, False),
+])
+def test_get_call_plan(func_name, is_external, is_payable, is_readonly):
+    plan = get_call_plan(_new_score(SampleScore), func_name)
+
+    assert plan.is_external == is_external
+    assert plan.is_payable == is_payable
+    assert plan.is_readonly == is_readonly
+    assert plan.func_type == (IconScoreFuncType.READONLY if is_readonly else IconScoreFuncType.WRITABLE)
+
+
+def test_call_plans_are_kept_per_class():
+    score = _new_score(SampleScore)
+
+    plan = get_call_plan(score, "transfer")
+    assert get_call_plan(_new_score(SampleScore), "transfer") is plan
+
+    # A SCORE update loads a new class which has its own plans
+    updated_plan = get_call_plan(_new_score(UpdatedScore), "transfer")
+    assert updated_plan is not plan
+    assert updated_plan.is_readonly
+
+    # The plans of the methods which are not elements are not kept
+    get_call_plan(score, "unknown")
+    get_call_plan(score, "internal")
+    plans: dict = getattr(SampleScore, CONST_CLASS_CALL_PLANS)
+    assert "transfer" in plans
+    assert "unknown" not in plans
+    assert "internal" not in plans
+
+
+def test_convert_params():
+    score = _new_score(SampleScore)
+    to = Address.from_string(f"hx{'1' * 40}")
+    params = {"_to": str(to), "_value": "0x10"}
+
+    assert get_call_plan(score, "transfer").convert_params(score, "transfer", params) == {"_to": to, "_value": 16}
+    assert params == {"_to": str(to), "_value": "0x10"}
+
+    with pytest.raises(MethodNotFoundException):
+        get_call_plan(score, "unknown").convert_params(score, "unknown", {})
+
+
+def test_set_func_type_by_icon_score():
+    score = _new_score(SampleScore)
+    context = IconScoreContext()
+
+    context.set_func_type_by_icon_score(score, "balanceOf")
+    assert context.func_type == IconScoreFuncType.READONLY
+    context.set_func_type_by_icon_score(score, "transfer")
+    assert context.func_type == IconScoreFuncType.WRITABLE
+    context.func_type = IconScoreFuncType.READONLY
+    context.set_func_type_by_icon_score(score, None)
+    assert context.func_type == IconScoreFuncType.WRITABLE
+
+    # The message of calling an inactive SCORE is recorded in transaction results as it has been
+    with pytest.raises(InactiveScoreError) as e:
+        context.set_func_type_by_icon_score(None, "transfer")
+    assert isinstance(e.value, AttributeError)
+    assert not isinstance(e.value, IconServiceBaseException)
+    assert str(e.value) == MESSAGE_INACTIVE_SCORE
+    assert str(e.value) == "'NoneType' object has no attribute '_IconScoreBase__is_func_readonly'"
+
+    failure = IconServiceEngine._get_failure_from_exception(e.value)
+    assert failure.code == ExceptionCode.SYSTEM_ERROR
+    assert failure.message == "'NoneType' object has no attribute '_IconScoreBase__is_func_readonly'"
@@ -22,6 +22,7 @@ from iconservice.icon_constant import Revision
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from iconservice.iconscore.icon_score_event_log import EventLog, EventLogEmitter
 from iconservice.utils import to_camel_case, byte_length_of_int
+from iconservice.utils.bloom import BloomFilter
 from tests import create_address
 
 
@@ -82,6 +83,27 @@ class TestEventLog:
             expected = {casting("score_address"): score_address, casting("indexed"): indexed, casting("data"): data}
             assert ret == expected
 
+    @pytest.mark.parametrize("indexed", [
+        [],
+        ["Transfer(Address,Address,int,bytes)", create_address(), create_address(1), 10 ** 18],
+        ["Event(bool,bytes,str)", True, b"\x00", None],
+    ])
+    def test_get_bloom_bits(self, indexed):
+        score_address = create_address(1)
+        expected = BloomFilter()
+        expected.add(EventLogEmitter.get_ordered_bytes(0xff, score_address))
+        for i, item in enumerate(indexed):
+            expected.add(EventLogEmitter.get_ordered_bytes(i, item))
+
+        event_log = EventLog(score_address, indexed, [])
+        assert event_log.get_bloom_bits() == int(expected)
+        # Memoized bits are the same
+        assert event_log.get_bloom_bits() == int(expected)
+
+        # The bytes for the logs bloom are not a field
+        assert event_log.to_dict() == {"score_address": score_address, "indexed": indexed, "data": []}
+        assert str(event_log) == f"score_address: {score_address}\nindexed: {indexed}\ndata: []"
+
 
 class TestEventLogEmitter:
     @pytest.fixture
@@ -93,6 +115,21 @@ class TestEventLogEmitter:
             return m
         return _data
 
+    def test_emit_event_log(self, mock_context):
+        context = mock_context(Revision.THREE.value)
+        context.readonly = False
+        context.event_logs = []
+        score_address = create_address(1)
+        arguments = [create_address(), create_address(1), 10 ** 18, b"data"]
+
+        EventLogEmitter.emit_event_log(context, score_address, "Transfer(Address,Address,int,bytes)", arguments, 3)
+
+        event_log = context.event_logs[0]
+        assert event_log.indexed == ["Transfer(Address,Address,int,bytes)"] + arguments[:3]
+        assert event_log.data == arguments[3:]
+        assert event_log.indexed_bytes == \
+            [EventLogEmitter.get_ordered_bytes(i, item) for i, item in enumerate(event_log.indexed)]
+
     @pytest.mark.parametrize("data, expected", [
         (1, b'\x01'),
         ("1", b'1'),
@@ -25,7 +25,8 @@ from iconservice.icon_constant import Revision, IconScoreContextType, MAX_EXTERN
 from iconservice.inv.container import Container as INVContainer
 from iconservice.iconscore.icon_score_step import \
     StepType, get_data_size_recursively, get_deploy_content_size, AutoValueEnum, StepTracer, \
-    get_input_data_size, IconScoreStepCounter, OutOfStepException
+    get_input_data_size, IconScoreStepCounter, OutOfStepException, get_json_data_size, \
+    get_data_size_using_json_dumps
 
 
 @pytest.fixture
@@ -49,39 +50,39 @@ class TestGetInputDataSize:
     ]
 
     @pytest.fixture
-    def mock_get_data_size_using_json_dumps(self, mocker):
-        return mocker.patch.object(step_module, 'get_data_size_using_json_dumps')
+    def mock_get_json_data_size(self, mocker):
+        return mocker.patch.object(step_module, 'get_json_data_size')
 
     @pytest.mark.parametrize("revision", [r.value for r in Revision if r.value < Revision.THREE.value])
     @pytest.mark.parametrize("input_data, expected_call_data", [(x, [mock.call(x)]) for x in INPUT])
     def test_less_than_revision_three(self,
-                                      mock_get_data_size_recursively, mock_get_data_size_using_json_dumps,
+                                      mock_get_data_size_recursively, mock_get_json_data_size,
                                       revision, input_data, expected_call_data):
         get_input_data_size(revision, input_data)
         mock_get_data_size_recursively.assert_called_once_with(input_data)
-        mock_get_data_size_using_json_dumps.assert_not_called()
+        mock_get_json_data_size.assert_not_called()
 
     @pytest.mark.parametrize("revision", [Revision.THREE.value])
     @pytest.mark.parametrize("input_data, expected_call_data", [(x, [mock.call(x)]) for x in INPUT])
     def test_revision_three(self,
-                            mock_get_data_size_recursively, mock_get_data_size_using_json_dumps,
+                            mock_get_data_size_recursively, mock_get_json_data_size,
                             revision, input_data, expected_call_data):
         get_input_data_size(revision, input_data)
-        mock_get_data_size_using_json_dumps.assert_called_once_with(input_data)
+        mock_get_json_data_size.assert_called_once_with(input_data)
         mock_get_data_size_recursively.assert_not_called()
 
     @pytest.mark.parametrize("revision", [r.value for r in Revision if r.value > Revision.THREE.value])
     @pytest.mark.parametrize("input_data, expected_call_data", [(x, [mock.call(x)]) for x in INPUT])
     def test_greater_than_revision_three(self,
-                                         mock_get_data_size_recursively, mock_get_data_size_using_json_dumps,
+                                         mock_get_data_size_recursively, mock_get_json_data_size,
                                          revision, input_data, expected_call_data):
         data_size = get_input_data_size(revision, input_data)
         if input_data is None:
             assert data_size == 0
             mock_get_data_size_recursively.assert_not_called()
-            mock_get_data_size_using_json_dumps.assert_not_called()
+            mock_get_json_data_size.assert_not_called()
         else:
-            mock_get_data_size_using_json_dumps.assert_called_once_with(input_data)
+            mock_get_json_data_size.assert_called_once_with(input_data)
             mock_get_data_size_recursively.assert_not_called()
 
 
@@ -158,6 +159,17 @@ def test_get_data_size_recursively(data, expected):
     assert expected == ret
 
 
+@pytest.mark.parametrize("data", [
+    None, True, False, 0, -1, 10 ** 30, 1.5, "", "value", "한글", "\U0001f600",
+    'quote"', "back\\slash", "\b\f\n\r\t", "\x00\x1f\x7f", "0x" + "ab" * 1024,
+    [], {}, [None, [True, [1]]], {"a": {"b": [1, "c"]}, "": ""},
+    {1: "int key", None: "none key"},
+    {"method": "transfer", "params": {"_to": "hx" + "0" * 40, "_value": "0x1"}},
+])
+def test_get_json_data_size(data):
+    assert get_data_size_using_json_dumps(data) == get_json_data_size(data)
+
+
 class TestAutoValueEnum:
     class Sample1(AutoValueEnum):
         Abc = auto()
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import patch
+
+import pytest
+
+from iconservice.base.address import AddressPrefix
+from iconservice.database.db import IconScoreDatabase
+from iconservice.icon_constant import Revision
+from iconservice.iconscore.context.context import ContextContainer
+from iconservice.iconscore.icon_container_db import VarDB, DictDB, ArrayDB
+from iconservice.iconscore.icon_score_base import IconScoreBase, external
+from iconservice.iconscore.icon_score_context import IconScoreContextType, IconScoreContext
+from iconservice.iconscore.icon_score_context_util import IconScoreContextUtil
+from iconservice.iconscore.icon_score_mapper_object import IconScoreInfo
+from iconservice.iconscore.icon_score_template import IconScoreTemplate, is_templatable
+from tests import create_address
+
+
+_init_count = 0
+
+
+class SampleScore(IconScoreBase):
+    def __init__(self, db: IconScoreDatabase):
+        """Declares container dbs only"""
+        super().__init__(db)
+        self._name = VarDB("name", db, value_type=str)
+        self._balances: DictDB = DictDB("balances", db, value_type=int, depth=1)
+        self._holders = ArrayDB("holders", self.db, value_type=str)
+        self._unused = None
+
+    def on_install(self) -> None:
+        pass
+
+    def on_update(self) -> None:
+        pass
+
+    @external(readonly=True)
+    def name(self) -> str:
+        return self._name.get()
+
+
+class ReadingScore(SampleScore):
+    def __init__(self, db: IconScoreDatabase):
+        super().__init__(db)
+        self._cached_name = self._name.get()
+
+
+class ConstantScore(SampleScore):
+    def __init__(self, db: IconScoreDatabase):
+        super().__init__(db)
+        self._decimals = 18
+
+
+class ClassAttributeScore(SampleScore):
+    count = 0
+
+    def __init__(self, db: IconScoreDatabase):
+        super().__init__(db)
+        type(self).count += 1
+
+
+class GlobalScore(SampleScore):
+    def __init__(self, db: IconScoreDatabase):
+        global _init_count
+        super().__init__(db)
+        _init_count += 1
+
+
+class DerivedScore(SampleScore):
+    pass
+
+
+@pytest.fixture
+def score_db(context_db):
+    return IconScoreDatabase(create_address(AddressPrefix.CONTRACT), context_db)
+
+
+@pytest.fixture(autouse=True)
+def get_owner():
+    # IconScoreBase.__init__() reads the owner of a SCORE once
+    with patch.object(IconScoreContextUtil, "get_owner", return_value=create_address()) as get_owner:
+        yield get_owner
+
+
+@pytest.fixture(autouse=True)
+def context(score_db):
+    context = IconScoreContext(IconScoreContextType.DIRECT)
+    context.current_address = score_db.address
+
+    ContextContainer._push_context(context)
+    yield context
+    ContextContainer._clear_context()
+
+
+def _get_score(template: 'IconScoreTemplate', get_owner) -> tuple:
+    count: int = get_owner.call_count
+    score = template.get_score()
+    return score, get_owner.call_count - count
+
+
+@pytest.mark.parametrize("score_class, expected", [
+    (SampleScore, True),
+    (DerivedScore, True),
+    (ReadingScore, False),
+    (ConstantScore, False),
+    (ClassAttributeScore, False),
+    (GlobalScore, False),
+])
+def test_is_templatable(score_class, expected):
+    assert is_templatable(score_class) == expected
+
+
+def test_get_score_from_template(score_db, context, get_owner):
+    template = IconScoreTemplate(SampleScore, score_db)
+    assert template.verified is None
+
+    first, init_count = _get_score(template, get_owner)
+    assert init_count == 1
+    assert template.verified
+
+    first._temp = 1
+    first._name = None
+
+    score_db.start_tracking(context)
+    second, init_count = _get_score(template, get_owner)
+    accesses = score_db.stop_tracking()
+
+    assert init_count == 0
+    assert type(second) is SampleScore
+    assert not hasattr(second, "_temp")
+    assert isinstance(second._name, VarDB)
+    assert second.address == score_db.address
+    # The size of ArrayDB is read as __init__() does
+    assert accesses == [("get", first._holders._get_size_key())]
+
+    # Every instance has its own container dbs on the same sub dbs
+    third, _ = _get_score(template, get_owner)
+    assert third._holders is not second._holders
+    assert third._holders._db is second._holders._db is first._holders._db
+    assert third._balances is not second._balances
+
+    second._name.set("token")
+    assert second.name() == "token"
+    assert third.name() == "token"
+
+
+@pytest.mark.parametrize("score_class", [ReadingScore, ConstantScore, ClassAttributeScore])
+def test_get_score_without_template(score_db, get_owner, score_class):
+    template = IconScoreTemplate(score_class, score_db)
+
+    for _ in range(3):
+        _, init_count = _get_score(template, get_owner)
+        assert init_count == 1
+
+    assert template.verified is False
+    if score_class is ClassAttributeScore:
+        assert ClassAttributeScore.count == 3
+
+
+def test_get_score_while_building_template(score_db, get_owner):
+    template = IconScoreTemplate(SampleScore, score_db)
+
+    # Instances are created by __init__() without waiting for the template
+    with template._lock:
+        _, init_count = _get_score(template, get_owner)
+    assert init_count == 1
+    assert template.verified is None
+
+    template.get_score()
+    assert template.verified
+
+
+def test_score_info_get_score(score_db, get_owner):
+    score_info = IconScoreInfo(SampleScore, score_db, b"\x00" * 32)
+
+    legacy = score_info.get_score(Revision.TWO.value, use_template=True)
+    assert score_info.get_score(Revision.TWO.value, use_template=True) is legacy
+
+    count: int = get_owner.call_count
+    score_info.get_score(Revision.THREE.value)
+    score_info.get_score(Revision.THREE.value)
+    assert get_owner.call_count - count == 2
+
+    count: int = get_owner.call_count
+    score_info.get_score(Revision.THREE.value, use_template=True)
+    score_info.get_score(Revision.THREE.value, use_template=True)
+    assert get_owner.call_count - count == 1
@@ -23,6 +23,8 @@ from typing_extensions import TypedDict
 from iconservice.base.address import Address, AddressPrefix
 from iconservice.base.exception import InvalidParamsException
 from iconservice.iconscore.typing.conversion import (
+    ConvertOption,
+    ScoreParametersConverter,
     convert_score_parameters,
     object_to_str,
     str_to_object_in_struct,
@@ -167,3 +169,44 @@ def test_str_to_object_in_struct(age, success):
     else:
         with pytest.raises(InvalidParamsException):
             str_to_object_in_struct(params, Person)
+
+
+@pytest.mark.parametrize(
+    "params,options",
+    [
+        ({"user": {"name": "a", "age": "0x1e", "single": "0x1", "wallet": None}, "count": "0x2"}, ConvertOption.NONE),
+        ({"user": {"name": "a", "age": "0x1e", "single": "0x1", "wallet": None}}, ConvertOption.NONE),
+        ({"user": {"name": "a", "age": "0x1e", "single": "0x1"}}, ConvertOption.NONE),
+        ({"user": {"name": "a", "age": "0x1e", "single": "0x1", "wallet": None, "x": "1"}}, ConvertOption.NONE),
+        ({"user": ["a"]}, ConvertOption.NONE),
+        ({"user": 1}, ConvertOption.NONE),
+        ({"users": []}, ConvertOption.NONE),
+        ({"count": "0x1"}, ConvertOption.NONE),
+        ({"user": None, "names": ["0x1", "2"], "unknown": "0x1"}, ConvertOption.NONE),
+        ({"user": None, "names": ["0x1", "2"], "unknown": "0x1"}, ConvertOption.IGNORE_UNKNOWN_PARAMS),
+        ({"user": None, "names": {"a": "0x1"}}, ConvertOption.NONE),
+        ({"user": None, "names": [1]}, ConvertOption.NONE),
+        ({"user": None, "names": None, "owner": "hx" + "0" * 40}, ConvertOption.NONE),
+        ({"user": None, "owner": "invalid"}, ConvertOption.NONE),
+    ]
+)
+def test_score_parameters_converter(params, options):
+    def func(user: Optional[User], count: int = 1, names: List[int] = None, owner: Address = None):
+        pass
+
+    sig = normalize_signature(func)
+    converter = ScoreParametersConverter(sig)
+
+    expected_params = dict(params)
+    try:
+        expected = convert_score_parameters(expected_params, sig, options)
+    except BaseException as e:
+        with pytest.raises(type(e)) as exc_info:
+            converter.convert(dict(params), options)
+        assert str(exc_info.value) == str(e)
+        return
+
+    given_params = dict(params)
+    assert converter.convert(given_params, options) == expected
+    # The given params are never changed, e.g. by filling them with default values
+    assert given_params == expected_params == params
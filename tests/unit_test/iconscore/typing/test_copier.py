@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+
+import pytest
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.iconscore.typing.copier import copy_score_value, MAX_DEPTH
+
+
+def _nest(depth: int):
+    value = 1
+    for _ in range(depth):
+        value = [value]
+    return value
+
+
+@pytest.mark.parametrize("value", [
+    None,
+    True,
+    0x10,
+    "hello",
+    b"\x00\x01",
+    Address(AddressPrefix.EOA, os.urandom(20)),
+    [],
+    {},
+    [1, "a", [b"b", {"c": None}]],
+    {
+        "preps": [
+            {"address": Address(AddressPrefix.EOA, os.urandom(20)), "delegated": 10 ** 24, "name": "node0"},
+        ],
+        "blockHeight": 100,
+        1: False,
+    },
+    _nest(MAX_DEPTH),
+    _nest(MAX_DEPTH + 1),
+])
+def test_copy_score_value(value):
+    copied = copy_score_value(value)
+    assert copied == deepcopy(value)
+    assert type(copied) is type(value)
+
+
+def test_copy_score_value_shares_immutable_leaves():
+    address = Address(AddressPrefix.CONTRACT, os.urandom(20))
+    data = os.urandom(32)
+    value = {"scores": [address], "prep": {"data": data}}
+
+    copied = copy_score_value(value)
+    assert copied is not value
+    assert copied["scores"] is not value["scores"]
+    assert copied["prep"] is not value["prep"]
+    assert copied["scores"][0] is address
+    assert copied["prep"]["data"] is data
+
+    copied["scores"].append(1)
+    copied["prep"]["name"] = "node"
+    assert value == {"scores": [address], "prep": {"data": data}}
+
+
+@pytest.mark.parametrize("value", [
+    OrderedDict(a=[1]),
+    (1, [2]),
+    {(1, 2): [3]},
+    [{1, 2}],
+])
+def test_copy_score_value_falls_back_to_deepcopy(value):
+    copied = copy_score_value(value)
+    assert copied == deepcopy(value)
+    assert type(copied) is type(value)
+
+
+def test_copy_score_value_circular():
+    value = [1]
+    value.append(value)
+
+    copied = copy_score_value(value)
+    assert copied[1] is copied
+    assert copied is not value
+
+
+def test_copy_score_value_shared_container():
+    shared = {"name": "node0", "grade": [0]}
+    value = {"preps": [shared, shared], "main": shared}
+
+    copied = copy_score_value(value)
+    assert copied == deepcopy(value)
+    assert copied["preps"][0] is not shared
+    # Referred to more than once like the value deepcopy() returns
+    assert copied["preps"][0] is copied["preps"][1] is copied["main"]
+
+    copied["main"]["grade"].append(1)
+    assert copied["preps"][1]["grade"] == [0, 1]
+    assert shared == {"name": "node0", "grade": [0]}
+
+
+def test_copy_score_value_raises_as_deepcopy():
+    value = {"lock": [threading.Lock()]}
+
+    with pytest.raises(TypeError) as expected:
+        deepcopy(value)
+    with pytest.raises(TypeError) as e:
+        copy_score_value(value)
+    assert str(e.value) == str(expected.value)
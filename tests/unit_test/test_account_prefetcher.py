@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from iconservice.account_prefetcher import AccountPrefetcher
+from iconservice.base.address import AddressPrefix, MalformedAddress
+from iconservice.database.db import KeyValueDatabase
+from iconservice.deploy.storage import Storage as DeployStorage
+from iconservice.icon_constant import DBBackend
+from iconservice.icx.coin_part import CoinPart
+from iconservice.icx.delegation_part import DelegationPart
+from iconservice.icx.stake_part import StakePart
+from tests import create_address
+
+
+@pytest.fixture
+def key_value_db():
+    db = KeyValueDatabase.from_path("", cache_size=1024 * 1024, backend=DBBackend.MEMORY)
+    yield db
+    db.close()
+
+
+def _make_tx(from_, to) -> dict:
+    return {"method": "icx_sendTransaction", "params": {"from": from_, "to": to}}
+
+
+def test_make_keys():
+    eoa = create_address(AddressPrefix.EOA)
+    score = create_address(AddressPrefix.CONTRACT)
+    tx_requests = [
+        _make_tx(eoa, score),
+        _make_tx(score, eoa),
+        # Base transaction
+        {"method": "icx_sendTransaction", "params": {"dataType": "base"}},
+        _make_tx(eoa, MalformedAddress.from_string("hx1234")),
+    ]
+
+    keys = AccountPrefetcher.make_keys(tx_requests)
+
+    expected = []
+    for address in (eoa, score, MalformedAddress.from_string("hx1234")):
+        expected.extend((CoinPart.make_key(address), StakePart.make_key(address), DelegationPart.make_key(address)))
+        if address.is_contract:
+            expected.append(DeployStorage.make_deploy_info_key(address))
+    assert expected == keys
+    assert [] == AccountPrefetcher.make_keys([])
+
+
+def test_prefetch(key_value_db):
+    addresses = [create_address(AddressPrefix.EOA) for _ in range(3)]
+    for address in addresses[:2]:
+        key_value_db.put(CoinPart.make_key(address), b"coin")
+
+    prefetcher = AccountPrefetcher(key_value_db)
+    try:
+        tx_requests = [_make_tx(addresses[0], addresses[1]), _make_tx(addresses[0], addresses[2])]
+        future = prefetcher.start(tx_requests)
+        AccountPrefetcher.wait(future)
+        assert len(AccountPrefetcher.make_keys(tx_requests)) == len(key_value_db.cache)
+
+        # The states are read from the read cache
+        status: dict = key_value_db.get_cache_status()
+        for address in addresses:
+            assert key_value_db.get(CoinPart.make_key(address)) == (b"coin" if address in addresses[:2] else None)
+            assert key_value_db.get(StakePart.make_key(address)) is None
+        assert status["hits"] + len(addresses) * 2 == key_value_db.get_cache_status()["hits"]
+
+        # The prefetched states are dropped if state_db is written before they are read
+        future = prefetcher.start(tx_requests)
+        key_value_db.put(CoinPart.make_key(addresses[2]), b"coin")
+        AccountPrefetcher.wait(future)
+        assert b"coin" == key_value_db.get(CoinPart.make_key(addresses[2]))
+
+        assert prefetcher.start([]) is None
+        AccountPrefetcher.wait(None)
+    finally:
+        prefetcher.close()
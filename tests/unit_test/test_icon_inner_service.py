@@ -15,6 +15,7 @@
 # limitations under the License.
 import asyncio
 import threading
+from copy import deepcopy
 from unittest.mock import Mock
 
 import pytest
@@ -25,8 +26,10 @@ from iconservice.base.type_converter_templates import ConstantKeys
 from iconservice.icon_constant import RPCMethod, ENABLE_THREAD_FLAG
 from iconservice.icon_inner_service import IconScoreInnerTask
 from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.invoke_recorder import InvokeRecorder
 from iconservice.iconscore.icon_score_step import OutOfStepException
-from tests import create_block_hash
+from tests import create_address, create_block_hash
+from tools.benchmark.replay import Replayer
 
 
 @pytest.fixture(params=[ENABLE_THREAD_FLAG, ~ENABLE_THREAD_FLAG])
@@ -231,3 +234,108 @@ class TestIconInnerService:
         assert status_requests[0] != call_thread_id
         assert status_requests[0] != estimate_thread_id
         assert call_thread_id != estimate_thread_id
+
+    def test_invoke_recorder(self, tmp_path, inner_task, dummy_invoke_request, dummy_write_precommit_request):
+        path: str = str(tmp_path / "invoke_record.jsonl")
+        inner_task._invoke_recorder = InvokeRecorder(path)
+        state_root_hash: bytes = create_block_hash()
+        inner_task._icon_service_engine.invoke = Mock(return_value=([], state_root_hash, [], None))
+        inner_task._icon_service_engine.commit = Mock(return_value=None)
+        loop = asyncio.get_event_loop()
+
+        # Act
+        loop.run_until_complete(inner_task.invoke(dummy_invoke_request))
+        loop.run_until_complete(inner_task.write_precommit_state(dummy_write_precommit_request))
+        inner_task.cleanup()
+
+        records = list(InvokeRecorder.load(path))
+        assert records == [
+            {
+                "method": InvokeRecorder.INVOKE,
+                "request": dummy_invoke_request,
+                "stateRootHash": state_root_hash.hex()
+            },
+            {
+                "method": InvokeRecorder.WRITE_PRECOMMIT_STATE,
+                "request": dummy_write_precommit_request
+            }
+        ]
+
+    def test_invoke_recorder_replay(self, tmp_path, inner_task, dummy_invoke_request):
+        path: str = str(tmp_path / "invoke_record.jsonl")
+        inner_task._invoke_recorder = InvokeRecorder(path)
+        dummy_invoke_request["transactions"] = [{
+            ConstantKeys.METHOD: "icx_sendTransaction",
+            ConstantKeys.PARAMS: {
+                ConstantKeys.TX_HASH: create_block_hash().hex(),
+                ConstantKeys.FROM: str(create_address()),
+                ConstantKeys.TO: str(create_address(1)),
+                ConstantKeys.DATA_TYPE: "call",
+                ConstantKeys.DATA: {
+                    ConstantKeys.METHOD: "set_value",
+                    ConstantKeys.PARAMS: {"value": hex(1)}
+                }
+            }
+        }]
+        request: dict = deepcopy(dummy_invoke_request)
+        state_root_hash: bytes = create_block_hash()
+        invoked_tx_requests: list = []
+
+        def mocked_invoke(tx_requests: list, **kwargs):
+            invoked_tx_requests.append(deepcopy(tx_requests))
+            # Fills the SCORE parameters with default values as invoking a SCORE method does
+            for tx_request in tx_requests:
+                data_params: dict = tx_request[ConstantKeys.PARAMS][ConstantKeys.DATA][ConstantKeys.PARAMS]
+                data_params["proportion"] = 0
+                data_params["owner"] = create_address(1)
+            return [], state_root_hash, [], None
+
+        inner_task._icon_service_engine.invoke = mocked_invoke
+        loop = asyncio.get_event_loop()
+
+        # Act
+        loop.run_until_complete(inner_task.invoke(dummy_invoke_request))
+        inner_task.cleanup()
+
+        records = list(InvokeRecorder.load(path))
+        assert len(records) == 1
+        assert records[0]["request"] == request
+
+        # The recorded request is replayed with the same transactions as the original one
+        engine = Mock(spec=IconServiceEngine)
+        engine.invoke = mocked_invoke
+        replayer = Replayer(engine, verify=True)
+        replayer.replay(records[0])
+        assert replayer.failures == replayer.mismatches == 0
+        assert invoked_tx_requests[0] == invoked_tx_requests[1]
+
+    def test_validate_transactions(self, inner_task):
+        tx_requests = [
+            {
+                ConstantKeys.METHOD: "icx_sendTransaction",
+                ConstantKeys.PARAMS: {ConstantKeys.TX_HASH: create_block_hash().hex(), ConstantKeys.VALUE: hex(i)}
+            } for i in range(3)
+        ]
+        # Fails to convert
+        tx_requests.insert(1, {
+            ConstantKeys.METHOD: "icx_sendTransaction",
+            ConstantKeys.PARAMS: {ConstantKeys.VALUE: "invalid"}
+        })
+        exception = IS_BASE_EXCEPTIONS[0]
+
+        inner_task._icon_service_engine.validate_transactions = Mock(return_value=[None, exception, None])
+        loop = asyncio.get_event_loop()
+
+        # Act
+        response = loop.run_until_complete(
+            inner_task.validate_transactions({ConstantKeys.TRANSACTIONS: tx_requests}))
+
+        converted_requests = inner_task._icon_service_engine.validate_transactions.call_args[0][0]
+        assert [request[ConstantKeys.PARAMS][ConstantKeys.VALUE] for request in converted_requests] == [0, 1, 2]
+
+        responses = response[ConstantKeys.TRANSACTIONS]
+        assert len(responses) == len(tx_requests)
+        assert responses[0] == responses[3] == hex(0)
+        assert "error" in responses[1]
+        assert responses[2]['error']['code'] == 32000 + int(exception.code)
+        assert responses[2]['error']['message'] == exception.message
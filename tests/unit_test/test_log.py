@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from logging.handlers import QueueHandler
+from unittest.mock import Mock, patch
+
+import pytest
+from iconcommons.logger._logger import icon_logger
+
+from iconservice.utils.log import PayloadLogger, is_log_enabled, start_async_log, stop_async_log
+
+
+@pytest.fixture
+def log_level():
+    level: int = icon_logger.level
+    icon_logger.setLevel(logging.INFO)
+    yield
+    icon_logger.setLevel(level)
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record: 'logging.LogRecord'):
+        self.messages.append(record.getMessage())
+
+
+def test_is_log_enabled(log_level):
+    assert is_log_enabled(logging.INFO)
+    assert not is_log_enabled(logging.DEBUG)
+
+
+@patch("iconservice.utils.log.Logger")
+def test_payload_logger_skips_formatting_below_info(logger, log_level):
+    icon_logger.setLevel(logging.WARNING)
+    formatter = Mock(return_value="payload")
+
+    PayloadLogger().info("TAG", "title", {}, formatter)
+
+    formatter.assert_not_called()
+    logger.info.assert_not_called()
+
+
+@patch("iconservice.utils.log.Logger")
+def test_payload_logger_samples_per_title(logger, log_level):
+    payload_logger = PayloadLogger(sample_interval=3)
+
+    for i in range(7):
+        payload_logger.info("TAG", "request", i)
+        payload_logger.info("TAG", "response", i)
+
+    messages = [call[1]["msg"] for call in logger.info.call_args_list]
+    assert messages == [
+        "request: 0", "response: 0",
+        "request: 3", "response: 3",
+        "request: 6", "response: 6",
+    ]
+
+
+@pytest.mark.parametrize("max_size,expected", [
+    (0, "0123456789"),
+    (10, "0123456789"),
+    (4, "0123...(10 chars)"),
+])
+@patch("iconservice.utils.log.Logger")
+def test_payload_logger_truncates(logger, max_size, expected, log_level):
+    PayloadLogger(max_size=max_size).info("TAG", "title", "0123456789")
+
+    logger.info.assert_called_once_with(tag="TAG", msg=f"title: {expected}")
+
+
+def test_async_log(log_level):
+    handler = _ListHandler()
+    handlers: list = list(icon_logger.handlers)
+    icon_logger.addHandler(handler)
+
+    try:
+        listener = start_async_log()
+        assert handler not in icon_logger.handlers
+        assert any(isinstance(h, QueueHandler) for h in icon_logger.handlers)
+
+        icon_logger.info("async message")
+        stop_async_log(listener)
+
+        assert handler.messages == ["async message"]
+        assert handler in icon_logger.handlers
+        assert not any(isinstance(h, QueueHandler) for h in icon_logger.handlers)
+    finally:
+        icon_logger.removeHandler(handler)
+        assert icon_logger.handlers == handlers
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the memory used by a BlockBatch per state
+
+usage: python3 -m tools.benchmark.batch_memory [-k KEYS] [-t TXS] [-o OVERWRITE_RATIO]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue
+
+KEY_SIZE = 32
+VALUE_SIZE = 32
+
+
+class LegacyBlockBatchValue(object):
+    """BlockBatchValue without __slots__ which holds tx indexes in a list
+    It is used as the baseline of this benchmark
+    """
+
+    def __init__(self, value: Optional[bytes], include_state_root_hash: bool, tx_indexes: List[int]):
+        self._value: bytes = value
+        self._include_state_root_hash: bool = include_state_root_hash
+        self._tx_indexes: List[int] = tx_indexes
+
+
+def _make_tx_batches(keys: int, txs: int, overwrite_ratio: float) -> List['TransactionBatch']:
+    rand = random.Random(0)
+    all_keys: List[bytes] = [os.urandom(KEY_SIZE) for _ in range(keys)]
+    keys_per_tx: int = max(1, keys // txs)
+
+    tx_batches = []
+    for tx_index in range(txs):
+        tx_batch = TransactionBatch(os.urandom(32))
+        start: int = tx_index * keys_per_tx
+        tx_keys: List[bytes] = all_keys[start:start + keys_per_tx]
+        # Some keys like balances of popular accounts are changed by many transactions
+        tx_keys.extend(rand.sample(all_keys, int(keys_per_tx * overwrite_ratio)))
+
+        for key in tx_keys:
+            tx_batch[key] = TransactionBatchValue(os.urandom(VALUE_SIZE), True, tx_index)
+        tx_batches.append(tx_batch)
+
+    return tx_batches
+
+
+def _update_legacy(block_batch: OrderedDict, tx_batch: 'TransactionBatch'):
+    for key, value in tx_batch.items():
+        prev_value: Optional['LegacyBlockBatchValue'] = block_batch.get(key)
+        if prev_value is not None:
+            tx_indexes: list = list(prev_value._tx_indexes)
+            tx_indexes.append(value.tx_index)
+        else:
+            tx_indexes: list = [value.tx_index]
+        block_batch[key] = LegacyBlockBatchValue(value.value, value.include_state_root_hash, tx_indexes)
+
+
+def _measure(tx_batches: List['TransactionBatch'], create: Callable, update: Callable) -> (int, int):
+    tracemalloc.start()
+    block_batch = create()
+    for tx_batch in tx_batches:
+        update(block_batch, tx_batch)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size, len(block_batch)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="batch_memory", description="Measure the memory usage of BlockBatch")
+    parser.add_argument("-k", "--keys", type=int, default=50_000, help="The number of states changed in a block")
+    parser.add_argument("-t", "--txs", type=int, default=1_000, help="The number of transactions in a block")
+    parser.add_argument("-o", "--overwrite-ratio", dest="overwrite_ratio", type=float, default=0.5,
+                        help="The ratio of states overwritten by other transactions")
+    args = parser.parse_args()
+
+    tx_batches = _make_tx_batches(args.keys, args.txs, args.overwrite_ratio)
+    # Keys and values are shared by both batches, so only the overhead of each representation is compared
+    payload: int = KEY_SIZE + VALUE_SIZE
+
+    results = (
+        ("legacy", _measure(tx_batches, OrderedDict, _update_legacy)),
+        ("current", _measure(tx_batches, BlockBatch, BlockBatch.update)),
+    )
+
+    print(f"{'batch':<10}{'entries':>10}{'total(bytes)':>16}{'bytes/entry':>14}")
+    for name, (size, entries) in results:
+        print(f"{name:<10}{entries:>10}{size:>16}{size / entries:>14.1f}")
+    print(f"(key and value payload of {payload} bytes/entry is not included)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
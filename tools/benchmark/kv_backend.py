@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the read and write latency of KeyValueDatabase on each storage backend
+
+usage: python3 -m tools.benchmark.kv_backend [-s SOURCE] [-k KEYS] [-v VALUE_SIZE] [-n GETS] [-b BACKENDS]
+                                             [--bloom FP_RATE]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+from iconservice.database.db import KeyValueDatabase
+from iconservice.icon_constant import DBBackend
+
+KEY_SIZE = 32
+
+
+def _percentile(values: List[float], percent: int) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, round(len(values) * percent / 100))]
+
+
+def _load_items(source: str, keys: int, value_size: int) -> List[Tuple[bytes, bytes]]:
+    """Reads items from a LevelDB like a state db or an rc db, or makes random ones
+    """
+    if source:
+        db = KeyValueDatabase.from_path(source, create_if_missing=False)
+        try:
+            items: List[Tuple[bytes, bytes]] = []
+            with db.iterator() as it:
+                for item in it:
+                    items.append(item)
+                    if 0 < keys <= len(items):
+                        break
+            return items
+        finally:
+            db.close()
+
+    rand = random.Random(0)
+    return [(rand.getrandbits(KEY_SIZE * 8).to_bytes(KEY_SIZE, "big"), os.urandom(value_size)) for _ in range(keys)]
+
+
+def _measure_gets(get: callable, keys: List[bytes]) -> List[float]:
+    elapsed: List[float] = []
+    for key in keys:
+        start: float = time.perf_counter()
+        get(key)
+        elapsed.append(time.perf_counter() - start)
+    return elapsed
+
+
+def _run(backend: str, path: str, items: List[Tuple[bytes, bytes]], gets: int, bloom_fp_rate: float) -> dict:
+    db = KeyValueDatabase.from_path(path, backend=backend, bloom_fp_rate=bloom_fp_rate)
+    try:
+        start: float = time.perf_counter()
+        db.write_batch(items)
+        load: float = time.perf_counter() - start
+
+        rand = random.Random(1)
+        hit_keys: List[bytes] = [rand.choice(items)[0] for _ in range(gets)]
+        miss_keys: List[bytes] = [key + b"\x00" for key in hit_keys]
+
+        hits: List[float] = _measure_gets(db.get, hit_keys)
+        misses: List[float] = _measure_gets(db.get, miss_keys)
+
+        snapshot = db.get_snapshot()
+        snapshot_hits: List[float] = _measure_gets(snapshot.get, hit_keys)
+
+        start: float = time.perf_counter()
+        with db.iterator() as it:
+            count: int = sum(1 for _ in it)
+        iteration: float = time.perf_counter() - start
+        assert count == len({key for key, _ in items})
+
+        return {
+            "load": len(items) / load,
+            "hit": hits,
+            "miss": misses,
+            "snapshot": snapshot_hits,
+            "iteration": count / iteration,
+        }
+    finally:
+        db.close()
+
+
+def main(args: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="kv_backend",
+                                     description="Compare the latency of KeyValueDatabase on each storage backend")
+    parser.add_argument("-s", "--source", type=str, default="",
+                        help="The path of a LevelDB to copy items from (e.g. .statedb/icon_dex). "
+                             "Random items are used if it is not given")
+    parser.add_argument("-k", "--keys", type=int, default=100_000, help="The number of items (0: all in SOURCE)")
+    parser.add_argument("-v", "--value-size", dest="value_size", type=int, default=64,
+                        help="The size of a random value")
+    parser.add_argument("-n", "--gets", type=int, default=20_000, help="The number of gets per case")
+    parser.add_argument("-b", "--backends", type=str, default=",".join(
+        (DBBackend.LEVELDB, DBBackend.MEMORY, DBBackend.LMDB)), help="Comma-separated storage backends")
+    parser.add_argument("--bloom", dest="bloom_fp_rate", type=float, default=0.0,
+                        help="The false positive rate of the bloom index (0: disabled)")
+    args = parser.parse_args(args)
+
+    items: List[Tuple[bytes, bytes]] = _load_items(args.source, args.keys, args.value_size)
+    if not items:
+        print("No items to load", file=sys.stderr)
+        return 1
+
+    print(f"{'backend':<10}{'load(op/s)':>12}{'iter(op/s)':>12}"
+          f"{'hit p50':>10}{'hit p99':>10}{'miss p50':>10}{'miss p99':>10}{'snap p50':>10}")
+    for backend in args.backends.split(","):
+        root: str = tempfile.mkdtemp(prefix="kv_backend_")
+        try:
+            result: dict = _run(backend, os.path.join(root, "db"), items, args.gets, args.bloom_fp_rate)
+        except BaseException as e:
+            print(f"{backend:<10}failed: {e}")
+            continue
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+        print(f"{backend:<10}{result['load']:>12.0f}{result['iteration']:>12.0f}"
+              f"{_percentile(result['hit'], 50) * 10 ** 6:>10.2f}{_percentile(result['hit'], 99) * 10 ** 6:>10.2f}"
+              f"{_percentile(result['miss'], 50) * 10 ** 6:>10.2f}{_percentile(result['miss'], 99) * 10 ** 6:>10.2f}"
+              f"{_percentile(result['snapshot'], 50) * 10 ** 6:>10.2f}")
+    print(f"({len(items)} items, latency in us)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
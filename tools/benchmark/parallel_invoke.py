@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the time to invoke a block with and without speculative transaction execution
+
+usage: python3 -m tools.benchmark.parallel_invoke [-t TXS] [-w WORKERS] [-r REPEAT]
+
+The engine is set up in the same way as the integrate tests, so it runs without the reward calculator.
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+from iconservice.base.address import SYSTEM_SCORE_ADDRESS
+from iconservice.base.block import Block
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP
+from iconservice.optimistic_executor import OptimisticTxExecutor
+from tests import create_address, create_block_hash, create_timestamp
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class _Harness(TestIntegrateBase):
+    workers: int = 0
+
+    def _make_init_config(self) -> dict:
+        return {
+            ConfigKey.SERVICE: {ConfigKey.SERVICE_FEE: True},
+            ConfigKey.PARALLEL_TX_WORKERS: self.workers
+        }
+
+    def setUp(self):
+        super().setUp()
+
+        tx_list: list = [
+            self.create_transfer_icx_tx(from_=self._admin, to_=account, value=10_000 * ICX_IN_LOOP)
+            for account in self._accounts
+        ]
+        self.process_confirm_block_tx(tx_list)
+
+        tx_results = self.process_confirm_block_tx([
+            self.create_deploy_score_tx(score_root="sample_deploy_scores",
+                                        score_name="install/sample_token",
+                                        from_=self._accounts[0],
+                                        to_=SYSTEM_SCORE_ADDRESS,
+                                        deploy_params={"init_supply": hex(10 ** 6), "decimal": hex(18)},
+                                        step_limit=10 ** 10)
+        ])
+        self.token_address = tx_results[0].score_address
+
+        # Every account holds tokens to send
+        tx_list: list = [
+            self.create_score_call_tx(from_=self._accounts[0],
+                                      to_=self.token_address,
+                                      func_name="transfer",
+                                      params={"addr_to": str(account.address), "value": hex(1000 * ICX_IN_LOOP)})
+            for account in self._accounts[1:]
+        ]
+        self.process_confirm_block_tx(tx_list)
+
+    def runTest(self):
+        pass
+
+    def make_transfer_txs(self, count: int) -> list:
+        return [
+            self.create_transfer_icx_tx(from_=self._accounts[i % len(self._accounts)],
+                                        to_=create_address(),
+                                        value=ICX_IN_LOOP,
+                                        disable_pre_validate=True)
+            for i in range(count)
+        ]
+
+    def make_token_txs(self, count: int) -> list:
+        return [
+            self.create_score_call_tx(from_=self._accounts[i % len(self._accounts)],
+                                      to_=self.token_address,
+                                      func_name="transfer",
+                                      params={"addr_to": str(create_address()), "value": hex(1)},
+                                      pre_validation_enabled=False)
+            for i in range(count)
+        ]
+
+    def invoke(self, tx_list: list, parallel: bool) -> float:
+        engine = self.icon_service_engine
+        executor: Optional['OptimisticTxExecutor'] = engine._optimistic_tx_executor
+        block = Block(self._block_height + 1, create_block_hash(), create_timestamp(), self._prev_block_hash, 0)
+
+        if not parallel:
+            engine._optimistic_tx_executor = None
+        try:
+            start: float = time.perf_counter()
+            engine.invoke(block=block, tx_requests=tx_list)
+            return time.perf_counter() - start
+        finally:
+            engine._optimistic_tx_executor = executor
+
+
+def _run(harness: '_Harness', name: str, tx_list: list, repeat: int):
+    serial: List[float] = [harness.invoke(tx_list, parallel=False) for _ in range(repeat)]
+    parallel: List[float] = [harness.invoke(tx_list, parallel=True) for _ in range(repeat)]
+
+    serial_s: float = min(serial)
+    parallel_s: float = min(parallel)
+    print(f"{name:<10}{len(tx_list):>6}{len(tx_list) / serial_s:>14.1f}{len(tx_list) / parallel_s:>16.1f}"
+          f"{serial_s / parallel_s:>10.2f}")
+
+
+def main(args: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="parallel_invoke",
+                                     description="Measure the throughput of speculative transaction execution")
+    parser.add_argument("-t", "--txs", type=int, default=500, help="The number of transactions in a block")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="The number of threads executing transactions")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="The number of invocations per case")
+    args = parser.parse_args(args)
+
+    _Harness.workers = args.workers
+    _Harness.setUpClass()
+    harness = _Harness()
+    harness.setUp()
+
+    try:
+        print(f"{'block':<10}{'txs':>6}{'serial(tx/s)':>14}{'parallel(tx/s)':>16}{'speedup':>10}")
+        _run(harness, "transfer", harness.make_transfer_txs(args.txs), args.repeat)
+        _run(harness, "token", harness.make_token_txs(args.txs), args.repeat)
+
+        status: dict = harness.icon_service_engine._optimistic_tx_executor.get_status()
+        print(f"(workers={args.workers}, executed txs: {status})")
+    finally:
+        harness.tearDown()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
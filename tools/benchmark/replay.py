@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Replays the requests recorded by InvokeRecorder on IconServiceEngine without loopchain
+
+usage: python3 -m tools.benchmark.replay [-c CONFIG] [-n BLOCKS] [--with-rc] [--no-verify] record
+
+The state DB in CONFIG should be the one at the block height where the recording started
+(an empty one for a recording from the genesis block). Note that replaying changes it.
+"""
+
+import argparse
+import copy
+import sys
+import time
+from typing import List, Dict, Optional
+from unittest.mock import Mock
+
+from iconcommons import IconConfig
+
+from iconservice.base.block import Block
+from iconservice.base.type_converter import TypeConverter, ParamType
+from iconservice.base.type_converter_templates import ConstantKeys
+from iconservice.icon_config import default_icon_config
+from iconservice.icon_constant import ConfigKey, RPCMethod, RCCalculateResult
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from iconservice.invoke_recorder import InvokeRecorder
+from iconservice.utils import bytes_to_hex
+
+
+def _mock_reward_calculator():
+    RewardCalcProxy.open = Mock()
+    RewardCalcProxy.start = Mock()
+    RewardCalcProxy.stop = Mock()
+    RewardCalcProxy.close = Mock()
+    RewardCalcProxy.get_version = Mock()
+    RewardCalcProxy.calculate = Mock()
+    RewardCalcProxy.claim_iscore = Mock()
+    RewardCalcProxy.query_iscore = Mock()
+    RewardCalcProxy.commit_block = Mock()
+    RewardCalcProxy.commit_claim = Mock()
+    RewardCalcProxy.query_calculate_result = Mock(return_value=(RCCalculateResult.SUCCESS, 0, 0, bytes()))
+
+
+def _percentile(values: List[float], percent: int) -> float:
+    if not values:
+        return 0.0
+
+    values = sorted(values)
+    return values[min(len(values) - 1, round(len(values) * percent / 100))]
+
+
+class Replayer(object):
+    def __init__(self, engine: 'IconServiceEngine', verify: bool):
+        self._engine = engine
+        self._verify: bool = verify
+
+        # in seconds
+        self.invoke_elapsed: List[float] = []
+        self.commit_elapsed: List[float] = []
+        self.commit_phases: Dict[str, List[float]] = {}
+        self.txs: int = 0
+        self.mismatches: int = 0
+        self.failures: int = 0
+
+    def replay(self, record: dict):
+        method: str = record["method"]
+        request: dict = record["request"]
+
+        try:
+            if method == InvokeRecorder.INVOKE:
+                self._invoke(request, record.get("stateRootHash"))
+            elif method == InvokeRecorder.WRITE_PRECOMMIT_STATE:
+                self._commit(request)
+            elif method == InvokeRecorder.ROLLBACK:
+                self._rollback(request)
+        except BaseException as e:
+            self.failures += 1
+            print(f"Failed to replay {method}: {e}", file=sys.stderr)
+        finally:
+            self._engine.clear_context_stack()
+
+    def _invoke(self, request: dict, expected_state_root_hash: Optional[str]):
+        params: dict = TypeConverter.convert(request, ParamType.INVOKE)
+        block = Block.from_dict(params["block"])
+
+        start: float = time.perf_counter()
+        tx_results, state_root_hash, _, _ = self._engine.invoke(
+            block=block,
+            tx_requests=params["transactions"],
+            prev_block_generator=params.get("prevBlockGenerator"),
+            prev_block_validators=params.get("prevBlockValidators"),
+            prev_block_votes=params.get("prevBlockVotes"),
+            is_block_editable=params.get("isBlockEditable", False))
+        self.invoke_elapsed.append(time.perf_counter() - start)
+        self.txs += len(tx_results)
+
+        if self._verify and expected_state_root_hash is not None \
+                and state_root_hash.hex() != expected_state_root_hash:
+            self.mismatches += 1
+            print(f"State root hash mismatch: BH={block.height} "
+                  f"expected=0x{expected_state_root_hash} actual={bytes_to_hex(state_root_hash)}", file=sys.stderr)
+
+    def _commit(self, request: dict):
+        params: dict = TypeConverter.convert(request, ParamType.WRITE_PRECOMMIT)
+        block_hash: bytes = params[ConstantKeys.NEW_BLOCK_HASH]
+
+        start: float = time.perf_counter()
+        self._engine.commit(params[ConstantKeys.BLOCK_HEIGHT], params[ConstantKeys.OLD_BLOCK_HASH], block_hash)
+        self.commit_elapsed.append(time.perf_counter() - start)
+
+        for profile in self._engine.query(RPCMethod.DEBUG_GET_BLOCK_PROFILES, {}):
+            if profile["blockHash"] == block_hash:
+                for name, elapsed_us in profile["commitPhasesUs"].items():
+                    self.commit_phases.setdefault(name, []).append(elapsed_us / 10 ** 6)
+                break
+
+    def _rollback(self, request: dict):
+        params: dict = TypeConverter.convert(request, ParamType.ROLLBACK)
+        self._engine.rollback(params[ConstantKeys.BLOCK_HEIGHT], params[ConstantKeys.BLOCK_HASH])
+
+    def print_report(self):
+        elapsed: float = sum(self.invoke_elapsed) + sum(self.commit_elapsed)
+        blocks: int = len(self.invoke_elapsed)
+
+        print(f"{'blocks':>8}{'txs':>10}{'elapsed(s)':>12}{'blocks/s':>10}{'tx/s':>10}")
+        print(f"{blocks:>8}{self.txs:>10}{elapsed:>12.2f}"
+              f"{blocks / elapsed if elapsed else 0:>10.1f}{self.txs / elapsed if elapsed else 0:>10.1f}")
+        print()
+
+        print(f"{'(ms)':<12}{'count':>8}{'mean':>10}{'p50':>10}{'p99':>10}{'max':>10}")
+        rows = [("invoke", self.invoke_elapsed), ("commit", self.commit_elapsed)]
+        rows.extend((f" {name}", values) for name, values in self.commit_phases.items())
+        for name, values in rows:
+            mean: float = sum(values) / len(values) if values else 0.0
+            print(f"{name:<12}{len(values):>8}{mean * 1000:>10.2f}{_percentile(values, 50) * 1000:>10.2f}"
+                  f"{_percentile(values, 99) * 1000:>10.2f}{max(values, default=0.0) * 1000:>10.2f}")
+        print()
+
+        print(f"state root hash mismatches: {self.mismatches}, failed requests: {self.failures}")
+
+
+def main(args: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="replay",
+                                     description="Replay the requests recorded with invokeRecordPath")
+    parser.add_argument("record", type=str, help="The path of a record file")
+    parser.add_argument("-c", "--config", type=str, default="", help="The path of iconservice_config.json")
+    parser.add_argument("-n", "--blocks", type=int, default=0, help="The number of blocks to invoke (0: all)")
+    parser.add_argument("--with-rc", action="store_true", help="Run with the reward calculator")
+    parser.add_argument("--no-verify", action="store_true", help="Skip checking the state root hash of each block")
+    args = parser.parse_args(args)
+
+    conf = IconConfig(args.config, copy.deepcopy(default_icon_config))
+    conf.load()
+    # Commit phases are read from the block profiles
+    if conf[ConfigKey.BLOCK_PROFILE_COUNT] <= 0:
+        conf[ConfigKey.BLOCK_PROFILE_COUNT] = default_icon_config[ConfigKey.BLOCK_PROFILE_COUNT]
+    conf[ConfigKey.INVOKE_RECORD_PATH] = ""
+
+    if not args.with_rc:
+        _mock_reward_calculator()
+
+    engine = IconServiceEngine()
+    engine.open(conf)
+
+    replayer = Replayer(engine, verify=not args.no_verify)
+    try:
+        for record in InvokeRecorder.load(args.record):
+            if record["method"] == InvokeRecorder.INVOKE and 0 < args.blocks <= len(replayer.invoke_elapsed):
+                break
+            replayer.replay(record)
+    finally:
+        engine.close()
+
+    replayer.print_report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the time to copy the return values of SCORE methods
+
+usage: python3 -m tools.benchmark.score_result_copy [-p PREPS] [-r REPEAT]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from copy import deepcopy
+from typing import List
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.iconscore.typing.copier import copy_score_value
+
+
+def _address(prefix: AddressPrefix = AddressPrefix.EOA) -> 'Address':
+    return Address(prefix, os.urandom(20))
+
+
+def _make_prep(i: int) -> dict:
+    """Returns a P-Rep in the same format as getPRep
+    """
+    address: 'Address' = _address()
+    return {
+        "address": address,
+        "status": 0,
+        "grade": 2 if i >= 22 else 0,
+        "name": f"node{i}",
+        "country": "KOR",
+        "city": "Seoul",
+        "email": f"node{i}@example.com",
+        "website": f"https://node{i}.example.com",
+        "details": f"https://node{i}.example.com/details.json",
+        "p2pEndpoint": f"node{i}.example.com:7100",
+        "nodeAddress": address,
+        "irep": 50_000 * 10 ** 18,
+        "irepUpdateBlockHeight": 10_000_000 + i,
+        "lastGenerateBlockHeight": 20_000_000 + i,
+        "stake": i * 10 ** 21,
+        "delegated": i * 10 ** 24,
+        "totalBlocks": 1_000_000 + i,
+        "validatedBlocks": 999_000 + i,
+        "unvalidatedSequenceBlocks": 0,
+        "blockHeight": 9_000_000 + i,
+        "txIndex": i % 100,
+        "penalty": 0,
+    }
+
+
+def _make_results(preps: int) -> dict:
+    """Returns the results of the methods which return large values
+    """
+    return {
+        "getPReps": {
+            "blockHeight": 20_000_000,
+            "startRanking": 1,
+            "totalStake": 10 ** 26,
+            "totalDelegated": 10 ** 26,
+            "preps": [_make_prep(i) for i in range(preps)],
+        },
+        "getScoreStatus": {
+            "current": {
+                "status": "active",
+                "deployTxHash": os.urandom(32),
+                "auditTxHash": os.urandom(32),
+            },
+            "next": {
+                "status": "pending",
+                "deployTxHash": os.urandom(32),
+            },
+        },
+        "snapshot": [[_address(), i * 10 ** 18] for i in range(preps * 10)],
+        "balanceOf": 10 ** 18,
+    }
+
+
+def main(args: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="score_result_copy",
+                                     description="Measure the time to copy the return values of SCORE methods")
+    parser.add_argument("-p", "--preps", type=int, default=200, help="The number of P-Reps in getPReps")
+    parser.add_argument("-r", "--repeat", type=int, default=20, help="The number of copies per case")
+    args = parser.parse_args(args)
+
+    results: dict = _make_results(args.preps)
+
+    print(f"{'method':<16}{'deepcopy(us)':>14}{'copier(us)':>12}{'speedup':>10}")
+    for method, result in results.items():
+        assert copy_score_value(result) == deepcopy(result)
+
+        elapsed: List[float] = []
+        for copy in (deepcopy, copy_score_value):
+            elapsed.append(min(timeit.repeat(lambda: copy(result), number=1, repeat=args.repeat)))
+
+        print(f"{method:<16}{elapsed[0] * 10 ** 6:>14.1f}{elapsed[1] * 10 ** 6:>12.1f}"
+              f"{elapsed[0] / elapsed[1]:>10.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
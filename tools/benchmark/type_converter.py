@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the time to convert the params of an invoke message
+
+usage: python3 -m tools.benchmark.type_converter [-t TXS] [-r REPEAT]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from copy import deepcopy
+from typing import Any, List, Union
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.base.exception import InvalidParamsException
+from iconservice.base.type_converter import TypeConverter
+from iconservice.base.type_converter_templates import (
+    ParamType, ValueType, ConstantKeys, type_convert_templates,
+    KEY_CONVERTER, CONVERT_USING_SWITCH_KEY, SWITCH_KEY
+)
+
+
+class LegacyTypeConverter(object):
+    """TypeConverter which deep-copies params and walks a template recursively on every call
+    It is used as the baseline of this benchmark
+    """
+
+    @classmethod
+    def convert(cls, params: Union[list, dict], param_type: ParamType) -> Any:
+        copied_params = deepcopy(params)
+        return cls._convert(copied_params, type_convert_templates[param_type])
+
+    @classmethod
+    def _convert(cls, params, template):
+        if cls._skip_params(params, template):
+            return params
+
+        if isinstance(template, dict) and KEY_CONVERTER in template:
+            params = TypeConverter._convert_key(params, template[KEY_CONVERTER])
+
+        if isinstance(params, dict) and isinstance(template, dict):
+            new_params = {}
+            for key, value in params.items():
+                value_template = template.get(key)
+                if isinstance(value_template, dict) and CONVERT_USING_SWITCH_KEY in value_template:
+                    ref_key_table = deepcopy(new_params)
+                    new_value = cls._convert_using_switch(
+                        value, ref_key_table, value_template[CONVERT_USING_SWITCH_KEY])
+                else:
+                    new_value = cls._convert(value, value_template)
+                new_params[key] = new_value
+        elif isinstance(params, list) and isinstance(template, list):
+            new_params = []
+            for item in params:
+                if isinstance(item, list):
+                    new_params.append([cls._convert(element, element_template)
+                                       for element, element_template in zip(item, template[0])])
+                else:
+                    new_params.append(cls._convert(item, template[0]))
+        elif isinstance(template, ValueType):
+            new_params = TypeConverter._compile_value(template)(params)
+        else:
+            new_params = params
+
+        return new_params
+
+    @classmethod
+    def _skip_params(cls, params, template) -> bool:
+        if params is None:
+            raise InvalidParamsException(f'TypeConvert Exception None value, template: {str(template)}')
+        if isinstance(params, str):
+            if params != "" and not template:
+                return True
+        elif not params or not template:
+            return True
+        return False
+
+    @classmethod
+    def _convert_using_switch(cls, params, tmp_params: dict, template: dict):
+        if cls._skip_params(params, template):
+            return params
+
+        target_template = template.get(tmp_params.get(template.get(SWITCH_KEY)))
+
+        if isinstance(params, dict) and isinstance(target_template, dict):
+            return {key: cls._convert(value, target_template.get(key)) for key, value in params.items()}
+        elif isinstance(params, list) and isinstance(target_template, list):
+            return [cls._convert(item, target_template[0]) for item in params]
+        elif isinstance(target_template, ValueType):
+            return TypeConverter._compile_value(target_template)(params)
+        return params
+
+
+def _address(prefix: AddressPrefix = AddressPrefix.EOA) -> str:
+    return str(Address(prefix, os.urandom(20)))
+
+
+def _make_invoke_request(txs: int) -> dict:
+    """Returns the params of an invoke message which has ICX transfers, token transfers and v2 transfers
+    """
+    token_address: str = _address(AddressPrefix.CONTRACT)
+    signature = "VAia7YZ2Ji6igKWzjR2YsGa2m53nKPrfK7uXYW78QLE+ATehAVZPC40szvAiA6NEU5gCYB4c4qaQzqDh2ugcHgA="
+
+    transactions = []
+    for i in range(txs):
+        params = {
+            ConstantKeys.TX_HASH: os.urandom(32).hex(),
+            ConstantKeys.FROM: _address(),
+            ConstantKeys.TIMESTAMP: hex(1_580_000_000_000_000 + i),
+            ConstantKeys.SIGNATURE: signature,
+        }
+
+        kind: int = i % 3
+        if kind == 0:
+            params[ConstantKeys.VERSION] = "0x3"
+            params[ConstantKeys.TO] = _address()
+            params[ConstantKeys.VALUE] = hex(10 ** 18)
+            params[ConstantKeys.STEP_LIMIT] = hex(100_000)
+            params[ConstantKeys.NONCE] = hex(i)
+        elif kind == 1:
+            params[ConstantKeys.VERSION] = "0x3"
+            params[ConstantKeys.TO] = token_address
+            params[ConstantKeys.STEP_LIMIT] = hex(1_000_000)
+            params[ConstantKeys.DATA_TYPE] = ConstantKeys.CALL
+            params[ConstantKeys.DATA] = {
+                ConstantKeys.METHOD: "transfer",
+                ConstantKeys.PARAMS: {"_to": _address(), "_value": hex(10 ** 18)}
+            }
+        else:
+            params[ConstantKeys.TO] = _address()
+            params[ConstantKeys.VALUE] = hex(10 ** 18)[2:]
+            params[ConstantKeys.FEE] = hex(10 ** 16)
+
+        transactions.append({ConstantKeys.METHOD: "icx_sendTransaction", ConstantKeys.PARAMS: params})
+
+    return {
+        ConstantKeys.BLOCK: {
+            ConstantKeys.BLOCK_HEIGHT: hex(1000),
+            ConstantKeys.BLOCK_HASH: os.urandom(32).hex(),
+            ConstantKeys.TIMESTAMP: hex(1_580_000_000_000_000),
+            ConstantKeys.PREV_BLOCK_HASH: os.urandom(32).hex()
+        },
+        ConstantKeys.TRANSACTIONS: transactions,
+        ConstantKeys.IS_BLOCK_EDITABLE: "0x0",
+        ConstantKeys.PREV_BLOCK_GENERATOR: _address(),
+        ConstantKeys.PREV_BLOCK_VALIDATORS: [_address() for _ in range(21)],
+        ConstantKeys.PREV_BLOCK_VOTES: [[_address(), "0x1"] for _ in range(21)]
+    }
+
+
+def main(args: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="type_converter",
+                                     description="Measure the time to convert the params of an invoke message")
+    parser.add_argument("-t", "--txs", type=int, default=1000, help="The number of transactions in a block")
+    parser.add_argument("-r", "--repeat", type=int, default=20, help="The number of conversions per converter")
+    args = parser.parse_args(args)
+
+    request: dict = _make_invoke_request(args.txs)
+    assert TypeConverter.convert(request, ParamType.INVOKE) == LegacyTypeConverter.convert(request, ParamType.INVOKE)
+
+    print(f"{'converter':<10}{'txs':>6}{'ms/block':>12}{'us/tx':>10}")
+    for name, converter in (("legacy", LegacyTypeConverter), ("current", TypeConverter)):
+        elapsed: float = min(timeit.repeat(lambda: converter.convert(request, ParamType.INVOKE),
+                                           number=1, repeat=args.repeat))
+        print(f"{name:<10}{args.txs:>6}{elapsed * 1000:>12.2f}{elapsed * 10 ** 6 / args.txs:>10.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
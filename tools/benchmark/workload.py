@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the throughput of IconServiceEngine on synthetic workloads
+
+usage: python3 -m tools.benchmark.workload [-w WORKLOADS] [-t TXS] [-b BLOCKS] [-r REPEAT] [-s SEED]
+                                           [-o OUTPUT] [-c COMPARE]
+
+Blocks are generated deterministically from SEED, so the results can be compared across commits.
+The engine is set up in the same way as the integrate tests with the reward calculator mocked,
+and the state DB is placed on tmpfs (/dev/shm) if it exists.
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import List, Dict, Callable
+from unittest.mock import Mock
+
+from iconservice.base.address import Address, AddressPrefix, SYSTEM_SCORE_ADDRESS
+from iconservice.base.block import Block
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP, Revision
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from tests import create_block_hash, create_timestamp, get_score_path
+from tests.integrate_test.in_memory_zip import InMemoryZip
+from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
+
+# The number of accounts sending transactions
+ACCOUNTS = 1000
+# The number of addresses which accounts delegate to
+DELEGATES = 10
+# I-Score claimed by claimIScore (1 ICX)
+ISCORE = 10 ** 3 * ICX_IN_LOOP
+
+
+class _Harness(TestIISSBase):
+    seed: int = 0
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        root: str = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        cls._root_path: str = tempfile.mkdtemp(prefix="workload_", dir=root)
+        cls._score_root_path = os.path.join(cls._root_path, ".score")
+        cls._state_db_root_path = os.path.join(cls._root_path, ".statedb")
+        cls._iiss_db_root_path = os.path.join(cls._root_path, ".iissdb")
+        cls._precommit_log_path = os.path.join(cls._root_path, "precommit")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._root_path, ignore_errors=True)
+
+    def _make_init_config(self) -> dict:
+        return {
+            ConfigKey.SERVICE: {ConfigKey.SERVICE_FEE: True},
+            ConfigKey.BLOCK_PROFILE_COUNT: 0
+        }
+
+    def setUp(self):
+        super().setUp()
+        self._random = random.Random(self.seed)
+
+        self.update_governance()
+        self.set_revision(Revision.IISS.value)
+
+        RewardCalcProxy.claim_iscore = Mock(return_value=(ISCORE, 0))
+        RewardCalcProxy.commit_claim = Mock()
+
+        self.senders: List['Address'] = [self._create_address() for _ in range(ACCOUNTS)]
+        self.delegates: List['Address'] = [self._create_address() for _ in range(DELEGATES)]
+        # claimIScore withdraws ICX from the treasury
+        self.transfer_icx(from_=self._admin, to_=self._fee_treasury, value=10 ** 6 * ICX_IN_LOOP)
+        for i in range(0, ACCOUNTS, 500):
+            self.process_confirm_block_tx([
+                self.create_transfer_icx_tx(from_=self._admin, to_=sender, value=10_000 * ICX_IN_LOOP)
+                for sender in self.senders[i:i + 500]
+            ])
+
+        self._token_zip: str = self._zip_score("install/sample_token")
+        tx_results = self.process_confirm_block_tx([
+            self._create_deploy_tx(self.senders[0], "install/sample_token", self._token_zip,
+                                   {"init_supply": hex(10 ** 9), "decimal": hex(18)})
+        ])
+        self.token_address: 'Address' = tx_results[0].score_address
+        for i in range(1, ACCOUNTS, 500):
+            self.process_confirm_block_tx([
+                self.create_score_call_tx(from_=self.senders[0],
+                                          to_=self.token_address,
+                                          func_name="transfer",
+                                          params={"addr_to": str(sender), "value": hex(10 ** 6 * ICX_IN_LOOP)},
+                                          pre_validation_enabled=False)
+                for sender in self.senders[i:i + 500]
+            ])
+
+        # The SCORE pays the fees of set_value() from its deposit
+        tx_results = self.process_confirm_block_tx([
+            self._create_deploy_tx(self._admin, "install/sample_score_fee_sharing",
+                                   self._zip_score("install/sample_score_fee_sharing"), {"value": hex(0)})
+        ])
+        self.fee_sharing_address: 'Address' = tx_results[0].score_address
+        self.deposit_icx(score_address=self.fee_sharing_address, amount=100_000 * ICX_IN_LOOP, period=0)
+
+    def runTest(self):
+        pass
+
+    def _create_address(self) -> 'Address':
+        return Address(AddressPrefix.EOA, self._random.getrandbits(160).to_bytes(20, "big"))
+
+    @staticmethod
+    def _zip_score(score_name: str) -> str:
+        mz = InMemoryZip()
+        mz.zip_in_memory(get_score_path("sample_deploy_scores", score_name))
+        return f"0x{mz.data.hex()}"
+
+    def _create_deploy_tx(self, from_: 'Address', score_name: str, data: str, params: dict) -> dict:
+        tx: dict = self.create_deploy_score_tx(score_root="sample_deploy_scores",
+                                               score_name=score_name,
+                                               from_=from_,
+                                               to_=SYSTEM_SCORE_ADDRESS,
+                                               deploy_params=params,
+                                               data=bytes.fromhex(data[2:]),
+                                               pre_validation_enabled=False,
+                                               step_limit=10 ** 10)
+        return tx
+
+    def _call_tx(self, from_: 'Address', to: 'Address', method: str, params: dict) -> dict:
+        return self.create_score_call_tx(from_=from_, to_=to, func_name=method, params=params,
+                                         pre_validation_enabled=False)
+
+    def _sender(self, i: int) -> 'Address':
+        return self.senders[i % ACCOUNTS]
+
+    def make_transfer_txs(self, count: int) -> List[dict]:
+        return [
+            self.create_transfer_icx_tx(from_=self._sender(i),
+                                        to_=self._create_address(),
+                                        value=self._random.randint(1, 10 ** 4) * ICX_IN_LOOP // 10 ** 4,
+                                        disable_pre_validate=True)
+            for i in range(count)
+        ]
+
+    def make_token_txs(self, count: int) -> List[dict]:
+        return [
+            self._call_tx(self._sender(i), self.token_address, "transfer",
+                          {"addr_to": str(self._create_address()), "value": hex(self._random.randint(1, 10 ** 6))})
+            for i in range(count)
+        ]
+
+    def make_stake_txs(self, count: int) -> List[dict]:
+        return [
+            self._call_tx(self._sender(i), SYSTEM_SCORE_ADDRESS, "setStake",
+                          {"value": hex(self._random.randint(100, 1000) * ICX_IN_LOOP)})
+            for i in range(count)
+        ]
+
+    def make_delegation_txs(self, count: int) -> List[dict]:
+        txs: List[dict] = []
+        for i in range(count):
+            delegates: List['Address'] = self._random.sample(self.delegates, self._random.randint(1, DELEGATES))
+            delegations: list = [
+                {"address": str(delegate), "value": hex(self._random.randint(1, 10) * ICX_IN_LOOP)}
+                for delegate in delegates
+            ]
+            txs.append(self._call_tx(self._sender(i), SYSTEM_SCORE_ADDRESS, "setDelegation",
+                                     {"delegations": delegations}))
+        return txs
+
+    def make_claim_txs(self, count: int) -> List[dict]:
+        return [self._call_tx(self._sender(i), SYSTEM_SCORE_ADDRESS, "claimIScore", {}) for i in range(count)]
+
+    def make_fee_sharing_txs(self, count: int) -> List[dict]:
+        return [
+            self._call_tx(self._sender(i), self.fee_sharing_address, "set_value",
+                          {"value": hex(self._random.randint(0, 10 ** 6)), "proportion": hex(100)})
+            for i in range(count)
+        ]
+
+    def make_deploy_txs(self, count: int) -> List[dict]:
+        return [
+            self._create_deploy_tx(self._sender(i), "install/sample_token", self._token_zip,
+                                   {"init_supply": hex(self._random.randint(1, 10 ** 6)), "decimal": hex(18)})
+            for i in range(count)
+        ]
+
+    def make_block(self) -> 'Block':
+        return Block(self._block_height + 1, create_block_hash(), create_timestamp(), self._prev_block_hash, 0)
+
+    def invoke(self, block: 'Block', tx_list: List[dict]) -> list:
+        tx_results, _, _, _ = self.icon_service_engine.invoke(block=block, tx_requests=tx_list)
+        return tx_results
+
+    def commit(self, block: 'Block'):
+        self._write_precommit_state(block)
+
+
+class Workload(object):
+    """The result of a workload run on blocks
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.txs: int = 0
+        self.failures: int = 0
+        # in seconds per block
+        self.invoke_elapsed: List[float] = []
+        self.commit_elapsed: List[float] = []
+        # in bytes per block
+        self.peak_alloc: List[int] = []
+        self.max_rss: int = 0
+
+    def to_dict(self) -> dict:
+        elapsed: float = sum(self.invoke_elapsed) + sum(self.commit_elapsed)
+        block_elapsed: List[float] = sorted(i + c for i, c in zip(self.invoke_elapsed, self.commit_elapsed))
+        return {
+            "workload": self.name,
+            "blocks": len(self.invoke_elapsed),
+            "txs": self.txs,
+            "failures": self.failures,
+            "txPerSec": self.txs / elapsed if elapsed else 0.0,
+            "blockMsP50": block_elapsed[len(block_elapsed) // 2] * 1000 if block_elapsed else 0.0,
+            "peakAllocKiB": max(self.peak_alloc, default=0) // 1024,
+            "maxRssMiB": self.max_rss // 1024
+        }
+
+
+def _run(harness: '_Harness',
+         name: str,
+         make_txs: Callable[[int], List[dict]],
+         txs: int,
+         blocks: int,
+         repeat: int) -> 'Workload':
+    workload = Workload(name)
+
+    for _ in range(blocks):
+        tx_list: List[dict] = make_txs(txs)
+
+        # Measures allocations on another block of the same height, which is not committed
+        tracemalloc.start()
+        harness.invoke(harness.make_block(), tx_list)
+        workload.peak_alloc.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        # Invokes the block on the same state repeatedly and commits the last one
+        invoke_elapsed: List[float] = []
+        for _ in range(repeat):
+            block: 'Block' = harness.make_block()
+            start: float = time.perf_counter()
+            tx_results: list = harness.invoke(block, tx_list)
+            invoke_elapsed.append(time.perf_counter() - start)
+        workload.invoke_elapsed.append(min(invoke_elapsed))
+
+        start: float = time.perf_counter()
+        harness.commit(block)
+        workload.commit_elapsed.append(time.perf_counter() - start)
+
+        workload.txs += len(tx_results)
+        workload.failures += sum(1 for tx_result in tx_results if tx_result.status != 1)
+
+    # ru_maxrss is in KiB on Linux
+    workload.max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return workload
+
+
+WORKLOADS: Dict[str, Callable[['_Harness'], Callable[[int], List[dict]]]] = {
+    "transfer": lambda harness: harness.make_transfer_txs,
+    "token": lambda harness: harness.make_token_txs,
+    "stake": lambda harness: harness.make_stake_txs,
+    "delegation": lambda harness: harness.make_delegation_txs,
+    "claim": lambda harness: harness.make_claim_txs,
+    "fee_sharing": lambda harness: harness.make_fee_sharing_txs,
+    "deploy": lambda harness: harness.make_deploy_txs
+}
+
+
+def main(args: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="workload",
+                                     description="Measure the throughput of IconServiceEngine on synthetic workloads")
+    parser.add_argument("-w", "--workloads", type=str, default=",".join(WORKLOADS),
+                        help=f"Comma separated workloads among {', '.join(WORKLOADS)}")
+    parser.add_argument("-t", "--txs", type=int, default=500,
+                        help="The number of transactions in a block (a tenth of it for deploy)")
+    parser.add_argument("-b", "--blocks", type=int, default=5, help="The number of blocks per workload")
+    parser.add_argument("-r", "--repeat", type=int, default=3,
+                        help="The number of invocations per block, the fastest one is taken")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="The seed to generate transactions")
+    parser.add_argument("-o", "--output", type=str, default=None, help="The path to write the results as json")
+    parser.add_argument("-c", "--compare", type=str, default=None,
+                        help="The path of the results written by --output to compare with")
+    args = parser.parse_args(args)
+
+    names: List[str] = args.workloads.split(",")
+    for name in names:
+        if name not in WORKLOADS:
+            parser.error(f"Unknown workload: {name}")
+
+    _Harness.seed = args.seed
+    _Harness.setUpClass()
+    harness = _Harness()
+    harness.setUp()
+
+    results: List[dict] = []
+    try:
+        print(f"{'workload':<12}{'blocks':>7}{'txs':>7}{'failed':>7}{'tx/s':>10}{'p50(ms)':>10}"
+              f"{'alloc(KiB)':>12}{'rss(MiB)':>10}")
+        for name in names:
+            txs: int = max(1, args.txs // 10) if name == "deploy" else args.txs
+            result: dict = _run(harness, name, WORKLOADS[name](harness), txs, args.blocks, args.repeat).to_dict()
+            results.append(result)
+            print(f"{name:<12}{result['blocks']:>7}{result['txs']:>7}{result['failures']:>7}"
+                  f"{result['txPerSec']:>10.1f}{result['blockMsP50']:>10.2f}"
+                  f"{result['peakAllocKiB']:>12}{result['maxRssMiB']:>10}")
+    finally:
+        harness.tearDown()
+        _Harness.tearDownClass()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"seed": args.seed, "results": results}, f, indent=2)
+
+    if args.compare:
+        _print_comparison(args.compare, results)
+
+    return 0
+
+
+def _print_comparison(path: str, results: List[dict]):
+    with open(path, "r") as f:
+        baselines: Dict[str, dict] = {result["workload"]: result for result in json.load(f)["results"]}
+
+    print()
+    print(f"{'workload':<12}{'tx/s':>10}{'baseline':>10}{'change':>9}{'alloc':>9}")
+    for result in results:
+        baseline: dict = baselines.get(result["workload"])
+        if baseline is None or not baseline["txPerSec"] or not baseline["peakAllocKiB"]:
+            continue
+
+        tps_change: float = result["txPerSec"] / baseline["txPerSec"] - 1
+        alloc_change: float = result["peakAllocKiB"] / baseline["peakAllocKiB"] - 1
+        print(f"{result['workload']:<12}{result['txPerSec']:>10.1f}{baseline['txPerSec']:>10.1f}"
+              f"{tps_change:>+9.1%}{alloc_change:>+9.1%}")
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))